@@ -0,0 +1,110 @@
+"""Throughput and peak memory of the `preprocessing` cleaners on generated dirty data.
+
+Requires `pytest-benchmark` and `psutil`. Run from the repository root:
+    pytest benchmarks/
+    pytest benchmarks/ --bench-rows=1000,1000000,10000000
+    pytest benchmarks/ --benchmark-save=baseline   # then --benchmark-compare to catch regressions
+
+Rows per second and the peak memory are reported in each benchmark's `extra_info`
+(shown with `--benchmark-json`).
+The peak memory is the highest RSS sampled while one run of the cleaner is in progress,
+minus the RSS before it, so the native allocations of polars and Arrow are included
+and the result does not depend on the benchmarks that ran before it in the process.
+"""
+
+import threading
+
+import polars as pl
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+psutil = pytest.importorskip("psutil")
+
+from do_data_utils.preprocessing import (
+    clean_citizenid,
+    clean_citizenid_series,
+    clean_email,
+    clean_email_series,
+    clean_phone,
+    clean_phone_series,
+)
+
+
+KWARGS = {"phone": {}, "email": {"delimiter": "|"}, "citizenid": {}}
+SCALAR_CLEANERS = {"phone": clean_phone, "email": clean_email, "citizenid": clean_citizenid}
+SERIES_CLEANERS = {
+    "phone": clean_phone_series,
+    "email": clean_email_series,
+    "citizenid": clean_citizenid_series,
+}
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def peak_rss_increase(func, interval: float = 0.001) -> int:
+    """Runs `func` once, and returns the highest RSS sampled during the run minus the RSS before it."""
+
+    process = psutil.Process()
+    baseline = peak = process.memory_info().rss
+    done = threading.Event()
+
+    def sample() -> None:
+        nonlocal peak
+        while not done.wait(interval):
+            peak = max(peak, process.memory_info().rss)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        func()
+    finally:
+        done.set()
+        sampler.join()
+
+    return max(peak, process.memory_info().rss) - baseline
+
+
+def run_benchmark(benchmark, func, n_rows: int) -> None:
+    # Peak memory of one run, measured outside the timed rounds since sampling slows it down
+    peak = peak_rss_increase(func)
+
+    # Large inputs take long enough that a few rounds are enough
+    rounds = 5 if n_rows <= 100_000 else 1
+    benchmark.pedantic(func, rounds=rounds, iterations=1, warmup_rounds=0)
+
+    benchmark.extra_info["rows"] = n_rows
+    benchmark.extra_info["rows_per_second"] = n_rows / benchmark.stats["mean"]
+    benchmark.extra_info["peak_memory_mb"] = peak / 2**20
+
+
+# ----------------
+# Benchmarks
+# ----------------
+
+
+@pytest.mark.parametrize("kind", ["phone", "email", "citizenid"])
+def test_scalar(benchmark, dataset, n_rows, kind):
+    values = dataset(kind, n_rows)
+    cleaner, kwargs = SCALAR_CLEANERS[kind], KWARGS[kind]
+    benchmark.group = f"{kind} {n_rows:_} rows"
+    run_benchmark(benchmark, lambda: [cleaner(v, **kwargs) for v in values], n_rows)
+
+
+@pytest.mark.parametrize("kind", ["phone", "email", "citizenid"])
+def test_vectorized(benchmark, dataset, n_rows, kind):
+    values = pl.Series(kind, dataset(kind, n_rows))
+    cleaner, kwargs = SERIES_CLEANERS[kind], KWARGS[kind]
+    benchmark.group = f"{kind} {n_rows:_} rows"
+    run_benchmark(benchmark, lambda: cleaner(values, **kwargs), n_rows)
+
+
+@pytest.mark.parametrize("kind", ["phone", "email", "citizenid"])
+def test_vectorized_unique(benchmark, dataset, n_rows, kind):
+    # Customer tables repeat values, here each distinct value shows up 10 times
+    values = pl.Series(kind, dataset(kind, max(n_rows // 10, 1)) * 10)
+    cleaner, kwargs = SERIES_CLEANERS[kind], KWARGS[kind]
+    benchmark.group = f"{kind} {n_rows:_} rows"
+    run_benchmark(benchmark, lambda: cleaner(values, unique=True, **kwargs), len(values))
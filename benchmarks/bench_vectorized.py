@@ -0,0 +1,51 @@
+"""Rows per second of the vectorized cleaners against `Series.apply()` on the scalar ones.
+
+Usage:
+    python benchmarks/bench_vectorized.py [n_rows]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from datasets import make_citizenids, make_emails, make_phones
+from do_data_utils.preprocessing import (
+    clean_citizenid,
+    clean_citizenid_series,
+    clean_email,
+    clean_email_series,
+    clean_phone,
+    clean_phone_series,
+)
+
+
+def rows_per_second(func, values: pd.Series) -> float:
+    start = time.perf_counter()
+    func(values)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main(n_rows: int) -> None:
+    cases = [
+        ("clean_phone", pd.Series(make_phones(n_rows)), clean_phone, clean_phone_series),
+        ("clean_email", pd.Series(make_emails(n_rows)), clean_email, clean_email_series),
+        (
+            "clean_citizenid",
+            pd.Series(make_citizenids(n_rows)),
+            clean_citizenid,
+            clean_citizenid_series,
+        ),
+    ]
+
+    print(f"{'cleaner':<18}{'apply rows/s':>16}{'vectorized rows/s':>20}{'speed-up':>10}")
+    for name, values, scalar_func, series_func in cases:
+        apply_rps = rows_per_second(lambda s: s.apply(scalar_func), values)
+        series_rps = rows_per_second(series_func, values)
+        print(
+            f"{name:<18}{apply_rps:>16,.0f}{series_rps:>20,.0f}{series_rps / apply_rps:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,36 @@
+import functools
+
+import pytest
+
+import datasets
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-rows",
+        default="1000",
+        help="Comma-separated numbers of rows to benchmark, e.g., 1000,1000000,10000000",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "n_rows" in metafunc.fixturenames:
+        sizes = [int(n) for n in metafunc.config.getoption("--bench-rows").split(",")]
+        metafunc.parametrize("n_rows", sizes, ids=[f"{n:_}" for n in sizes])
+
+
+@functools.lru_cache(maxsize=None)
+def _dataset(kind: str, n_rows: int) -> list[str]:
+    makers = {
+        "phone": datasets.make_phones,
+        "email": datasets.make_emails,
+        "citizenid": datasets.make_citizenids,
+    }
+    return makers[kind](n_rows, seed=0)
+
+
+@pytest.fixture
+def dataset():
+    """Returns the (cached) generated values of a kind, e.g., `dataset("phone", 1000)`."""
+
+    return _dataset
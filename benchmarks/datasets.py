@@ -0,0 +1,139 @@
+"""Seeded generators of realistic dirty data for the `preprocessing` benchmarks.
+
+The same `n` and `seed` always give the same values, so the runs are comparable across releases.
+"""
+
+import random
+
+
+_THAI_DIGITS = str.maketrans("0123456789", "๐๑๒๓๔๕๖๗๘๙")
+
+
+def _digits(rng: random.Random, k: int) -> str:
+    return "".join(rng.choices("0123456789", k=k))
+
+
+def _checksum(first_12: str) -> str:
+    return str((11 - sum((13 - i) * int(d) for i, d in enumerate(first_12)) % 11) % 10)
+
+
+# ----------------
+# Phone numbers
+# ----------------
+
+
+def _mobile(rng: random.Random) -> str:
+    return "0" + rng.choice("689") + _digits(rng, 8)
+
+
+def _landline(rng: random.Random) -> str:
+    return "0" + rng.choice("2345") + _digits(rng, 7)
+
+
+def _format_phone(rng: random.Random, number: str) -> str:
+    """Writes a phone number the way it shows up in the CRM extracts."""
+
+    style = rng.random()
+    if style < 0.30:
+        return number
+    if style < 0.45:
+        return f"{number[:3]}-{number[3:6]}-{number[6:]}"
+    if style < 0.55:
+        return f"{number[:3]} {number[3:6]} {number[6:]}"
+    if style < 0.70:
+        return f"+66 {number[1:3]} {number[3:6]} {number[6:]}"
+    if style < 0.75:
+        return "66" + number[1:]
+    if style < 0.82:
+        return f"({number[:2]}) {number[2:5]} {number[5:]}"
+    if style < 0.90:
+        # Ranges, e.g., 0812345670-9 or 0812345620-25
+        if rng.random() < 0.5:
+            return f"{number}-{rng.randint(int(number[-1]), 9)}"
+        return f"{number}-{rng.randint(int(number[-2:]), 99):02d}"
+    if style < 0.93:
+        return number.translate(_THAI_DIGITS)
+    if style < 0.96:
+        return f"{number} ต่อ {rng.randint(1, 999)}"
+    return rng.choice(["-", "n/a", "0000000000", "000-000-0000", "ไม่มี", "1234", ""])
+
+
+def make_phones(n: int, seed: int = 0) -> list[str]:
+    """Generates `n` dirty phone number strings, some with several numbers delimited by '|'."""
+
+    rng = random.Random(seed)
+    phones = []
+    for _ in range(n):
+        k = rng.choices([1, 2, 3], weights=[75, 20, 5])[0]
+        numbers = [
+            _format_phone(rng, _mobile(rng) if rng.random() < 0.7 else _landline(rng))
+            for _ in range(k)
+        ]
+        phones.append("|".join(numbers))
+    return phones
+
+
+# ----------------
+# E-mails
+# ----------------
+
+
+def _email(rng: random.Random) -> str:
+    user = rng.choice(["somchai", "nattaya", "k.wong", "anuponwa", "info", "sales_th"])
+    domain = rng.choice(["gmail.com", "hotmail.co.th", "scg.com", "outlook.com", "yahoo.com"])
+
+    style = rng.random()
+    if style < 0.55:
+        return f"{user}{rng.randint(0, 9999)}@{domain}"
+    if style < 0.65:
+        return f"{user.upper()}@{domain.upper()}"
+    if style < 0.75:
+        return f"  mailto:{user}@{domain} "
+    if style < 0.85:
+        return f"{user}@{domain.split('.')[0]}"  # No top-level domain
+    if style < 0.92:
+        return f"{user}{domain}"  # No '@'
+    return rng.choice(["-", "ไม่มีอีเมล", "n/a", "", "@", "name@.com"])
+
+
+def make_emails(n: int, seed: int = 0) -> list[str]:
+    """Generates `n` dirty e-mail strings, some with several e-mails delimited by '|'."""
+
+    rng = random.Random(seed)
+    return [
+        "|".join(_email(rng) for _ in range(rng.choices([1, 2, 3], weights=[80, 15, 5])[0]))
+        for _ in range(n)
+    ]
+
+
+# ----------------
+# Citizen IDs
+# ----------------
+
+
+def make_citizenids(n: int, seed: int = 0) -> list[str]:
+    """Generates `n` dirty 13-digit IDs, about two thirds of them legitimate."""
+
+    rng = random.Random(seed)
+    ids = []
+    for _ in range(n):
+        first_12 = rng.choice("12345678") + _digits(rng, 11)
+        id_str = first_12 + _checksum(first_12)
+
+        style = rng.random()
+        if style < 0.35:
+            pass
+        elif style < 0.55:
+            id_str = f"{id_str[0]}-{id_str[1:5]}-{id_str[5:10]}-{id_str[10:12]}-{id_str[12]}"
+        elif style < 0.65:
+            id_str = f"{id_str[0]} {id_str[1:5]} {id_str[5:10]} {id_str[10:12]} {id_str[12]}"
+        elif style < 0.70:
+            id_str = id_str.translate(_THAI_DIGITS)
+        elif style < 0.85:
+            id_str = first_12 + str((int(_checksum(first_12)) + 1) % 10)  # Wrong checksum
+        elif style < 0.95:
+            id_str = id_str[: rng.randint(5, 12)]  # Too short
+        else:
+            id_str = rng.choice(["-", "n/a", "", "x" * 13, "0" * 13])
+        ids.append(id_str)
+    return ids
@@ -9,22 +9,56 @@ from .azureutils import databricks_to_df
 from .keyvault import get_secret
 from .storage import (
     azure_storage_delete_path,
+    azure_storage_delete_paths,
+    azure_storage_iter_paths,
     azure_storage_list_files,
+    azure_storage_open,
+    azure_storage_scan,
+    azure_storage_sync,
     azure_storage_to_df,
     azure_storage_to_dict,
     azure_storage_to_file,
+    azure_storage_writer,
+    clear_azure_storage_cache,
+    clear_service_client_cache,
     df_to_azure_storage,
+    download_folder_azure,
     file_to_azure_storage,
+    set_azure_storage_cache,
+    upload_folder_azure,
+)
+from .storage_aio import (
+    azure_storage_delete_path_async,
+    azure_storage_list_files_async,
+    azure_storage_to_io_async,
+    close_async_clients,
+    io_to_azure_storage_async,
 )
 
 __all__ = [
     "databricks_to_df",
     "azure_storage_delete_path",
+    "azure_storage_delete_path_async",
+    "azure_storage_delete_paths",
+    "azure_storage_iter_paths",
     "azure_storage_list_files",
+    "azure_storage_list_files_async",
+    "azure_storage_open",
+    "azure_storage_scan",
+    "azure_storage_sync",
     "azure_storage_to_dict",
     "azure_storage_to_file",
+    "azure_storage_to_io_async",
     "azure_storage_to_df",
+    "azure_storage_writer",
+    "clear_azure_storage_cache",
+    "clear_service_client_cache",
+    "close_async_clients",
     "df_to_azure_storage",
+    "download_folder_azure",
     "file_to_azure_storage",
+    "set_azure_storage_cache",
+    "upload_folder_azure",
     "get_secret",
+    "io_to_azure_storage_async",
 ]
@@ -1,14 +1,58 @@
+import fnmatch
+import gzip
+import hashlib
 import io
+import itertools
 import json
-from typing import Optional
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Union
+from urllib.parse import quote, unquote
 
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+from azure.core import MatchConditions
 from azure.core.credentials import TokenCredential  # Base class for credentials
+from azure.core.exceptions import ResourceNotModifiedError
 from azure.identity import ClientSecretCredential, DefaultAzureCredential
 from azure.storage.filedatalake import DataLakeServiceClient
 
 
+# Process-wide caches, so that the credentials (and their tokens) and the clients' connection pools are reused
+_credential_cache: dict[tuple, TokenCredential] = {}
+_service_client_cache: dict[tuple, DataLakeServiceClient] = {}
+_cache_lock = threading.Lock()
+
+# Size of the byte ranges downloaded in parallel
+_default_chunk_size = 8 * 1024 * 1024
+
+# Read-ahead of `azure_storage_open()`, small reads (e.g., a Parquet footer) fetch this many bytes
+_default_buffer_size = 1024 * 1024
+
+# Default file size of the partitioned Parquet writes, and pyarrow's default row group size
+_default_target_file_size = 128 * 1024 * 1024
+_default_row_group_size = 1024 * 1024
+
+# Compressed file extensions, to the compression used by pandas
+_compressions = {"gz": "gzip", "zst": "zstd"}
+
+# Local download cache, set by `set_azure_storage_cache()`
+_download_cache_dir: Optional[str] = None
+_download_cache_max_size = 0
+
+# Default file name of the `azure_storage_sync()` manifest, in the local directory
+_sync_manifest_name = ".azure_sync_manifest.json"
+
+
 def get_credentials(
     secret: Optional[dict] = None,
 ) -> TokenCredential:
@@ -35,39 +79,348 @@ def get_credentials(
     return cred
 
 
-def get_service_client(
+def _get_storage_account_name(
     secret: Optional[dict] = None, storage_account_name: Optional[str] = None
+) -> str:
+    """Gets the storage account from `storage_account_name`, or else from the secret."""
+
+    if storage_account_name:
+        return storage_account_name
+
+    if secret:
+        try:
+            return secret["storage_account"]
+        except KeyError:
+            raise KeyError(
+                "The secret must contain `storage_account` key or manually pass in the `storage_account_name`."
+            )
+
+    raise ValueError("Either `secret` or `storage_account_name` must not be empty.")
+
+
+def _credential_key(secret: Optional[dict] = None) -> tuple:
+    """Gets the (tenant, client_id, client secret hash) of the secret, or (None, None, None) for the default credentials.
+
+    The client secret is part of the key, so that a rotated secret gets new credentials
+    instead of the ones cached for the old secret. Only its SHA-256 hash is kept.
+    """
+
+    if secret:
+        client_secret = secret.get("client_secret")
+        return (
+            secret.get("tenant_id"),
+            secret.get("client_id"),
+            hashlib.sha256(client_secret.encode()).hexdigest() if client_secret else None,
+        )
+    return (None, None, None)
+
+
+def _get_cached_credentials(secret: Optional[dict] = None) -> TokenCredential:
+    """Gets the credentials for the secret (or the default credentials), created once per process.
+
+    The caller must hold `_cache_lock`.
+    """
+
+    key = _credential_key(secret)
+
+    if key not in _credential_cache:
+        _credential_cache[key] = get_credentials(secret=secret)
+
+    return _credential_cache[key]
+
+
+def get_service_client(
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+    use_cache: bool = True,
 ) -> DataLakeServiceClient:
-    """Initializes and returns a DataLakeServiceClient using Azure AD credentials."""
+    """Initializes and returns a DataLakeServiceClient using Azure AD credentials.
+
+    The clients are cached per (tenant, client_id, client secret, storage account),
+    see `clear_service_client_cache()` to invalidate them.
+    """
 
     try:
-        cred = get_credentials(secret=secret)
+        storage_account_name = _get_storage_account_name(secret, storage_account_name)
 
-        if storage_account_name:
-            storage_account_name = storage_account_name
-        elif secret:
-            storage_account_name = secret["storage_account"]
-        else:
-            raise ValueError(
-                "Either `secret` or `storage_account_name` must not be empty."
+        if not use_cache:
+            return DataLakeServiceClient(
+                account_url=f"https://{storage_account_name}.dfs.core.windows.net",
+                credential=get_credentials(secret=secret),
             )
 
-        service_client = DataLakeServiceClient(
-            account_url=f"https://{storage_account_name}.dfs.core.windows.net",
-            credential=cred,
-        )
+        key = _credential_key(secret) + (storage_account_name,)
+
+        with _cache_lock:
+            if key not in _service_client_cache:
+                _service_client_cache[key] = DataLakeServiceClient(
+                    account_url=f"https://{storage_account_name}.dfs.core.windows.net",
+                    credential=_get_cached_credentials(secret),
+                )
 
-        return service_client
+            return _service_client_cache[key]
 
     except KeyError:
-        raise KeyError(
-            "The secret must contain `storage_account` key or manually pass in the `storage_account_name`."
-        )
+        raise
 
     except Exception as e:
         raise Exception(f"Error initializing storage account: {e}")
 
 
+def clear_service_client_cache() -> None:
+    """Closes and forgets the cached storage clients and credentials.
+
+    Call it after rotating a client secret, or to release the connections.
+
+    Example
+    -------
+        clear_service_client_cache()
+    """
+
+    with _cache_lock:
+        clients = list(_service_client_cache.values())
+        credentials = list(_credential_cache.values())
+        _service_client_cache.clear()
+        _credential_cache.clear()
+
+    for client in clients:
+        client.close()
+
+    for cred in credentials:
+        close = getattr(cred, "close", None)
+        if close is not None:
+            close()
+
+
+def set_azure_storage_cache(
+    cache_dir: Optional[str], max_size: int = 10 * 1024**3
+) -> None:
+    """Enables (or disables) a local on-disk cache of the files read from Azure storage.
+
+    Once enabled, `azure_storage_to_io()`, and so `azure_storage_to_df()` and `azure_storage_to_dict()`,
+    keep a copy of each file read in `cache_dir`, keyed by storage account, container and path.
+    The next reads send a conditional request with the cached ETag:
+    if the file is unchanged, it is read from the local copy without downloading it again.
+    The least recently used copies are deleted to keep the cache under `max_size` bytes.
+
+    Parameters
+    ----------
+        cache_dir (str | None): Local directory of the cache, created if needed. None disables the cache.
+
+        max_size (int): Maximum total size of the cache, in bytes. Larger files are not cached.
+            Defaults to 10 GiB.
+
+    Returns
+    -------
+        None
+
+    Example
+    -------
+        set_azure_storage_cache("/tmp/azure_cache", max_size=50 * 1024**3)
+        df = azure_storage_to_df("test_container", "reference/branches.parquet", mock_secret)  # Downloaded
+        df = azure_storage_to_df("test_container", "reference/branches.parquet", mock_secret)  # From the cache
+    """
+
+    global _download_cache_dir, _download_cache_max_size
+
+    if max_size < 1:
+        raise ValueError("`max_size` must be a positive integer.")
+
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    _download_cache_dir = cache_dir
+    _download_cache_max_size = max_size
+
+
+def clear_azure_storage_cache() -> None:
+    """Deletes all the files in the local cache set by `set_azure_storage_cache()`.
+
+    Example
+    -------
+        clear_azure_storage_cache()
+    """
+
+    if _download_cache_dir is None:
+        return
+
+    for entry in os.scandir(_download_cache_dir):
+        if entry.name.endswith(".cache"):
+            os.remove(entry.path)
+
+
+def _cache_file_path(cache_dir: str, account: str, container_name: str, file_path: str) -> str:
+    """Gets the path of the cached copy of a file."""
+
+    key = "/".join([account, container_name, file_path])
+    return os.path.join(cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".cache")
+
+
+def _read_cache_etag(cache_file: str) -> Optional[str]:
+    """Reads the ETag in the header line of a cached copy, None if there is no copy."""
+
+    try:
+        with open(cache_file, "rb") as f:
+            return json.loads(f.readline())["etag"]
+    except (FileNotFoundError, ValueError, KeyError):
+        return None
+
+
+def _evict_cache(cache_dir: str, max_size: int) -> None:
+    """Deletes the least recently used copies until the cache is under `max_size` bytes."""
+
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".cache"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # Evicted by another thread
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total_size -= size
+
+
+def _cached_download(
+    file_client, cache_file: str, max_concurrency: int
+) -> io.BytesIO:
+    """Reads a file from its cached copy if its ETag is unchanged, or else downloads it and caches it.
+
+    A cached copy is one header line with the ETag (as JSON), followed by the file content.
+    It is written to a temporary file and renamed, so a copy is never read half-written.
+    """
+
+    assert _download_cache_dir is not None
+    cache_dir, max_size = _download_cache_dir, _download_cache_max_size
+
+    etag = _read_cache_etag(cache_file)
+    try:
+        if etag is None:
+            downloader = file_client.download_file(max_concurrency=max_concurrency)
+        else:
+            downloader = file_client.download_file(
+                max_concurrency=max_concurrency,
+                etag=etag,
+                match_condition=MatchConditions.IfModified,
+            )
+
+    except ResourceNotModifiedError:
+        try:
+            with open(cache_file, "rb") as f:
+                f.readline()
+                data = f.read()
+            os.utime(cache_file)  # Most recently used
+            return io.BytesIO(data)
+
+        except FileNotFoundError:
+            # Evicted by another thread since the ETag was read
+            downloader = file_client.download_file(max_concurrency=max_concurrency)
+
+    data = downloader.readall()
+
+    header = json.dumps({"etag": downloader.properties.etag}).encode() + b"\n"
+    if len(header) + len(data) <= max_size:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        _evict_cache(cache_dir, max_size)
+
+    return io.BytesIO(data)
+
+
+def _check_transfer_options(max_concurrency: int, chunk_size: Optional[int]) -> bool:
+    """Validates the transfer options, and returns whether to transfer in chunks (in parallel)."""
+
+    if max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be a positive integer.")
+
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("`chunk_size` must be a positive integer.")
+
+    return max_concurrency > 1 or chunk_size is not None
+
+
+def _download_ranges(
+    file_client,
+    size: int,
+    etag: str,
+    write: Callable[[int, bytes], None],
+    max_concurrency: int,
+    chunk_size: Optional[int],
+) -> None:
+    """Downloads a file in byte ranges on a thread pool, passing each (offset, data) to `write`.
+
+    At most `max_concurrency` ranges are held in memory at a time.
+    Every range is pinned to `etag`, the version whose `size` was read, so a file replaced
+    during the download raises an error instead of giving a mix of two versions.
+    """
+
+    chunk_size = chunk_size or _default_chunk_size
+
+    def download_range(offset: int) -> None:
+        length = min(chunk_size, size - offset)
+        data = file_client.download_file(
+            offset=offset,
+            length=length,
+            etag=etag,
+            match_condition=MatchConditions.IfNotModified,
+        ).readall()
+        write(offset, data)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        # Consume the results, so that an error in any range is raised here
+        for _ in executor.map(download_range, range(0, size, chunk_size)):
+            pass
+
+
+def _download_into_file(
+    file_client, file, max_concurrency: int, chunk_size: Optional[int]
+) -> tuple[int, str]:
+    """Downloads a file into a local binary file object, and returns its (size, ETag).
+
+    With `max_concurrency` > 1 or a `chunk_size`, the file is downloaded in byte ranges on a thread pool,
+    since `download_file()` takes no chunk size (it is set on the client, as `max_chunk_get_size`).
+    """
+
+    if not _check_transfer_options(max_concurrency, chunk_size):
+        downloader = file_client.download_file()
+        return downloader.readinto(file), downloader.properties.etag
+
+    props = file_client.get_file_properties()
+    lock = threading.Lock()
+    file.truncate(props.size)  # Preallocate the file
+
+    def write(offset: int, data: bytes) -> None:
+        with lock:
+            file.seek(offset)
+            file.write(data)
+
+    _download_ranges(file_client, props.size, props.etag, write, max_concurrency, chunk_size)
+    return props.size, props.etag
+
+
+def _transfer_kwargs(max_concurrency: int, chunk_size: Optional[int]) -> dict:
+    """Keyword arguments for the SDK's chunked uploads, empty to keep the single-request uploads."""
+
+    if not _check_transfer_options(max_concurrency, chunk_size):
+        return {}
+    return {"max_concurrency": max_concurrency, "chunk_size": chunk_size or _default_chunk_size}
+
+
 def io_to_azure_storage(
     buffer,
     container_name: str,
@@ -75,8 +428,15 @@ def io_to_azure_storage(
     secret: Optional[dict] = None,
     overwrite: bool = True,
     storage_account_name: Optional[str] = None,
+    max_concurrency: int = 1,
+    chunk_size: Optional[int] = None,
 ) -> None:
-    """Uploads an in-memory buffer to Azure Blob Storage."""
+    """Uploads an in-memory buffer to Azure Blob Storage.
+
+    With `max_concurrency` > 1 or a `chunk_size`, the buffer is uploaded in chunks, in parallel.
+    """
+
+    transfer_kwargs = _transfer_kwargs(max_concurrency, chunk_size)
 
     service_client = get_service_client(
         secret, storage_account_name=storage_account_name
@@ -87,7 +447,7 @@ def io_to_azure_storage(
     )
 
     buffer.seek(0)  # Reset buffer position
-    file_client.upload_data(buffer, overwrite=overwrite)
+    file_client.upload_data(buffer, overwrite=overwrite, **transfer_kwargs)
 
     print(f"Uploaded to Azure Storage: {container_name}/{dest_file_path}")
 
@@ -97,8 +457,17 @@ def azure_storage_to_io(
     file_path: str,
     secret: Optional[dict] = None,
     storage_account_name: Optional[str] = None,
+    max_concurrency: int = 1,
+    chunk_size: Optional[int] = None,
 ) -> io.BytesIO:
-    """Downloads a blob into an in-memory buffer."""
+    """Downloads a blob into an in-memory buffer.
+
+    With `max_concurrency` > 1 or a `chunk_size`, the blob is downloaded in byte ranges, in parallel,
+    straight into the buffer (no intermediate copy of the whole blob).
+    With a cache set by `set_azure_storage_cache()`, an unchanged blob is read from its local copy instead.
+    """
+
+    ranged = _check_transfer_options(max_concurrency, chunk_size)
 
     service_client = get_service_client(
         secret, storage_account_name=storage_account_name
@@ -108,11 +477,39 @@ def azure_storage_to_io(
         file_system=container_name, file_path=file_path.lstrip("/")
     )
 
-    buffer = io.BytesIO()
+    if _download_cache_dir is not None:
+        cache_file = _cache_file_path(
+            _download_cache_dir,
+            _get_storage_account_name(secret, storage_account_name),
+            container_name,
+            file_path.lstrip("/"),
+        )
+        return _cached_download(file_client, cache_file, max_concurrency)
+
+    if ranged:
+        buffer = io.BytesIO()
+        props = file_client.get_file_properties()
+        size = props.size
+
+        # Grow the buffer to its final size once, then fill it in place
+        if size:
+            buffer.seek(size - 1)
+            buffer.write(b"\0")
+
+        with buffer.getbuffer() as view:
+
+            def write(offset: int, data: bytes) -> None:
+                view[offset : offset + len(data)] = data
+
+            _download_ranges(file_client, size, props.etag, write, max_concurrency, chunk_size)
+
+        buffer.seek(0)
+        return buffer
+
     blob_data = file_client.download_file()
-    buffer.write(blob_data.readall())
-    buffer.seek(0)  # Reset buffer position for reading
-    return buffer
+
+    # BytesIO shares the downloaded bytes instead of copying them (until it is written to)
+    return io.BytesIO(blob_data.readall())
 
 
 def file_to_azure_storage(
@@ -181,6 +578,8 @@ def azure_storage_to_file(
     file_path: str,
     secret: Optional[dict] = None,
     storage_account_name: Optional[str] = None,
+    max_concurrency: int = 1,
+    chunk_size: Optional[int] = None,
 ) -> None:
     """Downloads a file from Azure Blob Storage.
 
@@ -201,6 +600,12 @@ def azure_storage_to_file(
 
         storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
 
+        max_concurrency (int): Number of byte ranges downloaded in parallel. Defaults to 1.
+            If more than 1, the ranges are written straight into the local file, without holding the whole file in memory.
+
+        chunk_size (int, optional): Size of the byte ranges, in bytes. Defaults to 8 MiB in the parallel mode.
+            If set, the file is downloaded in ranges even with `max_concurrency=1`.
+
     Returns
     -------
         None
@@ -210,8 +615,12 @@ def azure_storage_to_file(
         azure_storage_to_file("test_container", "path/to/file/file.txt", mock_secret)
 
         azure_storage_to_file("test_container", "path/to/file/file.txt", storage_account_name="data_env")
+
+        azure_storage_to_file("test_container", "path/to/snapshot.parquet", mock_secret, max_concurrency=8)
     """
 
+    ranged = _check_transfer_options(max_concurrency, chunk_size)
+
     service_client = get_service_client(
         secret, storage_account_name=storage_account_name
     )
@@ -221,31 +630,113 @@ def azure_storage_to_file(
         file_path=file_path.lstrip("/"),
     )
 
-    blob_data = file_client.download_file()
-
     local_file_name = file_path.split("/")[-1]
 
+    if ranged:
+        props = file_client.get_file_properties()
+        size = props.size
+        lock = threading.Lock()
+
+        with open(local_file_name, "wb") as file:
+            file.truncate(size)  # Preallocate the file
+
+            def write(offset: int, data: bytes) -> None:
+                with lock:
+                    file.seek(offset)
+                    file.write(data)
+
+            _download_ranges(file_client, size, props.etag, write, max_concurrency, chunk_size)
+
+        print(f"Downloaded blob to local path: {local_file_name}")
+        return
+
+    blob_data = file_client.download_file()
+
     with open(local_file_name, "wb") as file:
         file.write(blob_data.readall())
 
     print(f"Downloaded blob to local path: {local_file_name}")
 
 
-def azure_storage_list_files(
+class _AzureStorageRawIO(io.RawIOBase):
+    """A read-only, seekable raw file object over an Azure storage file, each read is a ranged download.
+
+    The reads are pinned to the file's ETag at opening, so a file replaced while reading raises an error
+    instead of returning a mix of two versions.
+    """
+
+    def __init__(self, file_client, name: str):
+        props = file_client.get_file_properties()
+        self._file_client = file_client
+        self._size: int = props.size
+        self._etag = props.etag
+        self._pos = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+
+        self._pos = pos
+        return pos
+
+    def readinto(self, buffer) -> int:
+        length = min(len(buffer), self._size - self._pos)
+        if length <= 0:
+            return 0
+
+        data = self._file_client.download_file(
+            offset=self._pos,
+            length=length,
+            etag=self._etag,
+            match_condition=MatchConditions.IfNotModified,
+        ).readall()
+
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+def azure_storage_open(
     container_name: str,
-    directory_path: str,
+    file_path: str,
+    mode: str = "rb",
     secret: Optional[dict] = None,
-    files_only: bool = True,
     storage_account_name: Optional[str] = None,
-    recursive: bool = True,
-) -> list[str]:
-    """Lists all files (blobs) in an Azure Blob Storage container.
+    buffer_size: int = _default_buffer_size,
+) -> io.BufferedReader:
+    """Opens a file in Azure storage as a seekable, buffered file object, without downloading it.
+
+    Only the byte ranges that are read are downloaded, so readers that seek (e.g., `pd.read_parquet()`,
+    `pyarrow.parquet` or `pyarrow.dataset`) fetch the footer and the needed row groups/columns only.
+    polars (`pl.read_parquet()`, `pl.scan_parquet()`) reads a file object whole, so it downloads the entire file:
+    use `azure_storage_scan()` instead, whose reads are pruned to the selected columns and row groups.
 
     Parameters
     ----------
         container_name (str): Azure storage container name.
 
-        directory_path (str): Path to the directory in which you want to list the files.
+        file_path (str): Full path to file in Azure storage.
+
+        mode (str): Only "rb" (binary read) is supported. Defaults to "rb".
 
         secret (dict, optional): Secret dictionary. Defaults = None.
             Example: {
@@ -255,64 +746,180 @@ def azure_storage_list_files(
                 "storage_account": "your-storage-account"
             }
 
-        files_only (bool): Whether or not to return only the files, excluding the directories. Default is `True`
-
         storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
 
-        recursive (bool): Whether or not to search recursively in sub-folders
+        buffer_size (int): Number of bytes read ahead by each small read. Defaults to 1 MiB.
 
     Returns
     -------
-        list[str] | None
-            A list of blobs' names.
+        io.BufferedReader
 
     Example
     -------
-        azure_storage_list_files("test_container", "somepath", mock_secret)
-
-        azure_storage_list_files("test_container", "somepath", storage_account_name="data_env")
+        with azure_storage_open("test_container", "path/to/wide_table.parquet", secret=mock_secret) as f:
+            df = pd.read_parquet(f, columns=["customer_id", "phone"])
     """
 
+    if mode != "rb":
+        raise ValueError("Only the `rb` mode is supported.")
+
+    if buffer_size < 1:
+        raise ValueError("`buffer_size` must be a positive integer.")
+
     service_client = get_service_client(
         secret, storage_account_name=storage_account_name
     )
 
-    # Get the file system client
-    file_system_client = service_client.get_file_system_client(
-        file_system=container_name
+    file_client = service_client.get_file_client(
+        file_system=container_name, file_path=file_path.lstrip("/")
     )
 
-    # Normalize directory path
-    if directory_path and not directory_path.endswith("/"):
-        directory_path += "/"
+    raw = _AzureStorageRawIO(file_client, name=f"{container_name}/{file_path.lstrip('/')}")
+    return io.BufferedReader(raw, buffer_size=buffer_size)
 
-    # List paths under the specified directory or root
-    paths = file_system_client.get_paths(path=directory_path, recursive=recursive)
 
-    if files_only:
-        return [path.name for path in paths if not path.is_directory]
+class _AzureStorageRawWriter(io.RawIOBase):
+    """A write-only raw file object over an Azure storage file, written in appended chunks.
 
-    return [path.name for path in paths]
+    The chunks are appended on a thread pool to a temporary file next to the target, which is flushed
+    and renamed onto the target (`name`, as "{container}/{path}") on an explicit `close()`.
+    Leaving a `with` block with an error aborts instead, and so does a writer garbage-collected without
+    being closed: the temporary file is deleted, and the target keeps its previous content.
+    """
+
+    def __init__(
+        self, temp_file_client, name: str, overwrite: bool, max_concurrency: int, chunk_size: int
+    ):
+        temp_file_client.create_file()
+
+        self._file_client = temp_file_client
+        self._overwrite = overwrite
+        self._chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._pending: deque[Future] = deque()
+        self._max_pending = max_concurrency * 2
+        self._buffer = bytearray()
+        self._offset = 0  # Number of bytes sent to the appends
+        self.name = name
+        self.mode = "wb"
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._offset + len(self._buffer)
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        with memoryview(data) as view:
+            self._buffer += view
+            length = view.nbytes
+
+        while len(self._buffer) >= self._chunk_size:
+            self._append(bytes(self._buffer[: self._chunk_size]))
+            del self._buffer[: self._chunk_size]
+
+        return length
+
+    def _append(self, data: bytes) -> None:
+        self._pending.append(
+            self._executor.submit(
+                self._file_client.append_data, data, offset=self._offset, length=len(data)
+            )
+        )
+        self._offset += len(data)
+
+        # At most two chunks per thread are queued, and an error in any append is raised here
+        while self._pending and (
+            len(self._pending) >= self._max_pending or self._pending[0].done()
+        ):
+            self._pending.popleft().result()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        committed = False
+        try:
+            if self._buffer:
+                self._append(bytes(self._buffer))
+                self._buffer.clear()
+
+            while self._pending:
+                self._pending.popleft().result()
+
+            self._file_client.flush_data(self._offset)
+
+            # The target is replaced in one step, only once the whole file is written
+            if self._overwrite:
+                self._file_client.rename_file(self.name)
+            else:
+                self._file_client.rename_file(self.name, match_condition=MatchConditions.IfMissing)
+            committed = True
+
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            if not committed:
+                self._delete_temp_file()
+            super().close()
+
+    def abort(self) -> None:
+        """Stops the uploads and closes the file without committing the written data."""
+
+        if self.closed:
+            return
+
+        self._pending.clear()
+        self._buffer.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._delete_temp_file()
+        super().close()
+
+    def _delete_temp_file(self) -> None:
+        try:
+            self._file_client.delete_file()
+        except Exception:
+            pass  # Best effort: the error that stopped the writer matters more, and the file is hidden
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
 
+    def __del__(self) -> None:
+        # `io.IOBase.__del__` would call `close()` and commit whatever was written so far
+        if hasattr(self, "_executor"):  # Not if `create_file()` failed in `__init__`
+            self.abort()
 
-def df_to_azure_storage(
-    df: pd.DataFrame,
+
+def azure_storage_writer(
     container_name: str,
-    dest_file_path: str,
+    file_path: str,
+    mode: str = "wb",
     secret: Optional[dict] = None,
-    overwrite: bool = True,
     storage_account_name: Optional[str] = None,
-    **kwargs,
-) -> None:
-    """Uploads a dataframe to Azure Blob Storage based on file extension.
+    overwrite: bool = True,
+    max_concurrency: int = 4,
+    chunk_size: int = _default_chunk_size,
+) -> _AzureStorageRawWriter:
+    """Opens a file in Azure storage for writing, uploading it chunk by chunk as it is written.
+
+    Each `chunk_size` bytes are appended in parallel as soon as they are written, so at most
+    about `2 * max_concurrency * chunk_size` bytes are held in memory, whatever the file size.
+    The chunks go to a hidden temporary file next to `file_path`, which replaces `file_path` when the
+    writer is closed. If an error is raised in its `with` block, nothing is committed and an existing
+    file at `file_path` keeps its content.
 
     Parameters
     ----------
-        df (pd.DataFrame): Source file to be uploaded.
-
         container_name (str): Azure storage container name.
 
-        dest_file_path (str): Destination file name, including the full path.
+        file_path (str): Full path to file in Azure storage.
+
+        mode (str): Only "wb" (binary write) is supported. Defaults to "wb".
 
         secret (dict, optional): Secret dictionary. Defaults = None.
             Example: {
@@ -322,63 +929,67 @@ def df_to_azure_storage(
                 "storage_account": "your-storage-account"
             }
 
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
         overwrite (bool): Whether or not to overwrite existing file. Defaults to `True`.
+            If `False` and the file exists, closing the writer raises an error.
 
-        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+        max_concurrency (int): Number of chunks appended in parallel. Defaults to 4.
 
-        **kwargs: Other keyword arguments to the write_*() method from pd.DataFrame.
+        chunk_size (int): Number of bytes per append. Defaults to 8 MiB.
 
     Returns
     -------
-        None
+        A binary file object, to be used as a context manager.
 
     Example
     -------
-        df_to_azure_storage(
-            my_df, "test_container", "your/path/output.csv", mock_secret
-        )
-
-        df_to_azure_storage(
-            my_df, "test_container", "your/path/output.csv", secret=None, storage_account_name="data_env"
-        )
+        with azure_storage_writer("test_container", "path/to/export.csv", secret=mock_secret) as f:
+            for chunk in pd.read_sql(query, conn, chunksize=100_000):
+                chunk.to_csv(f, index=False, header=f.tell() == 0)
     """
 
-    # Determine format based on file extension
-    ext = dest_file_path.split(".")[-1]
+    if mode != "wb":
+        raise ValueError("Only the `wb` mode is supported.")
 
-    if ext == "parquet":
-        buffer: io.BytesIO = io.BytesIO()
-        df.to_parquet(buffer, index=False, **kwargs)
-    elif ext == "csv":
-        buffer = io.BytesIO(df.to_csv(index=False, **kwargs).encode("utf-8"))
-    else:
-        raise ValueError("The file must be either: `parquet` or `csv`.")
+    _check_transfer_options(max_concurrency, chunk_size)
 
-    io_to_azure_storage(
-        buffer=buffer,
-        container_name=container_name,
-        dest_file_path=dest_file_path,
-        secret=secret,
+    service_client = get_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    directory, _, file_name = file_path.lstrip("/").rpartition("/")
+    temp_file_path = f"{directory}/" if directory else ""
+    temp_file_path += f".{file_name}.{uuid.uuid4().hex}.tmp"
+
+    temp_file_client = service_client.get_file_client(
+        file_system=container_name, file_path=temp_file_path
+    )
+
+    return _AzureStorageRawWriter(
+        temp_file_client,
+        name=f"{container_name}/{file_path.lstrip('/')}",
         overwrite=overwrite,
-        storage_account_name=storage_account_name,
+        max_concurrency=max_concurrency,
+        chunk_size=chunk_size,
     )
 
 
-def azure_storage_to_df(
+def azure_storage_list_files(
     container_name: str,
-    file_path: str,
-    secret: Optional[dict],
-    polars: bool = False,
+    directory_path: str,
+    secret: Optional[dict] = None,
+    files_only: bool = True,
     storage_account_name: Optional[str] = None,
-    **kwargs,
-):
-    """Downloads a blob from Azure Blob Storage and converts it to a DataFrame.
+    recursive: bool = True,
+) -> list[str]:
+    """Lists all files (blobs) in an Azure Blob Storage container.
 
     Parameters
     ----------
         container_name (str): Azure storage container name.
 
-        file_path (str): Full path to file in Azure storage.
+        directory_path (str): Path to the directory in which you want to list the files.
 
         secret (dict, optional): Secret dictionary. Defaults = None.
             Example: {
@@ -388,21 +999,1279 @@ def azure_storage_to_df(
                 "storage_account": "your-storage-account"
             }
 
-        polars (bool): Whether or not to return a polars DataFrame. Defaults to False.
+        files_only (bool): Whether or not to return only the files, excluding the directories. Default is `True`
 
         storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
 
-        **kwargs: Other parameters to read the csv or parquet file.
+        recursive (bool): Whether or not to search recursively in sub-folders
+
+    Returns
+    -------
+        list[str] | None
+            A list of blobs' names.
+
+    Example
+    -------
+        azure_storage_list_files("test_container", "somepath", mock_secret)
+
+        azure_storage_list_files("test_container", "somepath", storage_account_name="data_env")
+    """
+
+    service_client = get_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    # Get the file system client
+    file_system_client = service_client.get_file_system_client(
+        file_system=container_name
+    )
+
+    # Normalize directory path
+    if directory_path and not directory_path.endswith("/"):
+        directory_path += "/"
+
+    # List paths under the specified directory or root
+    paths = file_system_client.get_paths(path=directory_path, recursive=recursive)
+
+    if files_only:
+        return [path.name for path in paths if not path.is_directory]
+
+    return [path.name for path in paths]
+
+
+def _print_transfer_summary(action: str, num_files: int, num_bytes: int, seconds: float) -> None:
+    """Prints the number of files and bytes transferred, and the aggregate throughput."""
+
+    rate = num_bytes / seconds if seconds > 0 else 0.0
+    print(
+        f"{action} {num_files} files ({num_bytes / 1024**2:,.1f} MiB) in {seconds:.1f}s, {rate / 1024**2:,.1f} MiB/s"
+    )
+
+
+class AzureStoragePath(NamedTuple):
+    """A path listed by `azure_storage_iter_paths()`."""
+
+    name: str
+    is_directory: bool
+    size: Optional[int]
+    last_modified: Optional[datetime]
+    etag: Optional[str]
+
+
+def _iter_paths(
+    paths: Iterable,
+    files_only: bool,
+    suffix: Optional[Union[str, tuple[str, ...]]],
+    modified_since: Optional[datetime],
+    modified_before: Optional[datetime] = None,
+) -> Iterator[AzureStoragePath]:
+    """Generator behind `azure_storage_iter_paths()`."""
+
+    for path in paths:
+        if files_only and path.is_directory:
+            continue
+
+        if suffix is not None and not path.name.endswith(suffix):
+            continue
+
+        if modified_since is not None and (
+            path.last_modified is None or path.last_modified < modified_since
+        ):
+            continue
+        if modified_before is not None and (
+            path.last_modified is None or path.last_modified >= modified_before
+        ):
+            continue
+
+        yield AzureStoragePath(
+            name=path.name,
+            is_directory=bool(path.is_directory),
+            size=path.content_length,
+            last_modified=path.last_modified,
+            etag=path.etag,
+        )
+
+
+def azure_storage_iter_paths(
+    container_name: str,
+    directory_path: str,
+    secret: Optional[dict] = None,
+    files_only: bool = True,
+    storage_account_name: Optional[str] = None,
+    recursive: bool = True,
+    max_results: int = 5000,
+    suffix: Optional[Union[str, tuple[str, ...]]] = None,
+    modified_since: Optional[datetime] = None,
+    modified_before: Optional[datetime] = None,
+) -> Iterator[AzureStoragePath]:
+    """Iterates over the paths in an Azure storage directory, with their size and last-modified time.
+
+    The paths are listed page by page, so the first ones are available before the whole directory is listed,
+    and only one page of paths is held in memory at a time.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        directory_path (str): Path to the directory in which you want to list the paths.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        files_only (bool): Whether or not to return only the files, excluding the directories. Default is `True`
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        recursive (bool): Whether or not to search recursively in sub-folders
+
+        max_results (int): Maximum number of paths per page returned by the service. Defaults to 5000.
+
+        suffix (str | tuple[str, ...], optional): Only the paths ending with (one of) this suffix. Defaults to None.
+
+        modified_since (datetime, optional): Only the paths modified at or after this time.
+            A naive datetime is taken as UTC. Defaults to None.
+
+        modified_before (datetime, optional): Only the paths modified before this time.
+            A naive datetime is taken as UTC. Defaults to None.
+
+    Returns
+    -------
+        Iterator[AzureStoragePath]
+            Records with the `name`, `is_directory`, `size`, `last_modified` and `etag` of each path.
+
+    Example
+    -------
+        for path in azure_storage_iter_paths("test_container", "landing", mock_secret, suffix=".parquet"):
+            print(path.name, path.size)
+
+        recent = azure_storage_iter_paths(
+            "test_container", "landing", mock_secret, modified_since=datetime(2024, 1, 1)
+        )
+    """
+
+    if max_results < 1:
+        raise ValueError("`max_results` must be a positive integer.")
+
+    if modified_since is not None and modified_since.tzinfo is None:
+        modified_since = modified_since.replace(tzinfo=timezone.utc)
+
+    if modified_before is not None and modified_before.tzinfo is None:
+        modified_before = modified_before.replace(tzinfo=timezone.utc)
+
+    service_client = get_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    file_system_client = service_client.get_file_system_client(
+        file_system=container_name
+    )
+
+    # Normalize directory path
+    if directory_path and not directory_path.endswith("/"):
+        directory_path += "/"
+
+    # The pages are requested lazily, as the iteration reaches them
+    paths = file_system_client.get_paths(
+        path=directory_path, recursive=recursive, max_results=max_results
+    )
+
+    return _iter_paths(paths, files_only, suffix, modified_since, modified_before)
+
+
+def download_folder_azure(
+    container_name: str,
+    directory_path: str,
+    local_dir: str,
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+    max_workers: int = 16,
+    max_concurrency: int = 1,
+    chunk_size: Optional[int] = None,
+) -> None:
+    """Downloads an entire Azure storage directory, recursively, to a local directory.
+
+    The files are downloaded on a thread pool of `max_workers` threads, and the aggregate throughput is printed.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        directory_path (str): Path to the directory in Azure storage.
+
+        local_dir (str): Local directory to save the files to. It can either exist or not.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        max_workers (int): Number of files downloaded in parallel. Defaults to 16.
+
+        max_concurrency (int): Number of byte ranges of each file downloaded in parallel. Defaults to 1.
+
+        chunk_size (int, optional): Number of bytes per range. Defaults to None (8 MiB if chunked).
+
+    Returns
+    -------
+        None
+
+    Example
+    -------
+        download_folder_azure("test_container", "models/churn/v3", "./artifacts", mock_secret)
+    """
+
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be a positive integer.")
+
+    _check_transfer_options(max_concurrency, chunk_size)
+
+    prefix = directory_path.strip("/")
+    prefix = f"{prefix}/" if prefix else ""
+
+    file_paths = azure_storage_list_files(
+        container_name, prefix, secret, storage_account_name=storage_account_name
+    )
+
+    service_client = get_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    def download(file_path: str) -> int:
+        local_file_path = os.path.join(local_dir, *file_path[len(prefix) :].split("/"))
+        os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+
+        file_client = service_client.get_file_client(
+            file_system=container_name, file_path=file_path
+        )
+
+        with open(local_file_path, "wb") as file:
+            num_bytes, _ = _download_into_file(file_client, file, max_concurrency, chunk_size)
+        return num_bytes
+
+    start = time.perf_counter()
+    os.makedirs(local_dir, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        num_bytes = sum(executor.map(download, file_paths))
+
+    _print_transfer_summary(
+        f"Downloaded {container_name}/{prefix} to {local_dir}:",
+        len(file_paths),
+        num_bytes,
+        time.perf_counter() - start,
+    )
+
+
+def upload_folder_azure(
+    local_dir: str,
+    container_name: str,
+    directory_path: str,
+    secret: Optional[dict] = None,
+    overwrite: bool = True,
+    storage_account_name: Optional[str] = None,
+    max_workers: int = 16,
+    max_concurrency: int = 1,
+    chunk_size: Optional[int] = None,
+) -> None:
+    """Uploads an entire local directory, recursively, to an Azure storage directory.
+
+    The files are uploaded on a thread pool of `max_workers` threads, and the aggregate throughput is printed.
+
+    Parameters
+    ----------
+        local_dir (str): Local directory to upload.
+
+        container_name (str): Azure storage container name.
+
+        directory_path (str): Path to the directory in Azure storage to upload to.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        overwrite (bool): Whether or not to overwrite existing files. Defaults to `True`.
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        max_workers (int): Number of files uploaded in parallel. Defaults to 16.
+
+        max_concurrency (int): Number of chunks of each file uploaded in parallel. Defaults to 1.
+
+        chunk_size (int, optional): Number of bytes per chunk. Defaults to None (8 MiB if chunked).
+
+    Returns
+    -------
+        None
+
+    Example
+    -------
+        upload_folder_azure("./artifacts", "test_container", "models/churn/v3", mock_secret)
+    """
+
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be a positive integer.")
+
+    transfer_kwargs = _transfer_kwargs(max_concurrency, chunk_size)
+
+    prefix = directory_path.strip("/")
+    prefix = f"{prefix}/" if prefix else ""
+
+    local_file_paths = [
+        os.path.join(root, file) for root, _, files in os.walk(local_dir) for file in files
+    ]
+
+    service_client = get_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    def upload(local_file_path: str) -> int:
+        relative_path = os.path.relpath(local_file_path, local_dir).replace(os.sep, "/")
+
+        file_client = service_client.get_file_client(
+            file_system=container_name, file_path=prefix + relative_path
+        )
+
+        with open(local_file_path, "rb") as file:
+            file_client.upload_data(file, overwrite=overwrite, **transfer_kwargs)
+
+        return os.path.getsize(local_file_path)
+
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        num_bytes = sum(executor.map(upload, local_file_paths))
+
+    _print_transfer_summary(
+        f"Uploaded {local_dir} to {container_name}/{prefix}:",
+        len(local_file_paths),
+        num_bytes,
+        time.perf_counter() - start,
+    )
+
+
+def _normalize_etag(etag: Optional[str]) -> Optional[str]:
+    """Strips the quotes of an ETag: they are in the HTTP headers, but not in the listing of `get_paths()`."""
+
+    return etag.strip('"') if etag else etag
+
+
+def _list_remote_files(file_system_client, prefix: str) -> dict[str, dict]:
+    """Lists the files under `prefix` in one listing, as relative path to ETag, size and last-modified time."""
+
+    return {
+        path.name[len(prefix) :]: {
+            "etag": _normalize_etag(path.etag),
+            "size": path.content_length,
+            "last_modified": path.last_modified.isoformat() if path.last_modified else None,
+        }
+        for path in file_system_client.get_paths(path=prefix, recursive=True)
+        if not path.is_directory
+    }
+
+
+def _local_stat(local_file_path: str) -> Optional[dict]:
+    """Gets the size and modification time of a local file, None if it does not exist."""
+
+    try:
+        stat = os.stat(local_file_path)
+    except FileNotFoundError:
+        return None
+    return {"local_size": stat.st_size, "local_mtime_ns": stat.st_mtime_ns}
+
+
+def _is_synced(entry: Optional[dict], local: Optional[dict], remote: Optional[dict]) -> bool:
+    """Whether both the local and the remote file are unchanged since they were recorded in the manifest."""
+
+    if entry is None or local is None or remote is None:
+        return False
+
+    return (
+        _normalize_etag(entry["etag"]) == _normalize_etag(remote["etag"])
+        and entry["local_size"] == local["local_size"]
+        and entry["local_mtime_ns"] == local["local_mtime_ns"]
+    )
+
+
+def azure_storage_sync(
+    container_name: str,
+    directory_path: str,
+    local_dir: str,
+    direction: str = "download",
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+    manifest_path: Optional[str] = None,
+    max_workers: int = 16,
+    max_concurrency: int = 1,
+    chunk_size: Optional[int] = None,
+) -> list[str]:
+    """Synchronizes a local directory with an Azure storage directory, transferring only new or changed files.
+
+    The remote ETags come from one listing of the directory, and are compared with a local manifest recording,
+    for each file synced, its remote ETag and its local size and modification time.
+    A file is skipped if neither the remote nor the local file changed since its last sync.
+    Files are never deleted on either side.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        directory_path (str): Path to the directory in Azure storage.
+
+        local_dir (str): Local directory. It can either exist or not.
+
+        direction (str): "download" (Azure storage to local) or "upload" (local to Azure storage).
+            Defaults to "download".
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        manifest_path (str, optional): Path to the JSON manifest.
+            Defaults to None ('.azure_sync_manifest.json' in `local_dir`, never uploaded).
+
+        max_workers (int): Number of files transferred in parallel. Defaults to 16.
+
+        max_concurrency (int): Number of chunks of each file transferred in parallel. Defaults to 1.
+
+        chunk_size (int, optional): Number of bytes per chunk. Defaults to None (8 MiB if chunked).
+
+    Returns
+    -------
+        list[str]
+            The paths, relative to the directories, of the files transferred.
+
+    Example
+    -------
+        azure_storage_sync("test_container", "models/churn", "./models/churn", secret=mock_secret)
+
+        azure_storage_sync("test_container", "exports/daily", "./exports", direction="upload", secret=mock_secret)
+    """
+
+    if direction not in ("download", "upload"):
+        raise ValueError("`direction` must be either: `download` or `upload`.")
+
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be a positive integer.")
+
+    upload_kwargs = _transfer_kwargs(max_concurrency, chunk_size)
+
+    prefix = directory_path.strip("/")
+    prefix = f"{prefix}/" if prefix else ""
+
+    manifest_path = manifest_path or os.path.join(local_dir, _sync_manifest_name)
+    manifest: dict[str, dict] = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+
+    service_client = get_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+    remote_files = _list_remote_files(
+        service_client.get_file_system_client(file_system=container_name), prefix
+    )
+
+    def local_path(relative_path: str) -> str:
+        return os.path.join(local_dir, *relative_path.split("/"))
+
+    def download(relative_path: str) -> dict:
+        local_file_path = local_path(relative_path)
+        os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+
+        file_client = service_client.get_file_client(
+            file_system=container_name, file_path=prefix + relative_path
+        )
+
+        with open(local_file_path, "wb") as file:
+            _, etag = _download_into_file(file_client, file, max_concurrency, chunk_size)
+
+        # The ETag of the version downloaded, in case the file changed after the listing
+        return {**remote_files[relative_path], "etag": _normalize_etag(etag)}
+
+    def upload(relative_path: str) -> dict:
+        file_client = service_client.get_file_client(
+            file_system=container_name, file_path=prefix + relative_path
+        )
+
+        with open(local_path(relative_path), "rb") as file:
+            response = file_client.upload_data(file, overwrite=True, **upload_kwargs)
+
+        last_modified = response.get("last_modified")
+        return {
+            "etag": _normalize_etag(response["etag"]),
+            "size": os.path.getsize(local_path(relative_path)),
+            "last_modified": last_modified.isoformat() if last_modified else None,
+        }
+
+    if direction == "download":
+        relative_paths = list(remote_files)
+        transfer = download
+    else:
+        manifest_file = os.path.abspath(manifest_path)
+        relative_paths = [
+            os.path.relpath(os.path.join(root, file), local_dir).replace(os.sep, "/")
+            for root, _, files in os.walk(local_dir)
+            for file in files
+            if os.path.abspath(os.path.join(root, file)) != manifest_file
+        ]
+        transfer = upload
+
+    to_transfer = [
+        relative_path
+        for relative_path in relative_paths
+        if not _is_synced(
+            manifest.get(relative_path),
+            _local_stat(local_path(relative_path)),
+            remote_files.get(relative_path),
+        )
+    ]
+
+    start = time.perf_counter()
+    num_bytes = 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for relative_path, entry in zip(to_transfer, executor.map(transfer, to_transfer)):
+                local = _local_stat(local_path(relative_path))
+                assert local is not None
+                manifest[relative_path] = {**entry, **local}
+                num_bytes += local["local_size"]
+
+    finally:
+        # Record the files transferred so far, even if one of them failed
+        os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+
+    _print_transfer_summary(
+        f"Synced {container_name}/{prefix} and {local_dir} ({direction}), "
+        f"skipped {len(relative_paths) - len(to_transfer)} unchanged files, transferred",
+        len(to_transfer),
+        num_bytes,
+        time.perf_counter() - start,
+    )
+
+    return to_transfer
+
+
+_hive_default_partition = "__HIVE_DEFAULT_PARTITION__"
+
+
+def _hive_value(value) -> str:
+    """Formats a partition value for a 'column=value' directory name."""
+
+    if value is None or pd.isna(value):
+        return _hive_default_partition
+    return quote(str(value), safe="")
+
+
+def _iter_parquet_parts(
+    table: pa.Table, row_group_size: int, target_file_size: int, **kwargs
+) -> Iterator[io.BytesIO]:
+    """Writes an Arrow table as Parquet files of about `target_file_size` bytes, one file at a time.
+
+    The row groups are written to the current file until it reaches `target_file_size`,
+    so a file can be larger by up to one row group.
+    """
+
+    buffer = io.BytesIO()
+    writer = None
+
+    for offset in range(0, max(table.num_rows, 1), row_group_size):
+        if writer is None:
+            writer = pq.ParquetWriter(buffer, table.schema, **kwargs)
+
+        writer.write_table(
+            table.slice(offset, row_group_size), row_group_size=row_group_size
+        )
+
+        if buffer.tell() >= target_file_size:
+            writer.close()
+            yield buffer
+            buffer, writer = io.BytesIO(), None
+
+    if writer is not None:
+        writer.close()
+        yield buffer
+
+
+def _write_dataset(
+    df: Union[pd.DataFrame, pl.DataFrame],
+    partition_cols: list[str],
+    target_file_size: int,
+    row_group_size: int,
+    upload: Callable[[io.BytesIO, str], None],
+    **kwargs,
+) -> None:
+    """Writes a dataframe as a Hive-partitioned Parquet dataset, uploading each file once it is written."""
+
+    missing = [col for col in partition_cols if col not in df.columns]
+    if missing:
+        raise KeyError(f"Partition columns not found: {', '.join(missing)}.")
+
+    tables: Iterator[tuple[str, pa.Table]]
+    if partition_cols:
+        # Each partition is copied out of the dataframe only when it is written, one at a time
+        groups: Iterator[tuple[tuple, pa.Table]]
+        if isinstance(df, pl.DataFrame):
+            groups = (
+                (keys, part.drop(partition_cols).to_arrow())
+                for keys, part in df.group_by(partition_cols, maintain_order=True)
+            )
+        else:
+            indices = df.groupby(partition_cols, dropna=False, observed=True, sort=False).indices
+            groups = (
+                (
+                    keys if isinstance(keys, tuple) else (keys,),
+                    pa.Table.from_pandas(df.take(idx).drop(columns=partition_cols), preserve_index=False),
+                )
+                for keys, idx in indices.items()
+            )
+        tables = (
+            (
+                "/".join(f"{col}={_hive_value(value)}" for col, value in zip(partition_cols, keys)),
+                table,
+            )
+            for keys, table in groups
+        )
+    elif isinstance(df, pl.DataFrame):
+        tables = iter([("", df.to_arrow())])
+    else:
+        tables = iter([("", pa.Table.from_pandas(df, preserve_index=False))])
+
+    for partition_dir, table in tables:
+        prefix = f"{partition_dir}/" if partition_dir else ""
+        for i, buffer in enumerate(
+            _iter_parquet_parts(table, row_group_size, target_file_size, **kwargs)
+        ):
+            upload(buffer, f"{prefix}part-{i:05d}.parquet")
+
+
+def _write_df(
+    df: Union[pd.DataFrame, pl.DataFrame],
+    file,
+    ext: str,
+    row_group_size: Optional[int],
+    compression: Optional[str] = None,
+    **kwargs,
+) -> None:
+    """Writes a dataframe to a binary file object, as Parquet or (possibly compressed) CSV."""
+
+    if ext == "parquet":
+        if isinstance(df, pl.DataFrame):
+            df.write_parquet(file, row_group_size=row_group_size, **kwargs)
+        else:
+            if row_group_size is not None:
+                kwargs["row_group_size"] = row_group_size
+            df.to_parquet(file, index=False, **kwargs)
+    elif isinstance(df, pl.DataFrame):
+        # The CSV is compressed as it is written, never held uncompressed in memory
+        stream = _open_compressed(file, compression)
+        try:
+            df.write_csv(stream, **kwargs)
+        finally:
+            if stream is not file:
+                stream.close()
+    else:
+        if compression == "zstd":
+            _zstandard()  # The same error as the other `.zst` paths, not pandas' own
+        df.to_csv(file, index=False, compression=compression, **kwargs)
+
+
+def df_to_azure_storage(
+    df: Union[pd.DataFrame, pl.DataFrame],
+    container_name: str,
+    dest_file_path: str,
+    secret: Optional[dict] = None,
+    overwrite: bool = True,
+    storage_account_name: Optional[str] = None,
+    partition_cols: Optional[list[str]] = None,
+    target_file_size: int = _default_target_file_size,
+    row_group_size: Optional[int] = None,
+    max_concurrency: int = 1,
+    chunk_size: Optional[int] = None,
+    **kwargs,
+) -> None:
+    """Uploads a dataframe to Azure Blob Storage based on file extension.
+
+    The file extension can be '.parquet', '.csv', '.csv.gz' or '.csv.zst' (compressed as it is written).
+    If `dest_file_path` ends with '/' or `partition_cols` is given, the dataframe is written as a Parquet dataset
+    in that directory instead: one 'column=value' subdirectory per partition, and 'part-00000.parquet', ...
+    files of about `target_file_size` bytes. Each file is uploaded as soon as it is written,
+    so only one file is held in memory at a time. Existing files in the directory are not deleted.
+
+    Parameters
+    ----------
+        df (pd.DataFrame | pl.DataFrame): Source dataframe to be uploaded.
+
+        container_name (str): Azure storage container name.
+
+        dest_file_path (str): Destination file name, including the full path, or destination directory of the dataset.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        overwrite (bool): Whether or not to overwrite existing file. Defaults to `True`.
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        partition_cols (list[str], optional): Columns to partition the dataset by. They are stored in the
+            directory names, not in the files, and `azure_storage_to_df()` adds them back when reading the directory.
+            Defaults to None.
+
+        target_file_size (int): Approximate size of each file of the dataset, in bytes. A file can be larger
+            by up to one row group. Defaults to 128 MiB.
+
+        row_group_size (int, optional): Maximum number of rows per Parquet row group.
+            Defaults to None (1,048,576 rows, pyarrow's default).
+
+        max_concurrency (int): Number of chunks uploaded in parallel. Defaults to 1.
+
+        chunk_size (int, optional): Number of bytes per uploaded chunk. Defaults to None (8 MiB if chunked).
+            With `max_concurrency` > 1 or a `chunk_size`, a single file is streamed to Azure storage
+            with `azure_storage_writer()` as it is serialized, instead of being serialized in memory first.
+
+        **kwargs: Other keyword arguments to the write_*() method of the dataframe,
+            or to `pyarrow.parquet.ParquetWriter` for a dataset (e.g., `compression="zstd"`).
+
+    Returns
+    -------
+        None
+
+    Example
+    -------
+        df_to_azure_storage(
+            my_df, "test_container", "your/path/output.csv", mock_secret
+        )
+
+        df_to_azure_storage(
+            my_df, "test_container", "your/path/output.csv", secret=None, storage_account_name="data_env"
+        )
+
+        df_to_azure_storage(
+            my_df, "test_container", "your/path/sales/", mock_secret, partition_cols=["year", "month"]
+        )
+    """
+
+    def upload(buffer: io.BytesIO, file_path: str) -> None:
+        io_to_azure_storage(
+            buffer=buffer,
+            container_name=container_name,
+            dest_file_path=file_path,
+            secret=secret,
+            overwrite=overwrite,
+            storage_account_name=storage_account_name,
+            max_concurrency=max_concurrency,
+            chunk_size=chunk_size,
+        )
+
+    chunked = _check_transfer_options(max_concurrency, chunk_size)
+
+    if row_group_size is not None and row_group_size < 1:
+        raise ValueError("`row_group_size` must be a positive integer.")
+
+    if partition_cols or dest_file_path.endswith("/"):
+        if target_file_size < 1:
+            raise ValueError("`target_file_size` must be a positive integer.")
+
+        directory = dest_file_path.rstrip("/")
+        _write_dataset(
+            df,
+            partition_cols or [],
+            target_file_size,
+            row_group_size or _default_row_group_size,
+            lambda buffer, file_path: upload(buffer, f"{directory}/{file_path}"),
+            **kwargs,
+        )
+        return
+
+    # Determine format based on file extension
+    if not _is_data_file(dest_file_path):
+        raise ValueError("The file must be either: `parquet` or `csv` (or `csv.gz`, `csv.zst`).")
+
+    ext, compression = _split_ext(dest_file_path)
+
+    if not chunked:
+        buffer = io.BytesIO()
+        _write_df(df, buffer, ext, row_group_size, compression, **kwargs)
+        upload(buffer, dest_file_path)
+        return
+
+    with azure_storage_writer(
+        container_name,
+        dest_file_path,
+        secret=secret,
+        storage_account_name=storage_account_name,
+        overwrite=overwrite,
+        max_concurrency=max_concurrency,
+        chunk_size=chunk_size or _default_chunk_size,
+    ) as file:
+        _write_df(df, file, ext, row_group_size, compression, **kwargs)
+
+    print(f"Uploaded to Azure Storage: {container_name}/{dest_file_path}")
+
+
+def _split_ext(file_path: str) -> tuple[str, Optional[str]]:
+    """Gets the file format and the compression (or None) from the extensions, e.g., 'csv' and 'gzip' for '.csv.gz'."""
+
+    parts = file_path.split(".")
+    if len(parts) > 2 and parts[-1] in _compressions:
+        return parts[-2], _compressions[parts[-1]]
+    return parts[-1], None
+
+
+def _is_data_file(file_path: str) -> bool:
+    """Whether the file can be read as a DataFrame: parquet, or csv (possibly compressed)."""
+
+    file_format, compression = _split_ext(file_path)
+    return file_format == "csv" or (file_format == "parquet" and compression is None)
+
+
+def _zstandard():
+    """Imports the optional `zstandard` package, needed for the '.zst' files only."""
+
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "The `.zst` files require `zstandard`, install it with: pip install 'do-data-utils[zstd]'"
+        )
+    return zstandard
+
+
+def _open_decompressed(buffer, compression: Optional[str]):
+    """Wraps a binary file object to read its decompressed content, as a stream."""
+
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=buffer, mode="rb")
+    if compression == "zstd":
+        return _zstandard().ZstdDecompressor().stream_reader(buffer)
+    return buffer
+
+
+def _open_compressed(file, compression: Optional[str]):
+    """Wraps a binary file object to compress what is written to it, as a stream.
+
+    Closing the returned object finishes the compressed stream, without closing `file`.
+    """
+
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=file, mode="wb")
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().stream_writer(file, closefd=False)
+    return file
+
+
+def _read_csv(buffer, compression: Optional[str], polars: bool, **kwargs):
+    """Reads a (possibly compressed) CSV buffer.
+
+    polars detects and decompresses gzip/zstd by itself, pandas decompresses it as a stream.
+    """
+
+    if polars:
+        return pl.read_csv(buffer, **kwargs)
+    return pd.read_csv(buffer, compression=compression, **kwargs)
+
+
+def _is_glob(path: str) -> bool:
+    """Checks whether a path has glob wildcards, e.g., `sales/2024-*/*.parquet`."""
+
+    return any(c in path for c in "*?[")
+
+
+def _glob_match(path_parts: list[str], pattern_parts: list[str]) -> bool:
+    """Matches a path against a glob pattern, segment by segment.
+
+    `*`, `?` and `[...]` do not match across '/', and a `**` segment matches any number of directories.
+    """
+
+    if not pattern_parts:
+        return not path_parts
+
+    if pattern_parts[0] == "**":
+        return any(
+            _glob_match(path_parts[i:], pattern_parts[1:])
+            for i in range(len(path_parts) + 1)
+        )
+
+    return (
+        bool(path_parts)
+        and fnmatch.fnmatchcase(path_parts[0], pattern_parts[0])
+        and _glob_match(path_parts[1:], pattern_parts[1:])
+    )
+
+
+def _list_data_files(
+    container_name: str,
+    file_path: str,
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+) -> list[str]:
+    """Lists the csv and parquet files under a directory (ending with '/') or matching a glob pattern."""
+
+    path = file_path.lstrip("/")
+
+    if _is_glob(path):
+        pattern_parts = path.split("/")
+        # Only list the deepest directory without wildcards
+        fixed_parts = list(itertools.takewhile(lambda part: not _is_glob(part), pattern_parts))
+        directory_path = "/".join(fixed_parts)
+        recursive = len(pattern_parts) - len(fixed_parts) > 1 or "**" in pattern_parts
+    else:
+        directory_path = path
+        recursive = True
+
+    files = azure_storage_list_files(
+        container_name,
+        directory_path,
+        secret=secret,
+        storage_account_name=storage_account_name,
+        recursive=recursive,
+    )
+
+    if _is_glob(path):
+        files = [f for f in files if _glob_match(f.split("/"), pattern_parts)]
+
+    files = sorted(f for f in files if _is_data_file(f))
+
+    if not files:
+        raise ValueError(f"No `parquet` or `csv` files found in: {container_name}/{file_path}")
+
+    return files
+
+
+def _hive_partitions(files: list[str], base_dir: str) -> dict[str, pa.Array]:
+    """Parses the 'column=value' directories of the files below `base_dir`, as one value per file for each column.
+
+    A column is read as integers if all its values are integers, as strings otherwise.
+    """
+
+    prefix = f"{base_dir.strip('/')}/" if base_dir.strip("/") else ""
+    values: dict[str, list[Optional[str]]] = {}
+
+    for i, file in enumerate(files):
+        for segment in file[len(prefix) :].split("/")[:-1]:
+            col, sep, value = segment.partition("=")
+            if sep and col:
+                values.setdefault(col, [None] * len(files))[i] = (
+                    None if value == _hive_default_partition else unquote(value)
+                )
+
+    partitions = {}
+    for col, col_values in values.items():
+        if all(value is None or re.fullmatch(r"-?[0-9]+", value) for value in col_values):
+            partitions[col] = pa.array(
+                [None if value is None else int(value) for value in col_values], type=pa.int64()
+            )
+        else:
+            partitions[col] = pa.array(col_values, type=pa.string())
+
+    return partitions
+
+
+def _add_partition_columns(part, partitions: dict[str, pa.Scalar], columns: Optional[list[str]]):
+    """Adds the partition values of a part file as constant columns, unless the file has them or they are not selected."""
+
+    for col, value in partitions.items():
+        if col in part.columns or (columns is not None and col not in columns):
+            continue
+
+        num_rows = part.num_rows if isinstance(part, pa.Table) else len(part)
+        array = pa.repeat(value, num_rows)
+
+        if isinstance(part, pa.Table):
+            part = part.append_column(col, array)
+        elif isinstance(part, pl.DataFrame):
+            part = part.with_columns(pl.Series(col, array))
+        else:
+            part[col] = array.to_numpy(zero_copy_only=False)
+
+    return part
+
+
+def _read_parts(
+    container_name: str,
+    files: list[str],
+    secret: Optional[dict],
+    polars: bool,
+    storage_account_name: Optional[str],
+    max_workers: int,
+    base_dir: str = "",
+    **kwargs,
+):
+    """Downloads and reads part files concurrently, then concatenates them into one DataFrame, in the order of `files`.
+
+    The 'column=value' directories below `base_dir` (e.g., written with `partition_cols`) are added as columns.
+    pandas reads the parquet parts as Arrow tables, so each run of consecutive parquet parts is converted to pandas once.
+    """
+
+    partitions = _hive_partitions(files, base_dir)
+
+    def read_part(i: int, file_path: str):
+        buffer = azure_storage_to_io(
+            container_name=container_name,
+            file_path=file_path,
+            secret=secret,
+            storage_account_name=storage_account_name,
+        )
+
+        file_format, compression = _split_ext(file_path)
+
+        if file_format == "parquet":
+            if polars:
+                part = pl.read_parquet(buffer, **kwargs)
+            else:
+                part = pq.read_table(buffer, **kwargs)
+        else:
+            part = _read_csv(buffer, compression, polars, **kwargs)
+
+        return _add_partition_columns(
+            part, {col: values[i] for col, values in partitions.items()}, kwargs.get("columns")
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parts = list(executor.map(read_part, range(len(files)), files))
+
+    if polars:
+        return pl.concat(parts, rechunk=False)
+
+    frames: list[pd.DataFrame] = []
+    for is_table, group in itertools.groupby(parts, key=lambda part: isinstance(part, pa.Table)):
+        if is_table:
+            frames.append(pa.concat_tables(list(group)).to_pandas())
+        else:
+            frames.extend(group)
+
+    if len(frames) == 1:
+        return frames[0]
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def _polars_storage_options(
+    secret: Optional[dict] = None, storage_account_name: Optional[str] = None
+) -> dict:
+    """Builds the `storage_options` for polars' cloud readers.
+
+    With a secret, polars authenticates (and refreshes its token) with the service principal itself.
+    Otherwise, it gets a bearer token of the default credentials, valid for about an hour.
+    """
+
+    storage_options = {
+        "account_name": _get_storage_account_name(secret, storage_account_name)
+    }
+
+    if secret:
+        try:
+            storage_options.update(
+                tenant_id=secret["tenant_id"],
+                client_id=secret["client_id"],
+                client_secret=secret["client_secret"],
+            )
+        except KeyError:
+            raise KeyError(
+                "The secret must contain `tenant_id`, `client_id` and `client_secret` keys."
+            )
+
+    else:
+        with _cache_lock:
+            cred = _get_cached_credentials(secret)
+        storage_options["bearer_token"] = cred.get_token(
+            "https://storage.azure.com/.default"
+        ).token
+
+    return storage_options
+
+
+def azure_storage_scan(
+    container_name: str,
+    file_path: str,
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+    file_format: Optional[str] = None,
+    **kwargs,
+) -> pl.LazyFrame:
+    """Scans a csv or parquet file in Azure storage lazily, into a polars LazyFrame.
+
+    Nothing is downloaded until the LazyFrame is collected, and then only what the query needs:
+    for parquet, the filters and the selected columns decide which row groups and columns are fetched.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        file_path (str): Full path to file in Azure storage.
+            It can also be a glob pattern, e.g., `"sales/2024-*/*.parquet"`,
+            or a directory ending with '/', e.g., `"sales/"`, to scan all its files of `file_format`.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        file_format (str, optional): Either "parquet" or "csv". Defaults to the extension of `file_path`.
+            Required for a directory.
+
+        **kwargs: Other parameters to `pl.scan_parquet()` or `pl.scan_csv()`.
+
+    Returns
+    -------
+        pl.LazyFrame
+
+    Example
+    -------
+        lf = azure_storage_scan("test_container", "path/to/events.parquet", mock_secret)
+        df = lf.filter(pl.col("date") >= date(2024, 12, 1)).select("customer_id", "amount").collect()
+    """
+
+    path = file_path.lstrip("/")
+
+    if file_format is None:
+        file_format = path.split(".")[-1] if not path.endswith("/") else None
+
+    if file_format not in ("parquet", "csv"):
+        raise ValueError("The file must be either: `parquet` or `csv`.")
+
+    if path.endswith("/"):
+        path += f"**/*.{file_format}"
+
+    storage_options = _polars_storage_options(secret, storage_account_name)
+    storage_options.update(kwargs.pop("storage_options", None) or {})
+
+    source = f"abfss://{container_name}@{storage_options['account_name']}.dfs.core.windows.net/{path}"
+
+    if file_format == "parquet":
+        return pl.scan_parquet(source, storage_options=storage_options, **kwargs)
+
+    return pl.scan_csv(source, storage_options=storage_options, **kwargs)
+
+
+def azure_storage_to_df(
+    container_name: str,
+    file_path: str,
+    secret: Optional[dict],
+    polars: bool = False,
+    storage_account_name: Optional[str] = None,
+    max_workers: int = 8,
+    lazy: bool = False,
+    **kwargs,
+):
+    """Downloads a blob from Azure Blob Storage and converts it to a DataFrame.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        file_path (str): Full path to file in Azure storage, ending with '.parquet', '.csv', '.csv.gz' or '.csv.zst'.
+            It can also be a directory ending with '/', e.g., `"sales/2024/"`, to read all its csv and parquet files,
+            or a glob pattern, e.g., `"sales/2024-*/part-*.parquet"` (`**` matches any number of directories).
+            The files are read concurrently and concatenated in the order of their paths.
+            The 'column=value' directories below the directory (e.g., from `partition_cols`) are added as columns.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        polars (bool): Whether or not to return a polars DataFrame. Defaults to False.
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        max_workers (int): Number of files downloaded concurrently, for a directory or a glob pattern. Defaults to 8.
+
+        lazy (bool): Whether to return a polars LazyFrame instead, see `azure_storage_scan()`. Defaults to False.
+
+        **kwargs: Other parameters to read the csv or parquet file.
+            For several parquet files read into pandas, they go to `pyarrow.parquet.read_table()`, e.g., `columns` or `filters`.
 
     Returns
     -------
-        pd.DataFrame or pl.DataFrame
+        pd.DataFrame or pl.DataFrame or pl.LazyFrame
 
     Example
     -------
         azure_storage_to_df("test_container", "path/to/file.csv", mock_secret)
+
+        azure_storage_to_df("test_container", "path/to/table/", mock_secret, polars=True)
+
+        azure_storage_to_df("test_container", "path/to/table/date=2024-*/*.parquet", mock_secret, columns=["id"])
     """
 
+    if lazy:
+        return azure_storage_scan(
+            container_name,
+            file_path,
+            secret=secret,
+            storage_account_name=storage_account_name,
+            **kwargs,
+        )
+
+    if file_path.endswith("/") or _is_glob(file_path):
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be a positive integer.")
+
+        files = _list_data_files(
+            container_name,
+            file_path,
+            secret=secret,
+            storage_account_name=storage_account_name,
+        )
+
+        # The partition directories are parsed below the directory, or the part of a glob pattern without wildcards
+        base_dir = "/".join(
+            itertools.takewhile(lambda part: not _is_glob(part), file_path.lstrip("/").split("/")[:-1])
+        )
+
+        return _read_parts(
+            container_name,
+            files,
+            secret=secret,
+            polars=polars,
+            storage_account_name=storage_account_name,
+            max_workers=max_workers,
+            base_dir=base_dir,
+            **kwargs,
+        )
+
+    # Determine format based on file extension
+    if not _is_data_file(file_path):
+        raise ValueError("The file must be either: `parquet` or `csv` (or `csv.gz`, `csv.zst`).")
+
+    file_format, compression = _split_ext(file_path)
+
     # Use the new `azure_storage_to_io` function
     buffer = azure_storage_to_io(
         container_name=container_name,
@@ -411,22 +2280,13 @@ def azure_storage_to_df(
         storage_account_name=storage_account_name,
     )
 
-    # Determine format based on file extension
-    ext = file_path.split(".")[-1]
-
-    if ext == "parquet":
+    if file_format == "parquet":
         if polars:
             return pl.read_parquet(buffer, **kwargs)
         return pd.read_parquet(buffer, **kwargs)
 
-    elif ext == "csv":
-        buffer_str = io.StringIO(buffer.getvalue().decode())
-        if polars:
-            return pl.read_csv(buffer_str, **kwargs)
-        return pd.read_csv(buffer_str, **kwargs)
-
-    else:
-        raise ValueError("The file must be either: `parquet` or `csv`.")
+    # The parsers read the bytes buffer as it is, no decoded copy of the whole file
+    return _read_csv(buffer, compression, polars, **kwargs)
 
 
 def azure_storage_to_dict(
@@ -434,9 +2294,12 @@ def azure_storage_to_dict(
     file_path: str,
     secret: Optional[dict],
     storage_account_name: Optional[str] = None,
-) -> dict:
+) -> Union[dict, list]:
     """Download file from Azure Storage to Python dictionary
 
+    '.jsonl' files (one JSON object per line) are read as a list of dictionaries.
+    '.gz' and '.zst' files (e.g., 'events.json.gz', 'events.jsonl.zst') are decompressed as they are read.
+
     Parameters
     ----------
         container_name (str): Azure storage container name.
@@ -455,7 +2318,7 @@ def azure_storage_to_dict(
 
     Returns
     -------
-        dict
+        dict | list[dict]
     """
 
     f = azure_storage_to_io(
@@ -465,7 +2328,42 @@ def azure_storage_to_dict(
         storage_account_name=storage_account_name,
     )
 
-    return json.load(f)
+    file_format, compression = _split_ext(file_path)
+    stream = _open_decompressed(f, compression)
+
+    if file_format == "jsonl":
+        with io.TextIOWrapper(stream, encoding="utf-8") as lines:
+            return [json.loads(line) for line in lines if line.strip()]
+
+    return json.load(stream)
+
+
+def _delete_path(
+    service_client, container_name: str, path: str, is_directory: Optional[bool] = None
+) -> bool:
+    """Deletes a file, or a directory recursively, and returns whether it was a directory.
+
+    The type of the path is looked up first, unless it is given (e.g., from a listing).
+    """
+
+    path = path.strip("/")
+    file_client = service_client.get_file_client(
+        file_system=container_name, file_path=path
+    )
+
+    if is_directory is None:
+        props = file_client.get_file_properties()
+        is_directory = props["metadata"].get("hdi_isfolder") == "true"
+
+    if is_directory:
+        dir_client = service_client.get_directory_client(
+            file_system=container_name, directory=path
+        )
+        dir_client.delete_directory()
+    else:
+        file_client.delete_file()
+
+    return is_directory
 
 
 def azure_storage_delete_path(
@@ -497,20 +2395,117 @@ def azure_storage_delete_path(
         secret, storage_account_name=storage_account_name
     )
 
-    file_client = service_client.get_file_client(
-        file_system=container_name, file_path=path
-    )
-
-    # Get properties and check if it's a folder
-    props = file_client.get_file_properties()
-    if props["metadata"].get("hdi_isfolder") == "true":
-        # A directory
-        dir_client = service_client.get_directory_client(
-            file_system=container_name, directory=path
-        )
-        dir_client.delete_directory()
+    if _delete_path(service_client, container_name, path):
         print(f"Deleted directory: {path}")
     else:
-        # A file
-        file_client.delete_file()
         print(f"Deleted file: {path}")
+
+
+def azure_storage_delete_paths(
+    container_name: str,
+    paths: Optional[list[str]] = None,
+    prefix: Optional[str] = None,
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+    suffix: Optional[Union[str, tuple[str, ...]]] = None,
+    modified_before: Optional[datetime] = None,
+    max_workers: int = 16,
+) -> dict[str, Optional[str]]:
+    """Deletes many files or directories concurrently, and returns the result of each delete.
+
+    Either give the `paths` to delete, or a `prefix` (a directory). Without filters, the directory is deleted
+    recursively in one request. With `suffix` and/or `modified_before`, only the matching files under it are deleted,
+    e.g., the files older than a retention period.
+    A failed delete does not stop the others, its error is returned instead.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        paths (list[str], optional): Paths of the files or directories to delete. Defaults to None.
+
+        prefix (str, optional): Directory to delete, or to delete the matching files from. Defaults to None.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        suffix (str | tuple[str, ...], optional): Only delete the files under `prefix` ending with this suffix.
+
+        modified_before (datetime, optional): Only delete the files under `prefix` last modified before this time.
+            A naive datetime is taken as UTC.
+
+        max_workers (int): Number of deletes running in parallel. Defaults to 16.
+
+    Returns
+    -------
+        dict[str, str | None]
+            Each path to None if it was deleted, or to the error message if it was not.
+
+    Example
+    -------
+        azure_storage_delete_paths("test_container", ["tmp/a.csv", "tmp/b.csv", "tmp/run_42/"], secret=mock_secret)
+
+        results = azure_storage_delete_paths(
+            "test_container", prefix="landing/events", suffix=".json", secret=mock_secret
+        )
+        failed = {path: error for path, error in results.items() if error is not None}
+
+        # Retention: delete the files older than 30 days
+        azure_storage_delete_paths(
+            "test_container", prefix="landing/events", modified_before=datetime.now(timezone.utc) - timedelta(days=30)
+        )
+    """
+
+    if (paths is None) == (prefix is None):
+        raise ValueError("Either `paths` or `prefix` must be given, not both.")
+
+    if paths is not None and (suffix is not None or modified_before is not None):
+        raise ValueError("`suffix` and `modified_before` only apply to `prefix`.")
+
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be a positive integer.")
+
+    # The listed paths are known to be files, the others are looked up before their delete
+    is_directory: dict[str, bool] = {}
+
+    if prefix is not None:
+        if suffix is None and modified_before is None:
+            paths = [prefix]
+        else:
+            for path in azure_storage_iter_paths(
+                container_name,
+                prefix,
+                secret,
+                storage_account_name=storage_account_name,
+                suffix=suffix,
+                modified_before=modified_before,
+            ):
+                is_directory[path.name] = path.is_directory
+            paths = list(is_directory)
+
+    service_client = get_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    def delete(path: str) -> Optional[str]:
+        try:
+            _delete_path(service_client, container_name, path, is_directory.get(path))
+        except Exception as e:
+            return str(e)
+        return None
+
+    assert paths is not None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = dict(zip(paths, executor.map(delete, paths)))
+
+    num_failed = sum(error is not None for error in results.values())
+    print(f"Deleted {len(results) - num_failed} of {len(results)} paths in {container_name}")
+
+    return results
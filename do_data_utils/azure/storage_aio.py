@@ -0,0 +1,329 @@
+import asyncio
+import io
+import weakref
+from typing import Any, Optional
+
+from azure.identity.aio import ClientSecretCredential, DefaultAzureCredential
+from azure.storage.filedatalake.aio import DataLakeServiceClient
+
+from .storage import _credential_key, _get_storage_account_name
+
+
+class _AioState:
+    """The aiohttp session, credentials and service clients shared by the async functions in one event loop."""
+
+    def __init__(self, transport: Any) -> None:
+        self.transport = transport
+        self.credentials: dict[tuple, Any] = {}
+        self.service_clients: dict[tuple, DataLakeServiceClient] = {}
+
+
+# The aiohttp session is bound to the event loop it was created in, so there is one state per loop
+_aio_states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AioState]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def _new_transport():
+    """Creates an aiohttp transport over a new session, shared by all the service clients of the loop."""
+
+    try:
+        import aiohttp
+        from azure.core.pipeline.transport import AioHttpTransport
+    except ImportError:
+        raise ImportError(
+            "The async Azure storage functions require `aiohttp`, install it with: pip install 'do-data-utils[aio]'"
+        )
+
+    # The clients must not close the shared session, `close_async_clients()` does
+    return AioHttpTransport(session=aiohttp.ClientSession(), session_owner=False)
+
+
+def _get_state() -> _AioState:
+    """Gets the shared state of the running event loop."""
+
+    loop = asyncio.get_running_loop()
+    if loop not in _aio_states:
+        _aio_states[loop] = _AioState(_new_transport())
+    return _aio_states[loop]
+
+
+def _get_async_credentials(state: _AioState, secret: Optional[dict] = None):
+    """Gets the async credentials for the secret (or the default credentials), created once per loop."""
+
+    key = _credential_key(secret)
+
+    if key not in state.credentials:
+        if secret:
+            try:
+                state.credentials[key] = ClientSecretCredential(
+                    tenant_id=secret["tenant_id"],
+                    client_id=secret["client_id"],
+                    client_secret=secret["client_secret"],
+                )
+            except KeyError:
+                raise KeyError(
+                    "The secret must contain `tenant_id`, `client_id` and `client_secret` keys."
+                )
+        else:
+            state.credentials[key] = DefaultAzureCredential()
+
+    return state.credentials[key]
+
+
+# ----------------
+# Main functions
+# ----------------
+
+
+def get_async_service_client(
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+) -> DataLakeServiceClient:
+    """Returns an async DataLakeServiceClient, to be called within a running event loop.
+
+    The clients are cached per (tenant, client_id, client secret, storage account) in each event loop,
+    and all of them send their requests through one shared aiohttp session.
+    See `close_async_clients()` to close them.
+    """
+
+    storage_account_name = _get_storage_account_name(secret, storage_account_name)
+
+    state = _get_state()
+    key = _credential_key(secret) + (storage_account_name,)
+
+    if key not in state.service_clients:
+        state.service_clients[key] = DataLakeServiceClient(
+            account_url=f"https://{storage_account_name}.dfs.core.windows.net",
+            credential=_get_async_credentials(state, secret),
+            transport=state.transport,
+        )
+
+    return state.service_clients[key]
+
+
+async def close_async_clients() -> None:
+    """Closes the async service clients, credentials and aiohttp session of the running event loop.
+
+    Example
+    -------
+        @app.on_event("shutdown")
+        async def shutdown():
+            await close_async_clients()
+    """
+
+    state = _aio_states.pop(asyncio.get_running_loop(), None)
+    if state is None:
+        return
+
+    for client in state.service_clients.values():
+        await client.close()
+
+    for cred in state.credentials.values():
+        await cred.close()
+
+    await state.transport.session.close()
+
+
+async def azure_storage_to_io_async(
+    container_name: str,
+    file_path: str,
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+) -> io.BytesIO:
+    """Downloads a blob into an in-memory buffer, asynchronously.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        file_path (str): Full path to file in Azure storage.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+            Example: {
+                "tenant_id": "your-tenant-id",
+                "client_id": "your-client-id",
+                "client_secret": "your-client-secret",
+                "storage_account": "your-storage-account"
+            }
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+    Returns
+    -------
+        io.BytesIO
+
+    Example
+    -------
+        buffers = await asyncio.gather(
+            *(azure_storage_to_io_async("test_container", path, mock_secret) for path in paths)
+        )
+    """
+
+    service_client = get_async_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    file_client = service_client.get_file_client(
+        file_system=container_name, file_path=file_path.lstrip("/")
+    )
+
+    downloader = await file_client.download_file()
+    return io.BytesIO(await downloader.readall())
+
+
+async def io_to_azure_storage_async(
+    buffer,
+    container_name: str,
+    dest_file_path: str,
+    secret: Optional[dict] = None,
+    overwrite: bool = True,
+    storage_account_name: Optional[str] = None,
+) -> None:
+    """Uploads an in-memory buffer to Azure Blob Storage, asynchronously.
+
+    Parameters
+    ----------
+        buffer (io.BytesIO): Buffer to upload, from its beginning.
+
+        container_name (str): Azure storage container name.
+
+        dest_file_path (str): Destination file path.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+
+        overwrite (bool): Whether or not to overwrite existing file. Defaults to `True`.
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+    Returns
+    -------
+        None
+
+    Example
+    -------
+        await io_to_azure_storage_async(io.BytesIO(payload), "test_container", "events/1.json", mock_secret)
+    """
+
+    service_client = get_async_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    file_client = service_client.get_file_client(
+        file_system=container_name, file_path=dest_file_path.lstrip("/")
+    )
+
+    buffer.seek(0)  # Reset buffer position
+    await file_client.upload_data(buffer, overwrite=overwrite)
+
+    print(f"Uploaded to Azure Storage: {container_name}/{dest_file_path}")
+
+
+async def azure_storage_list_files_async(
+    container_name: str,
+    directory_path: str,
+    secret: Optional[dict] = None,
+    files_only: bool = True,
+    storage_account_name: Optional[str] = None,
+    recursive: bool = True,
+) -> list[str]:
+    """Lists all files (blobs) in an Azure storage directory, asynchronously.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        directory_path (str): Path to the directory in which you want to list the files.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+
+        files_only (bool): Whether or not to return only the files, excluding the directories. Default is `True`
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+        recursive (bool): Whether or not to search recursively in sub-folders
+
+    Returns
+    -------
+        list[str]
+            A list of blobs' names.
+
+    Example
+    -------
+        await azure_storage_list_files_async("test_container", "somepath", mock_secret)
+    """
+
+    service_client = get_async_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    file_system_client = service_client.get_file_system_client(
+        file_system=container_name
+    )
+
+    # Normalize directory path
+    if directory_path and not directory_path.endswith("/"):
+        directory_path += "/"
+
+    return [
+        path.name
+        async for path in file_system_client.get_paths(
+            path=directory_path, recursive=recursive
+        )
+        if not (files_only and path.is_directory)
+    ]
+
+
+async def azure_storage_delete_path_async(
+    container_name: str,
+    path: str,
+    secret: Optional[dict] = None,
+    storage_account_name: Optional[str] = None,
+) -> None:
+    """Deletes a file or a directory (recursively), asynchronously.
+
+    Parameters
+    ----------
+        container_name (str): Azure storage container name.
+
+        path (str): A path of a directory or a file in Azure storage.
+
+        secret (dict, optional): Secret dictionary. Defaults = None.
+
+        storage_account_name (str, optional): Storage account to connect to. Only applies if `secret` is None.
+
+    Returns
+    -------
+        None
+
+    Example
+    -------
+        await asyncio.gather(
+            *(azure_storage_delete_path_async("test_container", path, mock_secret) for path in expired)
+        )
+    """
+
+    service_client = get_async_service_client(
+        secret, storage_account_name=storage_account_name
+    )
+
+    # Like `azure_storage_delete_path()`, the type of the path is looked up first
+    file_client = service_client.get_file_client(
+        file_system=container_name, file_path=path.strip("/")
+    )
+
+    props = await file_client.get_file_properties()
+    if props["metadata"].get("hdi_isfolder") == "true":
+        dir_client = service_client.get_directory_client(
+            file_system=container_name, directory=path.strip("/")
+        )
+        await dir_client.delete_directory()
+        print(f"Deleted directory: {path}")
+    else:
+        await file_client.delete_file()
+        print(f"Deleted file: {path}")
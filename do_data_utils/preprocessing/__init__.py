@@ -5,9 +5,35 @@
     Provides utility functions related to data preprocessing.
 """
 
+from .batch import clean_many
+from .cache import cached_cleaner
 from .citizenid import clean_citizenid
 from .email import clean_email
-from .phone import clean_phone
-from .constants import exclude_phone_number_list
+from .phone import clean_phone, get_phone_range_failures, reset_phone_range_failures
+from .constants import exclude_phone_number_list, exclude_phone_number_set
+from .exclusion import PhoneExclusionIndex
+from .pipeline import clean_file
+from .vectorized import (
+    clean_citizenid_series,
+    clean_email_series,
+    clean_phone_series,
+    validate_citizen_ids,
+)
 
-__all__ = ["clean_citizenid", "clean_email", "clean_phone", "exclude_phone_number_list"]
\ No newline at end of file
+__all__ = [
+    "cached_cleaner",
+    "clean_citizenid",
+    "clean_email",
+    "clean_file",
+    "clean_many",
+    "clean_phone",
+    "get_phone_range_failures",
+    "reset_phone_range_failures",
+    "exclude_phone_number_list",
+    "exclude_phone_number_set",
+    "PhoneExclusionIndex",
+    "clean_citizenid_series",
+    "clean_email_series",
+    "clean_phone_series",
+    "validate_citizen_ids",
+]
@@ -0,0 +1,143 @@
+import itertools
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+from .citizenid import clean_citizenid
+from .email import clean_email
+from .phone import clean_phone
+
+
+_cleaners: dict[str, Callable] = {
+    "phone": clean_phone,
+    "email": clean_email,
+    "citizenid": clean_citizenid,
+}
+
+# Set in each worker process by `_init_worker()`
+_worker_cleaner: Optional[Callable] = None
+_worker_kwargs: dict = {}
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def _init_worker(kind: str, kwargs: dict) -> None:
+    """Sets the cleaner and its arguments once per worker process.
+
+    This way, a large `exclude_numbers` is sent to each worker once, not with every chunk.
+    """
+
+    global _worker_cleaner, _worker_kwargs
+    _worker_cleaner = _cleaners[kind]
+    _worker_kwargs = kwargs
+
+
+def _clean_chunk(chunk: list) -> list:
+    """Cleans a chunk of values in a worker process."""
+
+    assert _worker_cleaner is not None
+    return [_worker_cleaner(value, **_worker_kwargs) for value in chunk]
+
+
+def _chunked(values: Iterable, chunksize: int) -> Iterator[list]:
+    """Splits an iterable into lists of `chunksize` values, without reading it all at once."""
+
+    iterator = iter(values)
+    while chunk := list(itertools.islice(iterator, chunksize)):
+        yield chunk
+
+
+def _clean_many(
+    values: Iterable, kind: str, workers: int, chunksize: int, kwargs: dict
+) -> Iterator[Optional[str]]:
+    """Generator behind `clean_many()`."""
+
+    if workers == 1:
+        cleaner = _cleaners[kind]
+        for value in values:
+            yield cleaner(value, **kwargs)
+        return
+
+    # At most two chunks per worker are queued, so memory stays bounded for any input size
+    max_pending = workers * 2
+
+    # polars runs its own thread pool, so forking this process could deadlock the workers
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(kind, kwargs),
+    ) as executor:
+        pending: deque[Future] = deque()
+
+        for chunk in _chunked(values, chunksize):
+            pending.append(executor.submit(_clean_chunk, chunk))
+
+            # Stream the finished chunks back, in input order
+            while pending and (len(pending) >= max_pending or pending[0].done()):
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+# ----------------
+# Main function
+# ----------------
+
+
+def clean_many(
+    values: Iterable,
+    kind: str = "phone",
+    workers: Optional[int] = None,
+    chunksize: int = 10_000,
+    **kwargs,
+) -> Iterator[Optional[str]]:
+    """Cleans many values with `clean_phone()`, `clean_email()` or `clean_citizenid()` on a process pool.
+
+    The values are sent to the worker processes in chunks,
+    and the results are streamed back in the same order as `values`.
+
+    Parameters
+    ----------
+    values: Iterable
+        Values to clean. It can be any iterable, e.g., a generator reading a file.
+
+    kind: str, default="phone"
+        Which cleaner to use, one of: "phone", "email" or "citizenid".
+
+    workers: int, default=None
+        Number of worker processes.
+        If None, it uses the number of CPUs. If 1, the values are cleaned in the current process.
+
+    chunksize: int, default=10_000
+        Number of values sent to a worker at a time.
+
+    **kwargs:
+        Keyword arguments to the cleaner, e.g., `exclude_numbers` or `delimiter`.
+
+    Returns
+    -------
+    Iterator[str | None]
+        The cleaned values, in the same order as `values`.
+
+    Example
+    -------
+        phones_cleaned = list(clean_many(df["phone"], kind="phone", workers=32, delimiter="|"))
+    """
+
+    if kind not in _cleaners:
+        raise ValueError(f"`kind` must be one of: {', '.join(_cleaners)}.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1 or chunksize < 1:
+        raise ValueError("`workers` and `chunksize` must be positive integers.")
+
+    return _clean_many(values, kind, workers, chunksize, kwargs)
@@ -0,0 +1,46 @@
+import functools
+from typing import Callable
+
+from .batch import _cleaners
+
+
+def cached_cleaner(kind: str = "phone", maxsize: int = 100_000, **kwargs) -> Callable:
+    """Wraps `clean_phone()`, `clean_email()` or `clean_citizenid()` in a bounded LRU cache.
+
+    Each distinct input is cleaned once, repeated inputs are answered from the cache.
+
+    Parameters
+    ----------
+    kind: str, default="phone"
+        Which cleaner to use, one of: "phone", "email" or "citizenid".
+
+    maxsize: int, default=100_000
+        Maximum number of distinct inputs kept in the cache, the least recently used ones are dropped first.
+
+    **kwargs:
+        Keyword arguments to the cleaner, e.g., `exclude_numbers` or `delimiter`.
+        They are fixed for the lifetime of the returned function.
+        With `as_list=True`, repeated inputs get the same list object, copy it before modifying it.
+
+    Returns
+    -------
+    Callable
+        A function taking one value and returning the cleaned value.
+        Use its `cache_info()` to get the hit/miss counters and `cache_clear()` to empty the cache.
+
+    Example
+    -------
+        clean = cached_cleaner("phone", maxsize=500_000, delimiter="|")
+        df["phone"] = df["phone"].apply(clean)
+        print(clean.cache_info())  # CacheInfo(hits=..., misses=..., maxsize=500000, currsize=...)
+    """
+
+    if kind not in _cleaners:
+        raise ValueError(f"`kind` must be one of: {', '.join(_cleaners)}.")
+
+    if maxsize < 1:
+        raise ValueError("`maxsize` must be a positive integer.")
+
+    # The keyword arguments are bound first, so unhashable ones (e.g., a list of numbers) are allowed
+    cleaner = functools.partial(_cleaners[kind], **kwargs)
+    return functools.lru_cache(maxsize=maxsize)(cleaner)
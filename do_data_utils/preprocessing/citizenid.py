@@ -1,8 +1,10 @@
-import functools
-import re
 from typing import Optional
 
-from .common import search_regexp
+from .common import compile_regexp, search_regexp
+
+
+_separator_pattern = compile_regexp(r"\s|-")
+_id_pattern = compile_regexp(r"\d{13}")
 
 
 def get_checksum(id_str: str) -> int:
@@ -19,10 +21,8 @@ def get_checksum(id_str: str) -> int:
         Checksum number
     """
 
-    all_digits = list(
-        map(lambda ele: (ele[0] + 1, int(ele[1])), list(enumerate(list(id_str))))
-    )
-    sum_ = functools.reduce(lambda a, b: a + ((14 - b[0]) * b[1]), all_digits[:-1], 0)
+    # The weights go from 13 down to 2 for all the digits but the last one
+    sum_ = sum((13 - i) * int(digit) for i, digit in enumerate(id_str[:-1]))
     x = sum_ % 11
     check_sum = 1 - x if x <= 1 else 11 - x
     return check_sum
@@ -64,10 +64,8 @@ def clean_citizenid(id_str: str) -> Optional[str]:
     if not id_str:
         return None
 
-    id_str = re.sub(r"\s|-", "", id_str)
-
-    id_pat = r"\d{13}"
-    id_extract = search_regexp(pattern=id_pat, string=id_str)
+    id_str = _separator_pattern.sub("", id_str)
+    id_extract = search_regexp(pattern=_id_pattern, string=id_str)
 
     if id_extract and validate_citizen_id(id_extract):
         return id_extract
@@ -1,8 +1,37 @@
 import re
+from typing import Pattern, Union
 
 
-def search_regexp(pattern, string, group=0):
-    search = re.search(pattern, string)
+# Compiled patterns, keyed by their pattern string
+_compiled_patterns: dict[str, Pattern[str]] = {}
+
+
+def compile_regexp(pattern: str) -> Pattern[str]:
+    """Compiles a regular expression once and reuses it afterwards.
+
+    Parameters
+    ----------
+    pattern: str
+        Regular expression pattern.
+
+    Returns
+    -------
+    re.Pattern
+        The compiled pattern, shared by every caller using the same pattern string.
+    """
+
+    try:
+        return _compiled_patterns[pattern]
+    except KeyError:
+        compiled = _compiled_patterns[pattern] = re.compile(pattern)
+        return compiled
+
+
+def search_regexp(pattern: Union[str, Pattern[str]], string, group=0):
+    if isinstance(pattern, str):
+        pattern = compile_regexp(pattern)
+
+    search = pattern.search(string)
     if search:
         return search.group(group)
 
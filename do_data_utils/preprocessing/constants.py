@@ -53,3 +53,6 @@ exclude_phone_number_list = [
     "028848965",
     "022462323",
 ]
+
+# Same numbers as `exclude_phone_number_list`, for constant-time lookups
+exclude_phone_number_set = frozenset(exclude_phone_number_list)
@@ -1,9 +1,14 @@
-from typing import Optional
+from typing import Optional, Union
 
-from .common import search_regexp
+from .common import compile_regexp, search_regexp
 
 
-def clean_email(email: str, delimiter: Optional[str] = None) -> Optional[str]:
+_email_pattern = compile_regexp(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}")
+
+
+def clean_email(
+    email: str, delimiter: Optional[str] = None, as_list: bool = False
+) -> Optional[Union[str, list[str]]]:
     """Cleans the e-mail.
 
     Parameters
@@ -15,29 +20,33 @@ def clean_email(email: str, delimiter: Optional[str] = None) -> Optional[str]:
         A delimiter character to separate multiple emails.
         If None, it expects that email is not delimited.
 
+    as_list: bool, default=False
+        Whether to return the valid e-mails as a list instead of a string joined with `delimiter`.
+
     Returns
     -------
-    str
-        A valid e-mail string, else None.
+    str | list[str]
+        A valid e-mail string (or a list of them if `as_list`), else None.
     """
 
     if not email:
         return None
 
-    email_pat = r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}"
-
     if not delimiter:
-        return search_regexp(pattern=email_pat, string=email)
+        email_extracted = search_regexp(pattern=_email_pattern, string=email)
+        if as_list and email_extracted:
+            return [email_extracted]
+        return email_extracted
 
     else:
         ret = []
         email_list = email.split(delimiter)
         for e in email_list:
-            email_extracted = search_regexp(pattern=email_pat, string=e)
+            email_extracted = search_regexp(pattern=_email_pattern, string=e)
             if email_extracted:
                 ret.append(email_extracted)
 
         if ret:
-            return delimiter.join(ret)
+            return ret if as_list else delimiter.join(ret)
 
         return None
@@ -0,0 +1,139 @@
+from typing import Iterable, Optional, Union
+
+import polars as pl
+
+from .constants import exclude_phone_number_set
+
+
+class PhoneExclusionIndex:
+    """Phone numbers and number prefixes to exclude when cleaning phone numbers.
+
+    Build it once and pass it as `exclude_numbers` to `clean_phone()`, `clean_phone_series()` etc.
+    Looking up a number costs the same whatever the size of the index:
+    one set lookup for the numbers, and one per distinct prefix length for the prefixes.
+
+    Parameters
+    ----------
+    numbers: Iterable[str], default=()
+        Phone numbers to exclude.
+
+    prefixes: Iterable[str], default=()
+        Excludes any number starting with one of these prefixes, e.g., '000'.
+
+    Example
+    -------
+        index = PhoneExclusionIndex.from_parquet("blacklist.parquet", column="phone", prefixes=["0200"])
+        clean_phone("0812345678|020012345", exclude_numbers=index)
+    """
+
+    def __init__(self, numbers: Iterable[str] = (), prefixes: Iterable[str] = ()):
+        self.numbers = frozenset(numbers)
+        self.prefixes = frozenset(p for p in prefixes if p)
+        self._prefix_lengths = sorted({len(p) for p in self.prefixes})
+
+    def __contains__(self, phone_num: str) -> bool:
+        if phone_num in self.numbers:
+            return True
+
+        return any(phone_num[:n] in self.prefixes for n in self._prefix_lengths)
+
+    def __len__(self) -> int:
+        return len(self.numbers) + len(self.prefixes)
+
+    def __repr__(self) -> str:
+        return f"PhoneExclusionIndex(numbers={len(self.numbers)}, prefixes={sorted(self.prefixes)})"
+
+    def prefixes_by_length(self) -> dict[int, list[str]]:
+        """Groups the prefixes by their length.
+
+        Returns
+        -------
+        dict[int, list[str]]
+            Prefix length to the prefixes of that length.
+        """
+
+        return {
+            n: sorted(p for p in self.prefixes if len(p) == n)
+            for n in self._prefix_lengths
+        }
+
+    @classmethod
+    def from_file(cls, file_path: str, prefixes: Iterable[str] = ()):
+        """Loads the index from a text file with one number per line.
+
+        Empty lines and lines starting with '#' are skipped.
+        A line ending with '*' is a prefix rule, e.g., '000*' excludes any number starting with '000'.
+
+        Parameters
+        ----------
+        file_path: str
+            Path to the text file.
+
+        prefixes: Iterable[str], default=()
+            Additional prefixes to exclude.
+
+        Returns
+        -------
+        PhoneExclusionIndex
+        """
+
+        numbers = []
+        all_prefixes = list(prefixes)
+
+        with open(file_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                if line.endswith("*"):
+                    all_prefixes.append(line[:-1])
+                else:
+                    numbers.append(line)
+
+        return cls(numbers=numbers, prefixes=all_prefixes)
+
+    @classmethod
+    def from_parquet(cls, file_path: str, column: str, prefixes: Iterable[str] = ()):
+        """Loads the numbers of the index from a column of a Parquet file.
+
+        Parameters
+        ----------
+        file_path: str
+            Path to the Parquet file.
+
+        column: str
+            Name of the column holding the phone numbers.
+
+        prefixes: Iterable[str], default=()
+            Prefixes to exclude.
+
+        Returns
+        -------
+        PhoneExclusionIndex
+        """
+
+        numbers = (
+            pl.read_parquet(file_path, columns=[column])
+            .get_column(column)
+            .cast(pl.String)
+            .drop_nulls()
+        )
+
+        return cls(numbers=numbers.to_list(), prefixes=prefixes)
+
+
+def _resolve_exclude_numbers(
+    exclude_numbers: Optional[Union[list, set, frozenset, PhoneExclusionIndex]],
+) -> Union[list, set, frozenset, PhoneExclusionIndex]:
+    """Validates `exclude_numbers` and falls back to the default numbers if it is None."""
+
+    if exclude_numbers is None:
+        return exclude_phone_number_set
+
+    if not isinstance(exclude_numbers, (list, set, frozenset, PhoneExclusionIndex)):
+        raise ValueError(
+            "`exclude_numbers` must be a list, a set, a PhoneExclusionIndex or None"
+        )
+
+    return exclude_numbers
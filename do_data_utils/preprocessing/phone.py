@@ -1,12 +1,155 @@
-import re
-from typing import Optional
+from collections import Counter
+from typing import Iterator, Optional, Union
 
-from .constants import exclude_phone_number_list
+from .common import compile_regexp
+from .exclusion import PhoneExclusionIndex, _resolve_exclude_numbers
+
+
+_strip_pattern = compile_regexp(r"[\s()+]")
+_phone_pattern = compile_regexp(r"^[-\d]+")
+_dash_pattern = compile_regexp(r"-(?=\d{3,})")
+_final_phone_pattern = compile_regexp(r"\d{9,10}")
+
+# Number of ranges that could not be expanded, by reason, since the last reset
+_range_failures: Counter = Counter()
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def _to_final_number(digits: str) -> Optional[str]:
+    """Normalizes the '66' prefix of a dash-free number and keeps its first 10 digits.
+
+    Same as matching `_final_phone_pattern` on a string of digits only, without running the regex.
+    """
+
+    # The '+' sign is already gone, so the prefix is only '66'
+    if digits.startswith("66"):
+        digits = "0" + digits[2:]
+    return digits[:10] if len(digits) >= 9 else None
+
+
+def _expand_range(base: str, start: str, stop: str, fallback: str) -> Iterator[str]:
+    """Yields the final phone numbers of a range, e.g., 0881112222-25 or 0901234567-9.
+
+    Parameters
+    ----------
+    base: str
+        The number before the first digits of the range, possibly with dashes, e.g., '08811122'.
+
+    start: str
+        The first digits of the range, e.g., '22'.
+
+    stop: str
+        The last digits of the range, e.g., '25'.
+
+    fallback: str
+        The number to use if the range cannot be expanded, e.g., '0881112222'.
+
+    Yields
+    ------
+    str
+        The phone numbers in the range, already in their final form.
+    """
+
+    try:
+        first, last = int(start), int(stop)
+    except ValueError:
+        first = last = -1
+
+    numbers = None
+    if first < 0 or last < 0:  # Not a number, or a dash in the digits, e.g., 08123456-9-99
+        _range_failures["invalid"] += 1
+    elif first > last:
+        _range_failures["reversed"] += 1
+    else:
+        numbers = range(first, last + 1)
+
+    if numbers is None:  # If fails, just cut out the last part
+        phone_num = _to_final_number(fallback.replace("-", ""))
+        if phone_num:
+            yield phone_num
+        return
+
+    # Only the last digits change, so the base is cleaned once for the whole range
+    base = base.replace("-", "")
+    for ii in numbers:
+        phone_num = _to_final_number(base + str(ii))
+        if phone_num:
+            yield phone_num
+
+
+def _tokenize_phone(phone: str, exclude_numbers, delimiter: str) -> Iterator[str]:
+    """Yields the valid phone numbers in `phone`, in a single scan over its fragments.
+
+    Each fragment goes through the stripping, range expansion, prefix normalization,
+    final pattern match and exclusion before the next fragment is read.
+    """
+
+    phone = _strip_pattern.sub("", phone)  # Remove '(', ')', spaces, and '+' sign
+
+    for ele in phone.split(delimiter):
+        match = _phone_pattern.match(ele)  # Numbers, possibly with dashes
+        if not match:
+            continue
+
+        # Replace the dash ('-') in the phone number, only if it's followed by 3 digits or more
+        phone_num = _dash_pattern.sub("", match.group())
+
+        # Take care the case where the number has dash ('-') at the end, e.g., 0881112222-25
+        # Please note that at this point, there may still be dashes left in the string, e.g., 081-23-45678 (if the dash is followed by fewer than 3 digits)
+        if phone_num[-3:][0] == "-":
+            candidates: Iterator[str] = _expand_range(
+                phone_num[:-5], phone_num[-5:-3], phone_num[-2:], fallback=phone_num[:-3]
+            )
+        elif phone_num[-2:][0] == "-":
+            candidates = _expand_range(
+                phone_num[:-3], phone_num[-3:-2], phone_num[-1:], fallback=phone_num[:-2]
+            )
+        else:
+            if phone_num.startswith("66"):
+                phone_num = "0" + phone_num[2:]
+            match = _final_phone_pattern.search(phone_num)
+            candidates = iter((match.group(),) if match else ())
+
+        for phone_num in candidates:
+            if phone_num not in exclude_numbers and not phone_num.startswith("000"):
+                yield phone_num
+
+
+def get_phone_range_failures() -> dict[str, int]:
+    """Gets the number of phone ranges `clean_phone()` could not expand, since the last reset.
+
+    Returns
+    -------
+    dict[str, int]
+        Counts by reason: "invalid" (the range is not a number, e.g., '0812345678-1-') or
+        "reversed" (the range ends before it starts, e.g., '0812345678-5'). The number without its range is kept for those.
+        The counts are per process, `clean_many()` workers keep their own.
+    """
+
+    return dict(_range_failures)
+
+
+def reset_phone_range_failures() -> None:
+    """Resets the counts returned by `get_phone_range_failures()`."""
+
+    _range_failures.clear()
+
+
+# ----------------
+# Main function
+# ----------------
 
 
 def clean_phone(
-    phone: str, exclude_numbers: Optional[list] = None, delimiter: str = "|"
-) -> Optional[str]:
+    phone: str,
+    exclude_numbers: Optional[Union[list, set, frozenset, PhoneExclusionIndex]] = None,
+    delimiter: str = "|",
+    as_list: bool = False,
+) -> Optional[Union[str, list[str]]]:
     """Cleans phone numbers and outputs a list of valid phone numbers.
 
     Parameters
@@ -21,98 +164,33 @@ def clean_phone(
 
         It also removes any numbers that start with '000' or presented in `exclude_phone_number_list`.
 
-    exclude_numbers: Optional[list], default=None
-        List of numbers to exclude.
+    exclude_numbers: list | set | frozenset | PhoneExclusionIndex | None, default=None
+        Numbers to exclude.
         If not specified (None), it uses the default values in `exclude_phone_number_list`.
         If you do not want to exclude any numbers, put in an empty list.
+        For large lists, pass a set or a `PhoneExclusionIndex` (built once) to avoid a linear scan per number.
 
     delimiter: str, default="|"
         A delimiter character to separate phone numbers.
 
+    as_list: bool, default=False
+        Whether to return the valid phone numbers as a list instead of a string joined with `delimiter`.
+
     Returns
     -------
-    str | None
-        Valid phone number(s), concatnated with `|` character.
+    str | list[str] | None
+        Valid phone number(s), concatnated with `|` character (or a list of them if `as_list`).
     """
 
-    if exclude_numbers is not None and not isinstance(exclude_numbers, list):
-        raise ValueError("`exclude_numbers` must be a list or None")
-
-    exclude_numbers = (
-        exclude_phone_number_list if exclude_numbers is None else exclude_numbers
-    )
+    exclude_numbers = _resolve_exclude_numbers(exclude_numbers)
 
     if not phone:
         return None
 
-    phone = re.sub(r"\s|\(|\)|\+", "", phone)  # Remove '(', ')', spaces, and '+' sign
-    # Split the text by the comma, in case there are multiple numbers
-    phone_arr = phone.split(delimiter)
-
-    phone_pat = r"^[-\d]+"  # Search and keep for numbers, possibly with dashes
-
-    ret_arr = []
-    for ele in phone_arr:
-        match = re.search(
-            pattern=phone_pat, string=ele
-        )  # Search and keep for numbers, possibly with dashes
-        if match:
-            phone_num = match.group()  # Get the matched phone number
-            phone_num = re.sub(
-                r"-(?=\d{3,})", "", phone_num
-            )  # Replace the dash ('-') in the phone number, only if it's followed by 3 digits or more
-
-            # Take care the case where the number has dash ('-') at the end, e.g., 0881112222-25
-            # Please note that at this point, there may still be dashes left in the string, e.g., 081-23-45678 (if the dash is followed by fewer than 3 digits)
-            if phone_num[-3:][0] == "-":
-                number_before_last_two_digits = phone_num[:-5]
-                last_two_digits = phone_num[-5:-3]
-                until_two_digits = phone_num[-2:]
-                try:  # Try converting and concatenating the numbers
-                    num_arr = [
-                        re.sub(r"-", "", number_before_last_two_digits + str(ii))
-                        for ii in range(int(last_two_digits), int(until_two_digits) + 1)
-                    ]  # Also, finally, replace all the dashes left in the string
-                    ret_arr.extend(num_arr)
-                except Exception as e:  # If fails, just cut out the last part
-                    print(f"Failed to convert last digits to int: {e}")
-                    ret_arr.append(re.sub(r"-", "", phone_num[:-3]))
-
-            elif phone_num[-2:][0] == "-":
-                number_before_last_digit = phone_num[:-3]
-                last_digit = phone_num[-3:-2]
-                until_digit = phone_num[-1:]
-                try:  # Try converting and concatenating the numbers
-                    num_arr = [
-                        re.sub(r"-", "", number_before_last_digit + str(ii))
-                        for ii in range(int(last_digit), int(until_digit) + 1)
-                    ]  # Also, finally, replace all the dashes left in the string
-                    ret_arr.extend(num_arr)
-                except Exception as e:  # If fails, just cut out the last part
-                    print(f"Failed to convert last digits to int: {e}")
-                    ret_arr.append(re.sub(r"-", "", phone_num[:-2]))
-
-            else:
-                ret_arr.append(phone_num)
-
-    if not ret_arr:  # Check if there are any elements in the ret_arr
-        return None
-
-    # Final pattern match for phone numbers
-    final_ret_arr = []
-    prefix_pat = r"^\+?66"
-    final_phone_pat = r"\d{9,10}"
-
-    for ele in ret_arr:
-        ele_cleaned = re.sub(prefix_pat, "0", ele)
-        match = re.search(pattern=final_phone_pat, string=ele_cleaned)
-
-        if match:
-            phone_num = match.group()
-
-            if phone_num not in exclude_numbers and not phone_num.startswith("000"):
-                final_ret_arr.append(phone_num)
+    if as_list:
+        phone_list = list(_tokenize_phone(phone, exclude_numbers, delimiter))
+        return phone_list if phone_list else None
 
-    final_phone = delimiter.join(final_ret_arr)
+    final_phone = delimiter.join(_tokenize_phone(phone, exclude_numbers, delimiter))
 
     return final_phone if final_phone else None
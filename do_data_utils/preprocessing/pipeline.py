@@ -0,0 +1,162 @@
+from typing import Callable, Iterator, Optional
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from .vectorized import clean_citizenid_series, clean_email_series, clean_phone_series
+
+
+_series_cleaners: dict[str, Callable] = {
+    "phone": clean_phone_series,
+    "email": clean_email_series,
+    "citizenid": clean_citizenid_series,
+}
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def _file_type(file_path: str) -> str:
+    """Gets the file type, either 'csv' or 'parquet', from the file extension."""
+
+    ext = file_path.split(".")[-1]
+    if ext not in ("csv", "parquet"):
+        raise ValueError("The file must be either: `parquet` or `csv`.")
+    return ext
+
+
+def _iter_tables(
+    src_path: str, string_columns: list[str], batch_size: int
+) -> Iterator[pa.Table]:
+    """Reads a CSV or Parquet file as tables of about `batch_size` rows.
+
+    The columns in `string_columns` are read as dictionary-encoded strings,
+    so that each distinct value in a batch is cleaned once (and the leading 0 of phone numbers is kept).
+    A file without rows yields one empty table with the schema of the file.
+    """
+
+    if _file_type(src_path) == "parquet":
+        parquet_file = pq.ParquetFile(src_path, read_dictionary=string_columns)
+        if parquet_file.metadata.num_rows == 0:
+            yield parquet_file.schema_arrow.empty_table()
+            return
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            yield pa.Table.from_batches([batch])
+        return
+
+    convert_options = pacsv.ConvertOptions(
+        column_types={col: pa.dictionary(pa.int32(), pa.string()) for col in string_columns}
+    )
+    batches: list[pa.RecordBatch] = []
+    num_rows = 0
+    yielded = False
+
+    # The CSV reader yields blocks of a fixed number of bytes, they are grouped to `batch_size` rows
+    with pacsv.open_csv(src_path, convert_options=convert_options) as reader:
+        schema = reader.schema
+        for batch in reader:
+            batches.append(batch)
+            num_rows += batch.num_rows
+            if num_rows >= batch_size:
+                yield pa.Table.from_batches(batches)
+                batches, num_rows = [], 0
+                yielded = True
+
+    if batches or not yielded:
+        yield pa.Table.from_batches(batches, schema=schema)
+
+
+def _clean_table(
+    table: pa.Table, columns: dict[str, str], cleaner_kwargs: dict[str, dict]
+) -> pa.Table:
+    """Cleans the given columns of an Arrow table with the vectorized cleaners."""
+
+    for col, kind in columns.items():
+        cleaner = _series_cleaners[kind]
+        cleaned = cleaner(table.column(col), **cleaner_kwargs.get(kind, {}))
+        table = table.set_column(
+            table.schema.get_field_index(col),
+            col,
+            cleaned.cast(pa.large_string()),
+        )
+
+    return table
+
+
+# ----------------
+# Main function
+# ----------------
+
+
+def clean_file(
+    src_path: str,
+    dest_path: str,
+    columns: dict[str, str],
+    batch_size: int = 100_000,
+    cleaner_kwargs: Optional[dict[str, dict]] = None,
+) -> None:
+    """Cleans columns of a local CSV or Parquet file, batch by batch, into another file.
+
+    Only one batch is held in memory at a time, so the file can be larger than the memory.
+    A source file without rows gives an output file without rows, with the same columns.
+
+    Parameters
+    ----------
+    src_path: str
+        Path to the source file, ending with '.csv' or '.parquet'.
+
+    dest_path: str
+        Path to the output file, ending with '.csv' or '.parquet'.
+
+    columns: dict[str, str]
+        Column name to the cleaner to apply to it, one of: "phone", "email" or "citizenid".
+        For example, {"mobile": "phone", "contact_email": "email"}
+
+    batch_size: int, default=100_000
+        Number of rows read, cleaned and written at a time.
+
+    cleaner_kwargs: dict[str, dict], default=None
+        Keyword arguments for each cleaner, e.g., {"phone": {"delimiter": ","}, "email": {"delimiter": "|"}}
+        `as_list` is not supported, as the cleaned columns must be strings to be written to CSV.
+
+    Returns
+    -------
+    None
+
+    Example
+    -------
+        clean_file("crm_extract.csv", "crm_clean.parquet", columns={"mobile": "phone", "id_card": "citizenid"})
+    """
+
+    for kind in columns.values():
+        if kind not in _series_cleaners:
+            raise ValueError(f"The cleaner must be one of: {', '.join(_series_cleaners)}.")
+
+    if batch_size < 1:
+        raise ValueError("`batch_size` must be a positive integer.")
+
+    dest_type = _file_type(dest_path)
+    cleaner_kwargs = cleaner_kwargs or {}
+
+    if any(kwargs.get("as_list") for kwargs in cleaner_kwargs.values()):
+        raise ValueError("`as_list` is not supported, the cleaned columns are written as delimited strings.")
+
+    writer = None
+    try:
+        for table in _iter_tables(src_path, list(columns), batch_size=batch_size):
+            table = _clean_table(table, columns, cleaner_kwargs)
+
+            if writer is None:
+                if dest_type == "parquet":
+                    writer = pq.ParquetWriter(dest_path, table.schema)
+                else:
+                    writer = pacsv.CSVWriter(dest_path, table.schema)
+
+            writer.write_table(table)
+
+    finally:
+        if writer is not None:
+            writer.close()
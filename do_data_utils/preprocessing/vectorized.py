@@ -0,0 +1,545 @@
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from .citizenid import validate_citizen_id
+from .exclusion import PhoneExclusionIndex, _resolve_exclude_numbers
+
+
+ColumnLike = Union[pl.Expr, pl.Series, pd.Series, pa.Array, pa.ChunkedArray]
+
+# Python's `int()` understands Thai digits, polars' cast does not.
+_THAI_DIGITS = [chr(0x0E50 + i) for i in range(10)]
+_ASCII_DIGITS = [str(i) for i in range(10)]
+
+# Weights of the first 12 digits of a 13-digit ID, from 13 down to 2
+_checksum_weights = np.arange(13, 1, -1)
+
+# Number of IDs turned into a digit matrix at a time, keeps the matrix around 13 MB
+_checksum_chunk_size = 1_000_000
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def _to_int(expr: pl.Expr) -> pl.Expr:
+    """Casts a string expression to integers the same way `int()` would, nulls on failure."""
+
+    return expr.str.replace_many(_THAI_DIGITS, _ASCII_DIGITS).cast(
+        pl.Int64, strict=False
+    )
+
+
+def _to_string_series(values: Union[pl.Series, pd.Series]) -> pl.Series:
+    """Converts a polars/pandas column to a polars String Series."""
+
+    if isinstance(values, pd.Series):
+        values = pl.from_pandas(values)
+    return values.cast(pl.String, strict=False)
+
+
+def _from_string_series(cleaned: pl.Series, values: Union[pl.Series, pd.Series]):
+    """Converts the cleaned polars Series back to the type (and index/name) of `values`."""
+
+    if isinstance(values, pd.Series):
+        if isinstance(cleaned.dtype, pl.List):  # Python lists rather than NumPy arrays
+            return pd.Series(
+                cleaned.to_list(), index=values.index, name=values.name, dtype=object
+            )
+
+        cleaned_pd = cleaned.to_pandas()
+        cleaned_pd.index = values.index
+        cleaned_pd.name = values.name
+        return cleaned_pd
+    return cleaned.alias(values.name)
+
+
+def _to_arrow_type(return_dtype: pl.DataType) -> pa.DataType:
+    """Gets the Arrow type of the cleaned values, strings or lists of strings."""
+
+    if return_dtype == pl.String:
+        return pa.large_string()
+    return pa.large_list(pa.large_string())
+
+
+def _clean_distinct(
+    values: pl.Series, clean_values: Callable[[pl.Series], pl.Series]
+) -> pl.Series:
+    """Cleans each distinct value once and maps the results back to the rows."""
+
+    distinct = values.drop_nulls().unique()
+    cleaned = clean_values(distinct.cast(pl.String, strict=False))
+
+    # Position of each row's value in `distinct`, works for any type of cleaned values
+    positions = values.replace_strict(
+        distinct,
+        pl.Series(range(len(distinct)), dtype=pl.UInt32),
+        default=None,
+        return_dtype=pl.UInt32,
+    )
+    return cleaned.gather(positions)
+
+
+def _clean_column(
+    values: pl.Series, clean_values: Callable[[pl.Series], pl.Series], unique: bool
+) -> pl.Series:
+    """Cleans a polars column, once per distinct value if `unique` or if the column is categorical."""
+
+    if unique or isinstance(values.dtype, (pl.Categorical, pl.Enum)):
+        return _clean_distinct(values, clean_values)
+    return clean_values(values.cast(pl.String, strict=False))
+
+
+def _clean_arrow(
+    values: Union[pa.Array, pa.ChunkedArray],
+    clean_values: Callable[[pl.Series], pl.Series],
+    unique: bool,
+    return_dtype: pl.DataType,
+) -> Union[pa.Array, pa.ChunkedArray]:
+    """Cleans an Arrow column.
+
+    On a dictionary-encoded column, only the dictionary is cleaned and the indices are kept as they are.
+    """
+
+    arrow_type = _to_arrow_type(return_dtype)
+
+    if isinstance(values, pa.ChunkedArray):
+        chunks = [
+            _clean_arrow(chunk, clean_values, unique, return_dtype)
+            for chunk in values.chunks
+        ]
+        if pa.types.is_dictionary(values.type):
+            arrow_type = pa.dictionary(values.type.index_type, arrow_type)
+        return pa.chunked_array(chunks, type=arrow_type)
+
+    if pa.types.is_dictionary(values.type):
+        dictionary = clean_values(
+            pl.Series(values.dictionary).cast(pl.String, strict=False)
+        )
+        return pa.DictionaryArray.from_arrays(
+            values.indices, dictionary.to_arrow().cast(arrow_type)
+        )
+
+    cleaned = _clean_column(pl.Series(values), clean_values, unique)
+    return cleaned.to_arrow().cast(arrow_type)
+
+
+def _apply_expr(
+    values: ColumnLike,
+    build_expr: Callable[[pl.Expr], pl.Expr],
+    unique: bool = False,
+    return_dtype: pl.DataType = pl.String(),
+):
+    """Applies a polars expression builder to a column.
+
+    Parameters
+    ----------
+    values: pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        The column to clean.
+
+    build_expr: Callable
+        A function taking the input expression and returning the cleaned expression.
+
+    unique: bool, default=False
+        Whether to clean each distinct value only once.
+
+    return_dtype: pl.DataType, default=pl.String()
+        Type of the cleaned values, `pl.String` or `pl.List(pl.String)`.
+
+    Returns
+    -------
+    pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        Same type as `values`.
+    """
+
+    if isinstance(values, pl.Expr) and not unique:
+        return build_expr(values)
+
+    def clean_values(col: pl.Series) -> pl.Series:
+        frame = col.to_frame("_values").lazy()
+        return frame.select(build_expr(pl.col("_values"))).collect().to_series()
+
+    return _apply_series(values, clean_values, unique=unique, return_dtype=return_dtype)
+
+
+def _apply_series(
+    values: ColumnLike,
+    clean_values: Callable[[pl.Series], pl.Series],
+    unique: bool = False,
+    return_dtype: pl.DataType = pl.String(),
+):
+    """Applies a Series-to-Series cleaner to a column.
+
+    Used when the cleaning has to explode rows, which a single expression cannot do efficiently.
+    On a `pl.Expr`, the cleaner runs on each batch of the column.
+
+    Parameters
+    ----------
+    values: pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        The column to clean.
+
+    clean_values: Callable
+        A function taking a polars String Series and returning the cleaned Series.
+
+    unique: bool, default=False
+        Whether to clean each distinct value only once.
+        Categorical and dictionary-encoded columns are always cleaned once per distinct value.
+
+    return_dtype: pl.DataType, default=pl.String()
+        Type of the cleaned values, `pl.String` or `pl.List(pl.String)`.
+
+    Returns
+    -------
+    pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        Same type as `values`.
+    """
+
+    if isinstance(values, pl.Expr):
+        return values.map_batches(
+            lambda s: _clean_column(s, clean_values, unique),
+            return_dtype=return_dtype,
+            is_elementwise=True,
+        )
+
+    if isinstance(values, pd.Series):
+        cleaned = _clean_column(pl.Series(values), clean_values, unique)
+        return _from_string_series(cleaned, values)
+
+    if isinstance(values, pl.Series):
+        cleaned = _clean_column(values, clean_values, unique)
+        return _from_string_series(cleaned, values)
+
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        return _clean_arrow(values, clean_values, unique, return_dtype)
+
+    raise TypeError(
+        "`values` must be a polars Expr/Series, a pandas Series or a pyarrow Array."
+    )
+
+
+def _is_excluded(
+    phone_num: pl.Expr, exclude_numbers: Union[list, set, frozenset, PhoneExclusionIndex]
+) -> pl.Expr:
+    """Builds the expression telling whether a phone number is in `exclude_numbers`."""
+
+    if isinstance(exclude_numbers, PhoneExclusionIndex):
+        numbers = list(exclude_numbers.numbers)
+        prefixes_by_length = exclude_numbers.prefixes_by_length()
+    else:
+        numbers = list(exclude_numbers)
+        prefixes_by_length = {}
+
+    excluded = phone_num.is_in(pl.Series(numbers, dtype=pl.String).implode())
+    for n, prefixes in prefixes_by_length.items():
+        excluded = excluded | phone_num.str.slice(0, n).is_in(
+            pl.Series(prefixes, dtype=pl.String).implode()
+        )
+
+    return excluded
+
+
+def _clean_phone_values(
+    phones: pl.Series, is_excluded: pl.Expr, delimiter: str, as_list: bool = False
+) -> pl.Series:
+    """Cleans a polars String Series of phone numbers, see `clean_phone_series()`.
+
+    `is_excluded` is the exclusion check built by `_is_excluded()` on the `phone_num` column.
+    """
+
+    # One row per fragment, remembering which input row it came from
+    fragments = (
+        phones.str.replace_all(r"[\s()+]", "")
+        .str.split(delimiter)
+        .to_frame("fragment")
+        .with_row_index("row")
+        .explode("fragment")
+    )
+
+    # Numbers (possibly with dashes) at the start of the fragment,
+    # without the dashes followed by 3 digits or more
+    num = pl.col("num")
+    fragments = fragments.select(
+        "row",
+        num=pl.col("fragment")
+        .str.extract(r"^([-\d]+)", 1)
+        .str.replace_all(r"-(\d{3})", "${1}"),
+    ).filter(num.is_not_null())
+
+    # Ranges with two digits, e.g., 0881112222-25, or one digit, e.g., 0901234567-9
+    fragments = fragments.with_columns(
+        is_two=num.str.slice(-3, 1) == "-",
+        is_one=(num.str.slice(-3, 1) != "-") & (num.str.slice(-2, 1) == "-"),
+        two_start=_to_int(num.str.slice(-5, 2)),
+        two_stop=_to_int(num.str.tail(2)),
+        one_start=_to_int(num.str.slice(-3, 1)),
+        one_stop=_to_int(num.str.tail(1)),
+    ).with_columns(
+        two_ok=pl.col("is_two")
+        & (pl.col("two_start") >= 0)
+        & (pl.col("two_start") <= pl.col("two_stop")),
+        one_ok=pl.col("is_one") & (pl.col("one_start") <= pl.col("one_stop")),
+    )
+
+    # Every candidate is `prefix + suffix`, with one suffix per number in the range.
+    # If the range cannot be converted, the last part is cut out instead.
+    candidates = fragments.select(
+        "row",
+        is_range=pl.col("two_ok") | pl.col("one_ok"),
+        prefix=pl.when("two_ok")
+        .then(num.str.head(-5).str.replace_all("-", ""))
+        .when("is_two")
+        .then(num.str.head(-3).str.replace_all("-", ""))
+        .when("one_ok")
+        .then(num.str.head(-3).str.replace_all("-", ""))
+        .when("is_one")
+        .then(num.str.head(-2).str.replace_all("-", ""))
+        .otherwise(num),
+        suffix=pl.when("two_ok")
+        .then(pl.int_ranges("two_start", pl.col("two_stop") + 1))
+        .when("one_ok")
+        .then(pl.int_ranges("one_start", pl.col("one_stop") + 1))
+        .otherwise(pl.concat_list(pl.lit(None, dtype=pl.Int64))),
+    ).explode("suffix")
+
+    # Final pattern match for phone numbers
+    phone_num = pl.col("phone_num")
+    valid = (
+        candidates.select(
+            "row",
+            phone_num=(
+                pl.col("prefix")
+                + pl.col("suffix").cast(pl.String).str.replace_all("-", "").fill_null("")
+            )
+            .str.replace(r"^66", "0")
+            .str.extract(r"(\d{9,10})", 1),
+        )
+        .filter(
+            phone_num.is_not_null()
+            & ~is_excluded
+            & ~phone_num.str.starts_with("000")
+        )
+        .group_by("row")
+        .agg(phone_num)
+    )
+    if not as_list:
+        valid = valid.with_columns(phone_num.list.join(delimiter))
+
+    # Position of each row's numbers in `valid`, null if the row has no valid number
+    positions = pl.Series([None] * len(phones), dtype=pl.UInt32).scatter(
+        valid["row"], pl.Series(range(len(valid)), dtype=pl.UInt32)
+    )
+    return valid["phone_num"].gather(positions).alias(phones.name)
+
+
+def _citizenid_checksum_mask(id_extract: pl.Series) -> np.ndarray:
+    """Checks the checksum of every 13-digit ID in `id_extract` at once.
+
+    The IDs are turned into a (n, 13) uint8 digit matrix,
+    and the checksums are computed with one weighted dot product.
+
+    Parameters
+    ----------
+    id_extract: pl.Series
+        A String Series of 13-digit IDs, or null.
+
+    Returns
+    -------
+    np.ndarray
+        A boolean mask, True if the ID passes the checksum test.
+    """
+
+    mask = np.zeros(len(id_extract), dtype=bool)
+
+    digits_str = id_extract.str.replace_many(_THAI_DIGITS, _ASCII_DIGITS)
+    is_ascii = (digits_str.str.len_bytes() == 13).fill_null(False).to_numpy()
+    ascii_ids = digits_str.filter(is_ascii)
+    ascii_mask = np.empty(len(ascii_ids), dtype=bool)
+
+    for start in range(0, len(ascii_ids), _checksum_chunk_size):
+        chunk = ascii_ids.slice(start, _checksum_chunk_size)
+        buffer = chunk.str.join("").item().encode("ascii")
+        digits = np.frombuffer(buffer, dtype=np.uint8).reshape(-1, 13) - ord("0")
+
+        checksum = (11 - (digits[:, :12] @ _checksum_weights) % 11) % 10
+        ascii_mask[start : start + len(chunk)] = checksum == digits[:, 12]
+
+    mask[is_ascii] = ascii_mask
+
+    # IDs written with other (non Thai) Unicode digits are rare, check them one by one
+    others = (id_extract.is_not_null().to_numpy()) & ~is_ascii
+    for i in np.flatnonzero(others):
+        mask[i] = validate_citizen_id(id_extract[int(i)])
+
+    return mask
+
+
+def _clean_citizenid_values(ids: pl.Series) -> pl.Series:
+    """Cleans a polars String Series of 13-digit IDs, see `clean_citizenid_series()`."""
+
+    id_extract = ids.str.replace_all(r"[\s-]", "").str.extract(r"(\d{13})", 1)
+    is_valid = _citizenid_checksum_mask(id_extract)
+
+    return pl.select(pl.when(pl.lit(is_valid)).then(id_extract)).to_series()
+
+
+# ----------------
+# Cleaners
+# ----------------
+
+
+def clean_phone_series(
+    phones: ColumnLike,
+    exclude_numbers: Optional[Union[list, set, frozenset, PhoneExclusionIndex]] = None,
+    delimiter: str = "|",
+    unique: bool = False,
+    as_list: bool = False,
+) -> ColumnLike:
+    """Cleans a column of phone numbers, the vectorized version of `clean_phone()`.
+
+    Parameters
+    ----------
+    phones: pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        A column of phone number strings, in the same format as `clean_phone()` expects.
+
+    exclude_numbers: list | set | frozenset | PhoneExclusionIndex | None, default=None
+        Numbers to exclude.
+        If not specified (None), it uses the default values in `exclude_phone_number_list`.
+        If you do not want to exclude any numbers, put in an empty list.
+
+    delimiter: str, default="|"
+        A delimiter character to separate phone numbers.
+
+    unique: bool, default=False
+        Whether to clean each distinct value only once, faster when the same numbers repeat a lot.
+        Categorical and dictionary-encoded columns are always cleaned once per distinct value.
+
+    as_list: bool, default=False
+        Whether to return a list of valid phone numbers per row (a `List(String)` column),
+        instead of a string joined with `delimiter`.
+
+    Returns
+    -------
+    pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        Valid phone number(s) concatenated with `delimiter` (or as a list), or null. Same type as `phones`.
+    """
+
+    is_excluded = _is_excluded(
+        pl.col("phone_num"), _resolve_exclude_numbers(exclude_numbers)
+    )
+
+    return _apply_series(
+        phones,
+        lambda s: _clean_phone_values(s, is_excluded, delimiter, as_list=as_list),
+        unique=unique,
+        return_dtype=pl.List(pl.String) if as_list else pl.String(),
+    )
+
+
+def clean_email_series(
+    emails: ColumnLike,
+    delimiter: Optional[str] = None,
+    unique: bool = False,
+    as_list: bool = False,
+) -> ColumnLike:
+    """Cleans a column of e-mails, the vectorized version of `clean_email()`.
+
+    Parameters
+    ----------
+    emails: pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        A column of e-mail strings.
+
+    delimiter: str, default=None
+        A delimiter character to separate multiple emails.
+        If None, it expects that email is not delimited.
+
+    unique: bool, default=False
+        Whether to clean each distinct value only once.
+
+    as_list: bool, default=False
+        Whether to return a list of valid e-mails per row (a `List(String)` column),
+        instead of a string joined with `delimiter`.
+
+    Returns
+    -------
+    pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        Valid e-mail(s) (or a list of them), or null. Same type as `emails`.
+    """
+
+    email_pat = r"([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})"
+
+    def build_expr(expr: pl.Expr) -> pl.Expr:
+        if not delimiter:
+            valid = expr.str.extract(email_pat, 1)
+            return pl.when(valid.is_not_null()).then(pl.concat_list(valid)) if as_list else valid
+
+        valid_list = expr.str.split(delimiter).list.eval(
+            pl.element().str.extract(email_pat, 1).drop_nulls()
+        )
+        if as_list:
+            return pl.when(valid_list.list.len() > 0).then(valid_list)
+
+        valid = valid_list.list.join(delimiter)
+        return pl.when(valid != "").then(valid)
+
+    return _apply_expr(
+        emails,
+        build_expr,
+        unique=unique,
+        return_dtype=pl.List(pl.String) if as_list else pl.String(),
+    )
+
+
+def clean_citizenid_series(ids: ColumnLike, unique: bool = False) -> ColumnLike:
+    """Cleans a column of 13-digit IDs, the vectorized version of `clean_citizenid()`.
+
+    Parameters
+    ----------
+    ids: pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        A column of 13-digit IDs (can have spaces or dashes/hyphens('-')).
+
+    unique: bool, default=False
+        Whether to clean each distinct value only once.
+
+    Returns
+    -------
+    pl.Expr | pl.Series | pd.Series | pa.Array | pa.ChunkedArray
+        Legitimate 13-digit IDs, or null. Same type as `ids`.
+    """
+
+    return _apply_series(ids, _clean_citizenid_values, unique=unique)
+
+
+def validate_citizen_ids(ids) -> tuple:
+    """Validates a batch of 13-digit IDs at once, the vectorized version of `validate_citizen_id()`.
+
+    The IDs are cleaned the same way as `clean_citizenid()` does.
+
+    Parameters
+    ----------
+    ids: pl.Series | pd.Series | np.ndarray | list
+        13-digit IDs (can have spaces or dashes/hyphens('-')).
+
+    Returns
+    -------
+    tuple[np.ndarray, pl.Series | pd.Series | np.ndarray]
+        A boolean mask, True if the ID is legitimate, and the cleaned IDs (None if not legitimate).
+        The cleaned IDs are of the same type as `ids`, or a NumPy array for the other types.
+    """
+
+    if isinstance(ids, (pl.Series, pd.Series)):
+        values = _to_string_series(ids)
+    else:
+        values = pl.Series("ids", ids, dtype=pl.String, strict=False)
+
+    cleaned = _clean_citizenid_values(values)
+    mask = cleaned.is_not_null().to_numpy()
+
+    if isinstance(ids, (pl.Series, pd.Series)):
+        return mask, _from_string_series(cleaned, ids)
+
+    return mask, cleaned.to_numpy()
@@ -1,19 +1,44 @@
+import gc
+import gzip
 import io
+import json
+import re
+from datetime import datetime, timezone
 import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, ResourceNotModifiedError
+from unittest.mock import call, patch, MagicMock, mock_open
 from do_data_utils.azure import (
+    download_folder_azure,
+    upload_folder_azure,
     file_to_azure_storage,
     azure_storage_to_file,
     azure_storage_list_files,
     df_to_azure_storage,
     azure_storage_to_df,
+    azure_storage_to_dict,
 )
 from do_data_utils.azure.storage import (
+    clear_azure_storage_cache,
+    set_azure_storage_cache,
+    azure_storage_delete_path,
+    azure_storage_delete_paths,
+    AzureStoragePath,
+    azure_storage_iter_paths,
+    azure_storage_open,
+    azure_storage_scan,
+    azure_storage_sync,
+    clear_service_client_cache,
     get_credentials,
     get_service_client,
     io_to_azure_storage,
     azure_storage_to_io,
+    azure_storage_writer,
+    _glob_match,
+    _hive_partitions,
 )
 
 
@@ -50,6 +75,60 @@ def test_get_service_client_success(mock_service_client, mock_cred):
     assert result == mock_service_client_instance
 
 
+@patch("do_data_utils.azure.storage.ClientSecretCredential")
+@patch("do_data_utils.azure.storage.DataLakeServiceClient")
+def test_get_service_client_cached(mock_service_client, mock_cred):
+    # Arrange
+    secret = {
+        "tenant_id": "test-tenant-id",
+        "client_id": "test-client-id",
+        "client_secret": "test-client-secret",
+        "storage_account": "test-storage-account",
+    }
+    mock_service_client.side_effect = lambda **kwargs: MagicMock()
+
+    # Act
+    first = get_service_client(secret)
+    second = get_service_client(secret)
+    other_account = get_service_client(secret, storage_account_name="other-account")
+    uncached = get_service_client(secret, use_cache=False)
+
+    # Assert
+    assert first is second
+    assert other_account is not first
+    assert uncached is not first
+    assert mock_service_client.call_count == 3
+    assert mock_cred.call_count == 2  # The cached clients share one credential
+
+    clear_service_client_cache()
+    first.close.assert_called_once()
+    other_account.close.assert_called_once()
+    assert get_service_client(secret) is not first
+
+
+@patch("do_data_utils.azure.storage.ClientSecretCredential")
+@patch("do_data_utils.azure.storage.DataLakeServiceClient")
+def test_get_service_client_rotated_secret(mock_service_client, mock_cred):
+    # Arrange
+    secret = {
+        "tenant_id": "test-tenant-id",
+        "client_id": "test-client-id",
+        "client_secret": "test-client-secret",
+        "storage_account": "test-storage-account",
+    }
+    mock_service_client.side_effect = lambda **kwargs: MagicMock()
+
+    # Act
+    first = get_service_client(secret)
+    rotated = get_service_client({**secret, "client_secret": "rotated-client-secret"})
+
+    # Assert: a new secret gets its own credential and client, not the cached ones
+    assert rotated is not first
+    assert mock_cred.call_count == 2
+    assert mock_cred.call_args.kwargs["client_secret"] == "rotated-client-secret"
+    assert get_service_client(secret) is first
+
+
 def test_get_service_client_value_error():
     # Arrange
     secret = None
@@ -362,6 +441,122 @@ def test_df_to_azure_storage_parquet(mock_io_to_azure_storage):
     pd.testing.assert_frame_equal(result_df, df)
 
 
+@patch("do_data_utils.azure.storage.io_to_azure_storage")
+def test_df_to_azure_storage_polars(mock_io_to_azure_storage):
+    # Arrange
+    df = pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+
+    # Act
+    df_to_azure_storage(
+        df, "test-container", "path/to/output.parquet", {"storage_account": "acc"}, row_group_size=1
+    )
+
+    # Assert
+    buffer = mock_io_to_azure_storage.call_args[1]["buffer"]
+    buffer.seek(0)
+    assert pq.ParquetFile(buffer).metadata.num_row_groups == 2
+    buffer.seek(0)
+    assert pl.read_parquet(buffer).equals(df)
+
+
+@pytest.mark.parametrize("to_pandas", [False, True])
+@patch("do_data_utils.azure.storage.io_to_azure_storage")
+def test_df_to_azure_storage_partitioned(mock_io_to_azure_storage, to_pandas):
+    # Arrange
+    df = pl.DataFrame(
+        {"year": [2024, 2024, 2025, 2025, 2025], "city": ["a b", "a b", "c", None, "c"], "value": [1, 2, 3, 4, 5]}
+    )
+    uploaded = {}
+    mock_io_to_azure_storage.side_effect = lambda buffer, dest_file_path, **kwargs: uploaded.update(
+        {dest_file_path: buffer.getvalue()}
+    )
+
+    # Act
+    df_to_azure_storage(
+        df.to_pandas() if to_pandas else df,
+        "test-container",
+        "path/to/sales",
+        {"storage_account": "acc"},
+        partition_cols=["year", "city"],
+        target_file_size=1,
+        row_group_size=1,
+    )
+
+    # Assert: one file per row group, as each one exceeds the target size
+    assert sorted(uploaded) == [
+        "path/to/sales/year=2024/city=a%20b/part-00000.parquet",
+        "path/to/sales/year=2024/city=a%20b/part-00001.parquet",
+        "path/to/sales/year=2025/city=__HIVE_DEFAULT_PARTITION__/part-00000.parquet",
+        "path/to/sales/year=2025/city=c/part-00000.parquet",
+        "path/to/sales/year=2025/city=c/part-00001.parquet",
+    ]
+    part = pl.read_parquet(io.BytesIO(uploaded["path/to/sales/year=2025/city=c/part-00001.parquet"]))
+    assert part.to_dict(as_series=False) == {"value": [5]}
+
+
+@pytest.mark.parametrize("polars", [False, True])
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+@patch("do_data_utils.azure.storage.azure_storage_list_files")
+@patch("do_data_utils.azure.storage.io_to_azure_storage")
+def test_df_to_azure_storage_partitioned_roundtrip(mock_io_to_azure_storage, mock_list_files, mock_to_io, polars):
+    # Arrange
+    df = pl.DataFrame(
+        {"value": [1, 2, 3, 4], "year": [2024, 2024, 2025, 2025], "city": ["a b", "c", None, "c"]}
+    )
+    uploaded = {}
+    mock_io_to_azure_storage.side_effect = lambda buffer, dest_file_path, **kwargs: uploaded.update(
+        {dest_file_path: buffer.getvalue()}
+    )
+    mock_list_files.side_effect = lambda *args, **kwargs: list(uploaded)
+    mock_to_io.side_effect = lambda file_path, **kwargs: io.BytesIO(uploaded[file_path])
+
+    # Act
+    df_to_azure_storage(df, "test-container", "path/to/sales/", {"storage_account": "acc"}, partition_cols=["year", "city"])
+    result = azure_storage_to_df("test-container", "path/to/sales/", {"storage_account": "acc"}, polars=polars)
+
+    # Assert: the partition columns come back from the directory names, with their values and types
+    if not polars:
+        result = pl.from_pandas(result)
+    assert result.sort("value").select(df.columns).equals(df)
+
+
+@pytest.mark.parametrize(
+    "files, base_dir, expected",
+    [
+        (["t/year=2024/a.parquet", "t/year=2025/b.parquet"], "t", {"year": [2024, 2025]}),
+        (["t/city=a%20b/a.parquet", "t/city=__HIVE_DEFAULT_PARTITION__/b.parquet"], "t/", {"city": ["a b", None]}),
+        (["t/code=01/a.parquet", "t/code=x/b.parquet"], "t", {"code": ["01", "x"]}),
+        (["env=prod/t/a.parquet"], "env=prod/t", {}),
+        (["t/a.parquet"], "t", {}),
+    ],
+)
+def test_hive_partitions(files, base_dir, expected):
+    result = _hive_partitions(files, base_dir)
+    assert {col: values.to_pylist() for col, values in result.items()} == expected
+
+
+@patch("do_data_utils.azure.storage.io_to_azure_storage")
+def test_df_to_azure_storage_directory(mock_io_to_azure_storage):
+    # Arrange
+    df = pd.DataFrame({"col1": range(10)})
+
+    # Act
+    df_to_azure_storage(df, "test-container", "path/to/dataset/", {"storage_account": "acc"})
+
+    # Assert
+    mock_io_to_azure_storage.assert_called_once()
+    assert mock_io_to_azure_storage.call_args[1]["dest_file_path"] == "path/to/dataset/part-00000.parquet"
+    result_df = pd.read_parquet(mock_io_to_azure_storage.call_args[1]["buffer"])
+    pd.testing.assert_frame_equal(result_df, df)
+
+
+def test_df_to_azure_storage_partitioned_missing_column():
+    with pytest.raises(KeyError):
+        df_to_azure_storage(
+            pd.DataFrame({"col1": [1]}), "test-container", "path/", {"storage_account": "acc"}, partition_cols=["x"]
+        )
+
+
 @patch("do_data_utils.azure.storage.azure_storage_to_io")
 def test_azure_storage_to_df_csv(mock_azure_storage_to_io):
     # Arrange
@@ -384,6 +579,27 @@ def test_azure_storage_to_df_csv(mock_azure_storage_to_io):
     pd.testing.assert_frame_equal(result_df, expected_df)
 
 
+@pytest.mark.parametrize("polars", [False, True])
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+def test_azure_storage_to_df_csv_reads_buffer(mock_azure_storage_to_io, polars):
+    # Arrange
+    buffer = io.BytesIO("col1,col2\n1,3\n2,4\n".encode())
+    mock_azure_storage_to_io.return_value = buffer
+    reader = "pl.read_csv" if polars else "pd.read_csv"
+
+    # Act
+    with patch(
+        f"do_data_utils.azure.storage.{reader}", return_value="df"
+    ) as mock_read_csv:
+        result = azure_storage_to_df(
+            "test-container", "path/to/input.csv", {"storage_account": "acc"}, polars=polars
+        )
+
+    # Assert: the downloaded buffer is parsed as is, not decoded into a copy
+    assert result == "df"
+    assert mock_read_csv.call_args.args[0] is buffer
+
+
 @patch("do_data_utils.azure.storage.azure_storage_to_io")
 def test_azure_storage_to_df_parquet(mock_azure_storage_to_io):
     # Arrange
@@ -406,3 +622,1014 @@ def test_azure_storage_to_df_parquet(mock_azure_storage_to_io):
 
     # Assert
     pd.testing.assert_frame_equal(result_df, input_df)
+
+
+def make_ranged_file_client(data: bytes):
+    mock_file_client = MagicMock()
+    mock_file_client.get_file_properties.return_value.size = len(data)
+    mock_file_client.get_file_properties.return_value.etag = '"0x8D0000000000001"'
+
+    def download_file(offset=None, length=None, etag=None, match_condition=None):
+        # Every range must be pinned to the version whose size was read
+        assert etag == '"0x8D0000000000001"'
+        assert match_condition == MatchConditions.IfNotModified
+        downloader = MagicMock()
+        downloader.readall.return_value = data[offset : offset + length]
+        return downloader
+
+    mock_file_client.download_file.side_effect = download_file
+    return mock_file_client
+
+
+@pytest.mark.parametrize(
+    "max_concurrency, chunk_size, n_ranges",
+    [(4, 10, 11), (1, 7, 15), (3, None, 1)],
+)
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_to_io_ranged(
+    mock_get_service_client, max_concurrency, chunk_size, n_ranges
+):
+    # Arrange
+    data = bytes(range(101))
+    mock_file_client = make_ranged_file_client(data)
+    mock_get_service_client.return_value.get_file_client.return_value = mock_file_client
+
+    # Act
+    result_buffer = azure_storage_to_io(
+        "test-container",
+        "test/path/file.bin",
+        storage_account_name="data_env",
+        max_concurrency=max_concurrency,
+        chunk_size=chunk_size,
+    )
+
+    # Assert
+    assert result_buffer.read() == data
+    assert mock_file_client.download_file.call_count == n_ranges
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_to_file_ranged(mock_get_service_client, tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    data = b"0123456789" * 100
+    mock_file_client = make_ranged_file_client(data)
+    mock_get_service_client.return_value.get_file_client.return_value = mock_file_client
+
+    # Act
+    azure_storage_to_file(
+        "test-container",
+        "path/to/snapshot.parquet",
+        storage_account_name="data_env",
+        max_concurrency=4,
+        chunk_size=64,
+    )
+
+    # Assert
+    assert (tmp_path / "snapshot.parquet").read_bytes() == data
+    assert mock_file_client.download_file.call_count == 16
+
+
+@pytest.mark.parametrize("max_concurrency, chunk_size", [(0, None), (2, 0)])
+def test_azure_storage_to_io_invalid_download_options(max_concurrency, chunk_size):
+    with pytest.raises(ValueError):
+        azure_storage_to_io(
+            "test-container",
+            "test/path/file.bin",
+            storage_account_name="data_env",
+            max_concurrency=max_concurrency,
+            chunk_size=chunk_size,
+        )
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_open(mock_get_service_client):
+    # Arrange
+    data = bytes(range(256)) * 4
+    mock_file_client = make_ranged_file_client(data)
+    mock_get_service_client.return_value.get_file_client.return_value = mock_file_client
+
+    # Act & Assert
+    with azure_storage_open(
+        "test-container", "path/to/file.bin", secret=None, storage_account_name="data_env", buffer_size=100
+    ) as f:
+        assert f.read(10) == data[:10]
+        assert f.seek(-24, io.SEEK_END) == 1000
+        assert f.read() == data[1000:]
+        assert f.read() == b""
+        f.seek(500)
+        assert f.tell() == 500
+        assert f.read(300) == data[500:800]
+
+    # Every download is pinned to the ETag seen at opening
+    etag = mock_file_client.get_file_properties.return_value.etag
+    assert all(c.kwargs["etag"] == etag for c in mock_file_client.download_file.call_args_list)
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_open_parquet_column_pruning(mock_get_service_client):
+    # Arrange
+    df = pd.DataFrame({f"col{i}": range(i, i + 20_000) for i in range(50)})
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False, compression=None)
+    data = buffer.getvalue()
+
+    mock_file_client = make_ranged_file_client(data)
+    mock_get_service_client.return_value.get_file_client.return_value = mock_file_client
+
+    # Act
+    with azure_storage_open(
+        "test-container", "path/to/wide.parquet", storage_account_name="data_env", buffer_size=64 * 1024
+    ) as f:
+        result = pd.read_parquet(f, columns=["col3"])
+
+    # Assert
+    pd.testing.assert_frame_equal(result, df[["col3"]])
+    fetched = sum(c.kwargs["length"] for c in mock_file_client.download_file.call_args_list)
+    assert fetched < len(data) / 20
+
+
+def test_azure_storage_open_invalid_mode():
+    with pytest.raises(ValueError):
+        azure_storage_open("test-container", "path/to/file.bin", mode="wb", storage_account_name="data_env")
+
+
+def parquet_bytes(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("polars", [False, True])
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+@patch("do_data_utils.azure.storage.azure_storage_list_files")
+def test_azure_storage_to_df_directory(mock_list_files, mock_to_io, polars):
+    # Arrange
+    parts = {
+        "table/part-1.parquet": pd.DataFrame({"col1": [3, 4], "col2": ["c", "d"]}),
+        "table/part-0.parquet": pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}),
+    }
+    mock_list_files.return_value = list(parts) + ["table/_SUCCESS"]
+    mock_to_io.side_effect = lambda file_path, **kwargs: io.BytesIO(parquet_bytes(parts[file_path]))
+
+    # Act
+    result = azure_storage_to_df("test-container", "table/", None, polars=polars, storage_account_name="data_env")
+
+    # Assert
+    mock_list_files.assert_called_once_with(
+        "test-container", "table/", secret=None, storage_account_name="data_env", recursive=True
+    )
+    assert mock_to_io.call_count == 2
+    expected = pd.DataFrame({"col1": [1, 2, 3, 4], "col2": ["a", "b", "c", "d"]})
+    if polars:
+        result = result.to_pandas()
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("polars", [False, True])
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+@patch("do_data_utils.azure.storage.azure_storage_list_files")
+def test_azure_storage_to_df_directory_mixed_formats(mock_list_files, mock_to_io, polars):
+    # Arrange
+    def part(col1: int) -> pd.DataFrame:
+        return pd.DataFrame({"col1": [col1], "col2": [f"value-{col1}"]})
+
+    parts = {
+        "table/part-0.parquet": parquet_bytes(part(0)),
+        "table/part-1.csv": part(1).to_csv(index=False).encode(),
+        "table/part-2.parquet": parquet_bytes(part(2)),
+        "table/part-3.parquet": parquet_bytes(part(3)),
+        "table/part-4.csv": part(4).to_csv(index=False).encode(),
+    }
+    mock_list_files.return_value = list(parts)
+    mock_to_io.side_effect = lambda file_path, **kwargs: io.BytesIO(parts[file_path])
+
+    # Act
+    result = azure_storage_to_df("test-container", "table/", None, polars=polars, storage_account_name="data_env")
+
+    # Assert: the rows keep the order of the files, whatever their format
+    assert list(result["col1"]) == [0, 1, 2, 3, 4]
+
+
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+@patch("do_data_utils.azure.storage.azure_storage_list_files")
+def test_azure_storage_to_df_glob_csv(mock_list_files, mock_to_io):
+    # Arrange
+    mock_list_files.return_value = [
+        "sales/2024-01/part-0.csv",
+        "sales/2024-01/part-0.parquet",
+        "sales/2024-02/part-0.csv",
+        "sales/2024-02/extra/part-0.csv",
+        "sales/2023-12/part-0.csv",
+    ]
+    mock_to_io.side_effect = lambda file_path, **kwargs: io.BytesIO(
+        f"path,value\n{file_path},1\n".encode()
+    )
+
+    # Act
+    result = azure_storage_to_df("test-container", "sales/2024-*/*.csv", None, storage_account_name="data_env")
+
+    # Assert
+    mock_list_files.assert_called_once_with(
+        "test-container", "sales", secret=None, storage_account_name="data_env", recursive=True
+    )
+    assert result["path"].tolist() == ["sales/2024-01/part-0.csv", "sales/2024-02/part-0.csv"]
+
+
+@pytest.mark.parametrize(
+    "path, pattern, expected",
+    [
+        ("a/b/c.parquet", "a/*/c.parquet", True),
+        ("a/b/x/c.parquet", "a/*/c.parquet", False),
+        ("a/b/x/c.parquet", "a/**/c.parquet", True),
+        ("a/c.parquet", "a/**/c.parquet", True),
+        ("a/b/c.csv", "a/b/*.parquet", False),
+        ("a/b/part-1.parquet", "a/b/part-[0-9].parquet", True),
+    ],
+)
+def test_glob_match(path, pattern, expected):
+    assert _glob_match(path.split("/"), pattern.split("/")) == expected
+
+
+@patch("do_data_utils.azure.storage.azure_storage_list_files")
+def test_azure_storage_to_df_no_files(mock_list_files):
+    mock_list_files.return_value = ["table/_SUCCESS"]
+    with pytest.raises(ValueError):
+        azure_storage_to_df("test-container", "table/", None, storage_account_name="data_env")
+
+
+@patch("do_data_utils.azure.storage.pl.scan_parquet")
+def test_azure_storage_scan_parquet(mock_scan_parquet):
+    # Arrange
+    secret = {
+        "tenant_id": "test-tenant-id",
+        "client_id": "test-client-id",
+        "client_secret": "test-client-secret",
+        "storage_account": "test-storage-account",
+    }
+
+    # Act
+    result = azure_storage_scan("test-container", "/path/to/events.parquet", secret, hive_partitioning=False)
+
+    # Assert
+    assert result == mock_scan_parquet.return_value
+    mock_scan_parquet.assert_called_once_with(
+        "abfss://test-container@test-storage-account.dfs.core.windows.net/path/to/events.parquet",
+        storage_options={
+            "account_name": "test-storage-account",
+            "tenant_id": "test-tenant-id",
+            "client_id": "test-client-id",
+            "client_secret": "test-client-secret",
+        },
+        hive_partitioning=False,
+    )
+
+
+@patch("do_data_utils.azure.storage.DefaultAzureCredential")
+@patch("do_data_utils.azure.storage.pl.scan_csv")
+def test_azure_storage_to_df_lazy_csv_directory(mock_scan_csv, mock_default_cred):
+    # Arrange
+    mock_default_cred.return_value.get_token.return_value.token = "test-token"
+
+    # Act
+    result = azure_storage_to_df(
+        "test-container", "path/to/table/", None, storage_account_name="data_env", lazy=True, file_format="csv"
+    )
+
+    # Assert
+    assert result == mock_scan_csv.return_value
+    mock_default_cred.return_value.get_token.assert_called_once_with("https://storage.azure.com/.default")
+    mock_scan_csv.assert_called_once_with(
+        "abfss://test-container@data_env.dfs.core.windows.net/path/to/table/**/*.csv",
+        storage_options={"account_name": "data_env", "bearer_token": "test-token"},
+    )
+
+
+@pytest.mark.parametrize("file_path, file_format", [("path/to/file.json", None), ("path/to/table/", None)])
+def test_azure_storage_scan_invalid_format(file_path, file_format):
+    with pytest.raises(ValueError):
+        azure_storage_scan("test-container", file_path, storage_account_name="data_env", file_format=file_format)
+
+
+class FakeAppendFileClient:
+    """Records the appends to a temporary Azure storage file, committed when it is renamed onto the target.
+
+    `files` holds the content of the targets, as "{container}/{path}" to bytes.
+    """
+
+    def __init__(self, files=None):
+        self.files = {} if files is None else files
+        self.appends = {}
+        self.flushed = None
+        self.committed = None
+        self.create_kwargs = None
+        self.rename_kwargs = None
+        self.deleted = False
+
+    def create_file(self, **kwargs):
+        self.create_kwargs = kwargs
+
+    def append_data(self, data, offset, length=None):
+        assert len(data) == length
+        self.appends[offset] = data
+
+    def flush_data(self, offset):
+        data = b"".join(self.appends[key] for key in sorted(self.appends))
+        assert len(data) == offset
+        self.flushed = data
+
+    def rename_file(self, new_name, **kwargs):
+        if kwargs.get("match_condition") == MatchConditions.IfMissing and new_name in self.files:
+            raise ResourceExistsError("The specified path already exists.")
+        self.rename_kwargs = kwargs
+        self.files[new_name] = self.committed = self.flushed
+
+    def delete_file(self):
+        self.deleted = True
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_writer(mock_get_service_client):
+    # Arrange
+    file_client = FakeAppendFileClient()
+    mock_get_service_client.return_value.get_file_client.return_value = file_client
+
+    # Act
+    with azure_storage_writer(
+        "test-container", "path/to/output.csv", secret={"storage_account": "acc"}, max_concurrency=3, chunk_size=4
+    ) as f:
+        f.write(b"col1,")
+        f.write(b"col2\n1,3\n")
+        assert f.tell() == 14
+
+    # Assert: written to a hidden file next to the target, then renamed onto it
+    temp_file_path = mock_get_service_client.return_value.get_file_client.call_args.kwargs["file_path"]
+    assert re.fullmatch(r"path/to/\.output\.csv\.[0-9a-f]{32}\.tmp", temp_file_path)
+    assert file_client.create_kwargs == {}
+    assert sorted(file_client.appends) == [0, 4, 8, 12]
+    assert file_client.rename_kwargs == {}
+    assert file_client.files == {"test-container/path/to/output.csv": b"col1,col2\n1,3\n"}
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_writer_error_not_committed(mock_get_service_client):
+    # Arrange
+    file_client = FakeAppendFileClient()
+    mock_get_service_client.return_value.get_file_client.return_value = file_client
+
+    # Act
+    with pytest.raises(RuntimeError):
+        with azure_storage_writer(
+            "test-container", "path/to/output.csv", secret={"storage_account": "acc"}, overwrite=False
+        ) as f:
+            f.write(b"partial")
+            raise RuntimeError("export failed")
+
+    # Assert
+    assert file_client.committed is None
+    assert file_client.deleted
+
+
+@pytest.mark.parametrize("overwrite", [True, False])
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_writer_keeps_existing_file(mock_get_service_client, overwrite):
+    # Arrange
+    file_client = FakeAppendFileClient({"test-container/path/to/output.csv": b"original"})
+    mock_get_service_client.return_value.get_file_client.return_value = file_client
+
+    # Act: an aborted overwrite, or a write without overwrite onto an existing file
+    with pytest.raises(RuntimeError if overwrite else ResourceExistsError):
+        with azure_storage_writer(
+            "test-container", "path/to/output.csv", secret={"storage_account": "acc"}, overwrite=overwrite
+        ) as f:
+            f.write(b"partial")
+            if overwrite:
+                raise RuntimeError("export failed")
+
+    # Assert: the target keeps its content, and the temporary file is deleted
+    assert file_client.files == {"test-container/path/to/output.csv": b"original"}
+    assert file_client.deleted
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_writer_dropped_not_committed(mock_get_service_client):
+    # Arrange
+    file_client = FakeAppendFileClient()
+    mock_get_service_client.return_value.get_file_client.return_value = file_client
+    f = azure_storage_writer("test-container", "path/to/output.csv", secret={"storage_account": "acc"}, chunk_size=4)
+    f.write(b"partial")
+
+    # Act: the writer is garbage-collected without `close()`
+    del f
+    gc.collect()
+
+    # Assert
+    assert file_client.appends == {0: b"part"}
+    assert file_client.committed is None
+    assert file_client.deleted
+
+
+@pytest.mark.parametrize("file_path", ["path/to/output.csv", "path/to/output.parquet"])
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_df_to_azure_storage_chunked(mock_get_service_client, file_path):
+    # Arrange
+    file_client = FakeAppendFileClient()
+    mock_get_service_client.return_value.get_file_client.return_value = file_client
+    df = pd.DataFrame({"col1": range(1000), "col2": ["ก"] * 1000})
+
+    # Act
+    df_to_azure_storage(
+        df, "test-container", file_path, {"storage_account": "acc"}, max_concurrency=4, chunk_size=1000
+    )
+
+    # Assert
+    assert len(file_client.appends) > 1
+    if file_path.endswith(".csv"):
+        result_df = pd.read_csv(io.BytesIO(file_client.committed))
+    else:
+        result_df = pd.read_parquet(io.BytesIO(file_client.committed))
+    pd.testing.assert_frame_equal(result_df, df)
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_io_to_azure_storage_chunked(mock_get_service_client):
+    # Arrange
+    mock_file_client = mock_get_service_client.return_value.get_file_client.return_value
+    buffer = io.BytesIO(b"data")
+
+    # Act
+    io_to_azure_storage(buffer, "test-container", "path/to/file.bin", {"storage_account": "acc"}, max_concurrency=4)
+
+    # Assert
+    mock_file_client.upload_data.assert_called_once_with(
+        buffer, overwrite=True, max_concurrency=4, chunk_size=8 * 1024 * 1024
+    )
+
+
+@patch("do_data_utils.azure.storage.azure_storage_list_files")
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_download_folder_azure(mock_get_service_client, mock_list_files, tmp_path):
+    # Arrange
+    contents = {"models/v3/model.bin": b"weights", "models/v3/conf/params.json": b"{}"}
+    mock_list_files.return_value = list(contents)
+
+    def get_file_client(file_system, file_path):
+        file_client = MagicMock()
+        file_client.download_file.return_value.readinto.side_effect = lambda f: f.write(contents[file_path])
+        return file_client
+
+    mock_get_service_client.return_value.get_file_client.side_effect = get_file_client
+
+    # Act
+    download_folder_azure("test-container", "/models/v3", str(tmp_path / "out"), {"storage_account": "acc"})
+
+    # Assert
+    mock_list_files.assert_called_once_with(
+        "test-container", "models/v3/", {"storage_account": "acc"}, storage_account_name=None
+    )
+    assert (tmp_path / "out" / "model.bin").read_bytes() == b"weights"
+    assert (tmp_path / "out" / "conf" / "params.json").read_bytes() == b"{}"
+
+
+@patch("do_data_utils.azure.storage.azure_storage_list_files")
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_download_folder_azure_ranged(mock_get_service_client, mock_list_files, tmp_path):
+    # Arrange
+    data = bytes(range(100))
+    mock_list_files.return_value = ["models/v3/model.bin"]
+    mock_file_client = make_ranged_file_client(data)
+    mock_get_service_client.return_value.get_file_client.return_value = mock_file_client
+
+    # Act
+    download_folder_azure(
+        "test-container", "models/v3", str(tmp_path), {"storage_account": "acc"}, max_concurrency=4, chunk_size=40
+    )
+
+    # Assert: `download_file()` takes no `chunk_size`, the ranges are requested one by one
+    assert (tmp_path / "model.bin").read_bytes() == data
+    assert sorted(mock_file_client.download_file.call_args_list, key=lambda c: c.kwargs["offset"]) == [
+        call(offset=offset, length=length, etag='"0x8D0000000000001"', match_condition=MatchConditions.IfNotModified)
+        for offset, length in [(0, 40), (40, 40), (80, 20)]
+    ]
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_upload_folder_azure(mock_get_service_client, tmp_path):
+    # Arrange
+    (tmp_path / "conf").mkdir()
+    (tmp_path / "model.bin").write_bytes(b"weights")
+    (tmp_path / "conf" / "params.json").write_bytes(b"{}")
+    uploaded = {}
+
+    def get_file_client(file_system, file_path):
+        file_client = MagicMock()
+        file_client.upload_data.side_effect = lambda f, **kwargs: uploaded.update({file_path: (f.read(), kwargs)})
+        return file_client
+
+    mock_get_service_client.return_value.get_file_client.side_effect = get_file_client
+
+    # Act
+    upload_folder_azure(
+        str(tmp_path), "test-container", "models/v3", {"storage_account": "acc"}, max_concurrency=2, chunk_size=4
+    )
+
+    # Assert
+    chunked = {"overwrite": True, "max_concurrency": 2, "chunk_size": 4}
+    assert uploaded == {
+        "models/v3/model.bin": (b"weights", chunked),
+        "models/v3/conf/params.json": (b"{}", chunked),
+    }
+
+
+class FakeFileSystem:
+    """An in-memory Azure storage container, with an ETag per file version.
+
+    Like the service, the ETags are quoted in the response headers, but not in the listing of `get_paths()`.
+    """
+
+    def __init__(self, files):
+        self.files = {}
+        self.transfers = []
+        for name, data in files.items():
+            self.put(name, data)
+
+    def put(self, name, data):
+        self.files[name] = (data, f"etag-{len(self.transfers)}-{name}")
+
+    def get_paths(self, path, recursive):
+        for name, (data, etag) in sorted(self.files.items()):
+            if name.startswith(path):
+                path_properties = MagicMock(
+                    is_directory=False, etag=etag, content_length=len(data), last_modified=None
+                )
+                path_properties.name = name  # MagicMock(name=...) would name the mock itself
+                yield path_properties
+
+    def get_file_client(self, file_system, file_path):
+        file_client = MagicMock()
+
+        # No `chunk_size`: the SDK passes unknown keyword arguments down to the transport, which rejects them
+        def download_file(offset=None, length=None, etag=None, match_condition=None, max_concurrency=1):
+            self.transfers.append(file_path)
+            data, current_etag = self.files[file_path]
+            if etag is not None:
+                assert match_condition == MatchConditions.IfNotModified and etag == f'"{current_etag}"'
+            if offset is not None:
+                data = data[offset : offset + length]
+            downloader = MagicMock()
+            downloader.readinto.side_effect = lambda f: f.write(data)
+            downloader.readall.return_value = data
+            downloader.properties.etag = f'"{current_etag}"'
+            return downloader
+
+        def get_file_properties():
+            data, etag = self.files[file_path]
+            return MagicMock(size=len(data), etag=f'"{etag}"')
+
+        def upload_data(f, overwrite, **kwargs):
+            self.transfers.append(file_path)
+            self.put(file_path, f.read())
+            return {"etag": f'"{self.files[file_path][1]}"'}
+
+        file_client.download_file.side_effect = download_file
+        file_client.get_file_properties.side_effect = get_file_properties
+        file_client.upload_data.side_effect = upload_data
+        return file_client
+
+
+def make_fake_service_client(file_system):
+    service_client = MagicMock()
+    service_client.get_file_system_client.return_value = file_system
+    service_client.get_file_client.side_effect = file_system.get_file_client
+    return service_client
+
+
+@pytest.fixture
+def fake_file_system():
+    file_system = FakeFileSystem({"models/a.bin": b"aaa", "models/sub/b.json": b"{}", "other/c.txt": b"c"})
+    with patch(
+        "do_data_utils.azure.storage.get_service_client", return_value=make_fake_service_client(file_system)
+    ):
+        yield file_system
+
+
+def test_azure_storage_sync_download(fake_file_system, tmp_path):
+    secret = {"storage_account": "acc"}
+
+    # First sync downloads everything
+    result = azure_storage_sync("test-container", "models", str(tmp_path), secret=secret)
+    assert sorted(result) == ["a.bin", "sub/b.json"]
+    assert (tmp_path / "sub" / "b.json").read_bytes() == b"{}"
+
+    # Nothing changed
+    assert azure_storage_sync("test-container", "models", str(tmp_path), secret=secret) == []
+
+    # A remote file changed, and a local file was modified
+    fake_file_system.put("models/a.bin", b"new")
+    (tmp_path / "sub" / "b.json").write_bytes(b'{"edited": 1}')
+    result = azure_storage_sync("test-container", "models", str(tmp_path), secret=secret)
+    assert sorted(result) == ["a.bin", "sub/b.json"]
+    assert (tmp_path / "a.bin").read_bytes() == b"new"
+    assert (tmp_path / "sub" / "b.json").read_bytes() == b"{}"
+
+
+def test_azure_storage_sync_download_ranged(fake_file_system, tmp_path):
+    # Arrange
+    fake_file_system.put("models/big.bin", bytes(range(100)))
+    secret = {"storage_account": "acc"}
+
+    # Act
+    result = azure_storage_sync("test-container", "models", str(tmp_path), secret=secret, max_concurrency=4, chunk_size=16)
+
+    # Assert
+    assert sorted(result) == ["a.bin", "big.bin", "sub/b.json"]
+    assert (tmp_path / "big.bin").read_bytes() == bytes(range(100))
+    assert azure_storage_sync("test-container", "models", str(tmp_path), secret=secret, max_concurrency=4) == []
+
+
+def test_azure_storage_sync_etag_quotes(fake_file_system, tmp_path):
+    # A manifest written before the ETags were normalized has the quoted ETags of the headers
+    secret = {"storage_account": "acc"}
+    azure_storage_sync("test-container", "models", str(tmp_path), secret=secret)
+    manifest_path = tmp_path / ".azure_sync_manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    assert manifest["a.bin"]["etag"] == "etag-0-models/a.bin"
+
+    manifest["a.bin"]["etag"] = '"etag-0-models/a.bin"'
+    manifest_path.write_text(json.dumps(manifest))
+
+    # The quoted and the unquoted ETag of the listing are the same version
+    assert azure_storage_sync("test-container", "models", str(tmp_path), secret=secret) == []
+
+
+def test_azure_storage_sync_upload(fake_file_system, tmp_path):
+    secret = {"storage_account": "acc"}
+    local_dir = tmp_path / "exports"
+    local_dir.mkdir()
+    (local_dir / "day1.csv").write_bytes(b"1")
+    (local_dir / "day2.csv").write_bytes(b"2")
+    manifest_path = str(tmp_path / "manifest.json")
+
+    # First sync uploads everything
+    result = azure_storage_sync(
+        "test-container", "exports/", str(local_dir), "upload", secret=secret, manifest_path=manifest_path
+    )
+    assert sorted(result) == ["day1.csv", "day2.csv"]
+    assert fake_file_system.files["exports/day2.csv"][0] == b"2"
+
+    # Only the new file is uploaded
+    (local_dir / "day3.csv").write_bytes(b"3")
+    result = azure_storage_sync(
+        "test-container", "exports/", str(local_dir), "upload", secret=secret, manifest_path=manifest_path
+    )
+    assert result == ["day3.csv"]
+
+    # A remote file replaced by someone else is uploaded again
+    fake_file_system.put("exports/day1.csv", b"other")
+    result = azure_storage_sync(
+        "test-container", "exports/", str(local_dir), "upload", secret=secret, manifest_path=manifest_path
+    )
+    assert result == ["day1.csv"]
+    assert fake_file_system.files["exports/day1.csv"][0] == b"1"
+
+
+def test_azure_storage_sync_invalid_direction():
+    with pytest.raises(ValueError):
+        azure_storage_sync("test-container", "models", "local", direction="both")
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_iter_paths(mock_get_service_client):
+    # Arrange
+    mock_file_system_client = mock_get_service_client.return_value.get_file_system_client.return_value
+    listed = []
+    for name, is_directory, size, day in [
+        ("landing/2024", True, None, 1),
+        ("landing/2024/a.parquet", False, 10, 1),
+        ("landing/2024/b.parquet", False, 20, 5),
+        ("landing/2024/b.csv", False, 30, 5),
+    ]:
+        path = MagicMock(
+            is_directory=is_directory,
+            content_length=size,
+            last_modified=datetime(2024, 1, day, tzinfo=timezone.utc),
+            etag=f"etag-{name}",
+        )
+        path.name = name
+        listed.append(path)
+
+    def get_paths(**kwargs):
+        # The paths are pulled one at a time, as the caller iterates
+        for path in listed:
+            yield path
+
+    mock_file_system_client.get_paths.side_effect = get_paths
+
+    # Act
+    all_paths = list(azure_storage_iter_paths("test-container", "landing", files_only=False, max_results=2))
+    filtered = list(
+        azure_storage_iter_paths("test-container", "landing", suffix=".parquet", modified_since=datetime(2024, 1, 3))
+    )
+
+    # Assert
+    mock_file_system_client.get_paths.assert_called_with(path="landing/", recursive=True, max_results=5000)
+    assert mock_file_system_client.get_paths.call_args_list[0].kwargs["max_results"] == 2
+    assert [path.name for path in all_paths] == [path.name for path in listed]
+    assert all_paths[0].is_directory and all_paths[0].size is None
+    assert filtered == [
+        AzureStoragePath(
+            name="landing/2024/b.parquet",
+            is_directory=False,
+            size=20,
+            last_modified=datetime(2024, 1, 5, tzinfo=timezone.utc),
+            etag="etag-landing/2024/b.parquet",
+        )
+    ]
+
+
+def test_azure_storage_iter_paths_invalid_max_results():
+    with pytest.raises(ValueError):
+        azure_storage_iter_paths("test-container", "landing", max_results=0)
+
+
+def make_delete_service_client(directories=(), missing=()):
+    """A service client over paths that are files unless in `directories`, recording the deletes."""
+
+    service_client = MagicMock()
+    deleted = []
+
+    def get_file_client(file_system, file_path):
+        file_client = MagicMock()
+        if file_path in missing:
+            file_client.get_file_properties.side_effect = Exception("The specified path does not exist.")
+        metadata = {"hdi_isfolder": "true"} if file_path in directories else {}
+        file_client.get_file_properties.return_value = {"metadata": metadata}
+        file_client.delete_file.side_effect = lambda: deleted.append(("file", file_path))
+        return file_client
+
+    def get_directory_client(file_system, directory):
+        dir_client = MagicMock()
+        dir_client.delete_directory.side_effect = lambda: deleted.append(("directory", directory))
+        return dir_client
+
+    service_client.get_file_client.side_effect = get_file_client
+    service_client.get_directory_client.side_effect = get_directory_client
+    return service_client, deleted
+
+
+@pytest.mark.parametrize(
+    "path, directories, expected",
+    [
+        ("path/to/file.csv", (), ("file", "path/to/file.csv")),
+        ("path/to/dir/", ("path/to/dir",), ("directory", "path/to/dir")),
+    ],
+)
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_delete_path(mock_get_service_client, path, directories, expected):
+    # Arrange
+    mock_get_service_client.return_value, deleted = make_delete_service_client(directories)
+
+    # Act
+    azure_storage_delete_path("test-container", path, {"storage_account": "acc"})
+
+    # Assert: a file goes through the file client, a directory through the directory client
+    assert deleted == [expected]
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_delete_paths(mock_get_service_client):
+    # Arrange
+    mock_get_service_client.return_value, deleted = make_delete_service_client(
+        directories=("tmp/run_42",), missing=("tmp/missing.csv",)
+    )
+
+    # Act
+    results = azure_storage_delete_paths(
+        "test-container", ["tmp/a.csv", "tmp/missing.csv", "tmp/run_42"], secret={"storage_account": "acc"}
+    )
+
+    # Assert
+    assert results == {"tmp/a.csv": None, "tmp/missing.csv": "The specified path does not exist.", "tmp/run_42": None}
+    assert sorted(deleted) == [("directory", "tmp/run_42"), ("file", "tmp/a.csv")]
+
+
+@patch("do_data_utils.azure.storage.azure_storage_iter_paths")
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_delete_paths_prefix(mock_get_service_client, mock_iter_paths):
+    # Arrange
+    mock_service_client, deleted = make_delete_service_client(directories=("landing/old",))
+    mock_get_service_client.return_value = mock_service_client
+    mock_iter_paths.return_value = iter(
+        [AzureStoragePath("landing/a.json", False, 1, None, "etag-a"), AzureStoragePath("landing/b.json", False, 1, None, "etag-b")]
+    )
+
+    # Act
+    whole = azure_storage_delete_paths("test-container", prefix="landing/old")
+    filtered = azure_storage_delete_paths("test-container", prefix="landing", suffix=".json")
+
+    # Assert: the listed files are deleted as files, without looking them up
+    assert whole == {"landing/old": None}
+    assert filtered == {"landing/a.json": None, "landing/b.json": None}
+    mock_iter_paths.assert_called_once_with(
+        "test-container", "landing", None, storage_account_name=None, suffix=".json", modified_before=None
+    )
+    assert sorted(deleted) == [("directory", "landing/old"), ("file", "landing/a.json"), ("file", "landing/b.json")]
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_delete_paths_modified_before(mock_get_service_client):
+    # Arrange
+    mock_service_client, deleted = make_delete_service_client()
+    mock_get_service_client.return_value = mock_service_client
+    listed = []
+    for name, day in [("landing/old.json", 1), ("landing/cutoff.json", 3), ("landing/new.json", 5)]:
+        path = MagicMock(is_directory=False, content_length=1, last_modified=datetime(2024, 1, day, tzinfo=timezone.utc))
+        path.name = name
+        listed.append(path)
+    mock_service_client.get_file_system_client.return_value.get_paths.return_value = iter(listed)
+
+    # Act: a naive datetime is taken as UTC
+    results = azure_storage_delete_paths("test-container", prefix="landing", modified_before=datetime(2024, 1, 3))
+
+    # Assert: only the files older than the cutoff are deleted, the recent ones are kept
+    assert results == {"landing/old.json": None}
+    assert deleted == [("file", "landing/old.json")]
+
+
+def test_azure_storage_delete_paths_invalid_arguments():
+    with pytest.raises(ValueError):
+        azure_storage_delete_paths("test-container")
+
+    with pytest.raises(ValueError):
+        azure_storage_delete_paths("test-container", ["a"], prefix="b")
+
+    with pytest.raises(ValueError):
+        azure_storage_delete_paths("test-container", ["a"], suffix=".csv")
+
+    with pytest.raises(ValueError):
+        azure_storage_delete_paths("test-container", ["a"], modified_before=datetime(2024, 1, 1))
+
+
+class FakeVersionedFileClient:
+    """An Azure storage file answering the conditional downloads like the service does."""
+
+    def __init__(self, data, etag):
+        self.data = data
+        self.etag = etag
+        self.num_downloads = 0  # Downloads transferring the content
+
+    def download_file(self, etag=None, match_condition=None, **kwargs):
+        if match_condition == MatchConditions.IfModified and etag == self.etag:
+            raise ResourceNotModifiedError("Not modified")
+
+        self.num_downloads += 1
+        downloader = MagicMock()
+        downloader.readall.return_value = self.data
+        downloader.properties.etag = self.etag
+        return downloader
+
+
+@pytest.fixture
+def azure_storage_cache(tmp_path):
+    set_azure_storage_cache(str(tmp_path / "cache"), max_size=60)
+    yield tmp_path / "cache"
+    set_azure_storage_cache(None)
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_to_io_cached(mock_get_service_client, azure_storage_cache):
+    # Arrange
+    file_client = FakeVersionedFileClient(b'{"a": 1}', "etag-1")
+    mock_get_service_client.return_value.get_file_client.return_value = file_client
+    secret = {"storage_account": "acc"}
+
+    # Act & Assert: downloaded once, then read from the cache while the ETag is unchanged
+    assert azure_storage_to_io("test-container", "ref/a.json", secret).read() == b'{"a": 1}'
+    assert azure_storage_to_io("test-container", "ref/a.json", secret).read() == b'{"a": 1}'
+    assert azure_storage_to_dict("test-container", "ref/a.json", secret) == {"a": 1}
+    assert file_client.num_downloads == 1
+
+    # The file changed
+    file_client.data, file_client.etag = b'{"a": 2}', "etag-2"
+    assert azure_storage_to_io("test-container", "ref/a.json", secret).read() == b'{"a": 2}'
+    assert azure_storage_to_io("test-container", "ref/a.json", secret).read() == b'{"a": 2}'
+    assert file_client.num_downloads == 2
+
+    # Cleared
+    clear_azure_storage_cache()
+    assert list(azure_storage_cache.iterdir()) == []
+
+
+@patch("do_data_utils.azure.storage.get_service_client")
+def test_azure_storage_to_io_cache_eviction(mock_get_service_client, azure_storage_cache):
+    # Arrange: each cached copy is about 45 bytes, the cache holds 60
+    file_clients = {
+        path: FakeVersionedFileClient(path.encode() * 4, f"etag-{path}") for path in ["a.bin", "b.bin", "c.bin"]
+    }
+    mock_get_service_client.return_value.get_file_client.side_effect = lambda file_system, file_path: file_clients[
+        file_path
+    ]
+    secret = {"storage_account": "acc"}
+
+    # Act
+    azure_storage_to_io("test-container", "a.bin", secret)
+    azure_storage_to_io("test-container", "b.bin", secret)  # Evicts a.bin
+    azure_storage_to_io("test-container", "b.bin", secret)
+    azure_storage_to_io("test-container", "a.bin", secret)  # Downloaded again, evicts b.bin
+    azure_storage_to_io("test-container", "a.bin", secret)
+
+    # Assert
+    assert {path: client.num_downloads for path, client in file_clients.items()} == {
+        "a.bin": 2,
+        "b.bin": 1,
+        "c.bin": 0,
+    }
+    assert len(list(azure_storage_cache.iterdir())) == 1
+
+
+@pytest.mark.parametrize("polars", [False, True])
+@patch("do_data_utils.azure.storage.io_to_azure_storage")
+def test_df_to_azure_storage_csv_gz(mock_io_to_azure_storage, polars):
+    # Arrange
+    df = pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+
+    # Act
+    df_to_azure_storage(
+        df if polars else df.to_pandas(), "test-container", "path/to/output.csv.gz", {"storage_account": "acc"}
+    )
+
+    # Assert
+    buffer = mock_io_to_azure_storage.call_args[1]["buffer"]
+    assert gzip.decompress(buffer.getvalue()) == b"col1,col2\n1,a\n2,b\n"
+
+
+@pytest.mark.parametrize("polars", [False, True])
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+def test_azure_storage_to_df_csv_gz(mock_azure_storage_to_io, polars):
+    # Arrange
+    mock_azure_storage_to_io.return_value = io.BytesIO(gzip.compress(b"col1,col2\n1,3\n2,4\n"))
+
+    # Act
+    result_df = azure_storage_to_df("test-container", "path/to/input.csv.gz", {"storage_account": "acc"}, polars=polars)
+
+    # Assert
+    assert result_df.shape == (2, 2)
+    assert list(result_df["col2"]) == [3, 4]
+
+
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+def test_azure_storage_to_dict_compressed(mock_azure_storage_to_io):
+    # Arrange
+    mock_azure_storage_to_io.side_effect = [
+        io.BytesIO(gzip.compress(b'{"a": [1, 2]}')),
+        io.BytesIO(gzip.compress(b'{"id": 1}\n{"id": 2}\n\n')),
+    ]
+
+    # Act & Assert
+    assert azure_storage_to_dict("test-container", "config.json.gz", {"storage_account": "acc"}) == {"a": [1, 2]}
+    assert azure_storage_to_dict("test-container", "events.jsonl.gz", {"storage_account": "acc"}) == [
+        {"id": 1},
+        {"id": 2},
+    ]
+
+
+@patch("do_data_utils.azure.storage.io_to_azure_storage")
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+def test_zstd_roundtrip(mock_azure_storage_to_io, mock_io_to_azure_storage):
+    pytest.importorskip("zstandard")
+
+    # Arrange
+    df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+
+    # Act
+    df_to_azure_storage(df, "test-container", "path/to/output.csv.zst", {"storage_account": "acc"})
+    mock_azure_storage_to_io.return_value = mock_io_to_azure_storage.call_args[1]["buffer"]
+    mock_azure_storage_to_io.return_value.seek(0)
+    result_df = azure_storage_to_df("test-container", "path/to/output.csv.zst", {"storage_account": "acc"})
+
+    # Assert
+    pd.testing.assert_frame_equal(result_df, df)
+
+
+@patch("do_data_utils.azure.storage.azure_storage_to_io")
+def test_azure_storage_to_dict_zstd_missing(mock_azure_storage_to_io):
+    mock_azure_storage_to_io.return_value = io.BytesIO(b"")
+    with patch.dict("sys.modules", {"zstandard": None}):
+        with pytest.raises(ImportError, match="zstandard"):
+            azure_storage_to_dict("test-container", "events.jsonl.zst", {"storage_account": "acc"})
+
+
+@pytest.mark.parametrize("polars", [False, True])
+@patch("do_data_utils.azure.storage.io_to_azure_storage")
+def test_df_to_azure_storage_zstd_missing(mock_io_to_azure_storage, polars):
+    df = pd.DataFrame({"col1": [1, 2]})
+    with patch.dict("sys.modules", {"zstandard": None}):
+        with pytest.raises(ImportError, match="do-data-utils\\[zstd\\]"):
+            df_to_azure_storage(
+                pl.from_pandas(df) if polars else df, "test-container", "out.csv.zst", {"storage_account": "acc"}
+            )
+
+
+def test_azure_storage_to_df_unsupported_compression():
+    with pytest.raises(ValueError):
+        azure_storage_to_df("test-container", "path/to/input.parquet.gz", {"storage_account": "acc"})
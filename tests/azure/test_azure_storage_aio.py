@@ -0,0 +1,145 @@
+import asyncio
+import io
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from do_data_utils.azure import (
+    azure_storage_delete_path_async,
+    azure_storage_list_files_async,
+    azure_storage_to_io_async,
+    close_async_clients,
+    io_to_azure_storage_async,
+)
+
+
+secret = {
+    "tenant_id": "test-tenant-id",
+    "client_id": "test-client-id",
+    "client_secret": "test-client-secret",
+    "storage_account": "test-storage-account",
+}
+
+
+@pytest.fixture
+def mock_transport():
+    transport = MagicMock()
+    transport.session.close = AsyncMock()
+    with patch("do_data_utils.azure.storage_aio._new_transport", return_value=transport) as mock_new_transport:
+        yield mock_new_transport
+
+
+@pytest.fixture
+def mock_service_client_class():
+    with patch("do_data_utils.azure.storage_aio.DataLakeServiceClient") as mock_class, patch(
+        "do_data_utils.azure.storage_aio.ClientSecretCredential"
+    ) as mock_credential_class:
+        mock_class.return_value.close = AsyncMock()
+        mock_credential_class.return_value.close = AsyncMock()
+        yield mock_class
+
+
+def run(coroutine):
+    """Runs a coroutine in a new event loop, then closes the async clients of that loop."""
+
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            await close_async_clients()
+
+    return asyncio.run(main())
+
+
+def test_shared_session_and_clients(mock_transport, mock_service_client_class):
+    # Arrange
+    mock_file_client = mock_service_client_class.return_value.get_file_client.return_value
+    mock_file_client.download_file = AsyncMock()
+    mock_file_client.download_file.return_value.readall = AsyncMock(return_value=b"data")
+
+    # Act: many concurrent downloads
+    async def download_all():
+        return await asyncio.gather(
+            *(azure_storage_to_io_async("test-container", f"path/{i}.bin", secret) for i in range(50))
+        )
+
+    buffers = run(download_all())
+
+    # Assert: one session and one client for all of them, closed at the end
+    assert [buffer.read() for buffer in buffers] == [b"data"] * 50
+    mock_transport.assert_called_once()
+    mock_service_client_class.assert_called_once()
+    assert mock_service_client_class.call_args.kwargs["transport"] is mock_transport.return_value
+    mock_service_client_class.return_value.close.assert_awaited_once()
+    mock_transport.return_value.session.close.assert_awaited_once()
+
+
+def test_io_to_azure_storage_async(mock_transport, mock_service_client_class):
+    # Arrange
+    mock_service_client = mock_service_client_class.return_value
+    mock_file_client = mock_service_client.get_file_client.return_value
+    mock_file_client.upload_data = AsyncMock()
+    buffer = io.BytesIO(b"data")
+    buffer.read()
+
+    # Act
+    run(io_to_azure_storage_async(buffer, "test-container", "/path/to/file.bin", secret))
+
+    # Assert
+    mock_service_client.get_file_client.assert_called_once_with(file_system="test-container", file_path="path/to/file.bin")
+    mock_file_client.upload_data.assert_awaited_once_with(buffer, overwrite=True)
+    assert buffer.tell() == 0
+
+
+def test_azure_storage_list_files_async(mock_transport, mock_service_client_class):
+    # Arrange
+    mock_file_system_client = mock_service_client_class.return_value.get_file_system_client.return_value
+    listed = []
+    for name, is_directory in [("dir/a.csv", False), ("dir/sub", True), ("dir/sub/b.csv", False)]:
+        path = MagicMock(is_directory=is_directory)
+        path.name = name
+        listed.append(path)
+
+    async def get_paths(**kwargs):
+        for path in listed:
+            yield path
+
+    mock_file_system_client.get_paths.side_effect = get_paths
+
+    # Act
+    result = run(azure_storage_list_files_async("test-container", "dir", secret))
+
+    # Assert
+    mock_file_system_client.get_paths.assert_called_once_with(path="dir/", recursive=True)
+    assert result == ["dir/a.csv", "dir/sub/b.csv"]
+
+
+@pytest.mark.parametrize("is_directory", [True, False])
+def test_azure_storage_delete_path_async(mock_transport, mock_service_client_class, is_directory):
+    # Arrange
+    mock_service_client = mock_service_client_class.return_value
+    mock_file_client = mock_service_client.get_file_client.return_value
+    mock_file_client.get_file_properties = AsyncMock(
+        return_value={"metadata": {"hdi_isfolder": "true"} if is_directory else {}}
+    )
+    mock_file_client.delete_file = AsyncMock()
+    mock_service_client.get_directory_client.return_value.delete_directory = AsyncMock()
+
+    # Act
+    run(azure_storage_delete_path_async("test-container", "path/to/dir/", secret))
+
+    # Assert
+    mock_service_client.get_file_client.assert_called_once_with(file_system="test-container", file_path="path/to/dir")
+    if is_directory:
+        mock_service_client.get_directory_client.assert_called_once_with(
+            file_system="test-container", directory="path/to/dir"
+        )
+        mock_service_client.get_directory_client.return_value.delete_directory.assert_awaited_once_with()
+        mock_file_client.delete_file.assert_not_awaited()
+    else:
+        mock_file_client.delete_file.assert_awaited_once_with()
+        mock_service_client.get_directory_client.assert_not_called()
+
+
+def test_missing_aiohttp():
+    with patch.dict("sys.modules", {"aiohttp": None}):
+        with pytest.raises(ImportError, match="aiohttp"):
+            run(azure_storage_to_io_async("test-container", "path/to/file.bin", secret))
@@ -1,6 +1,7 @@
 import google_crc32c
 import pytest
 from unittest.mock import patch, MagicMock
+from do_data_utils.azure.storage import clear_service_client_cache
 
 
 @pytest.fixture
@@ -173,3 +174,10 @@ def mock_azure_oauth_service_principal():
         mock_credentials = MagicMock()
         mock_service_principal.return_value = mock_credentials
         yield mock_credentials
+
+
+@pytest.fixture(autouse=True)
+def clear_azure_storage_clients():
+    clear_service_client_cache()
+    yield
+    clear_service_client_cache()
@@ -0,0 +1,45 @@
+import pytest
+from do_data_utils.preprocessing import (
+    PhoneExclusionIndex,
+    clean_citizenid,
+    clean_email,
+    clean_many,
+    clean_phone,
+)
+
+
+PHONES = ["090-123-4567|0912345678", "0901234567-9", "", None, "abc", "0899999999"] * 5
+EMAILS = ["anuponwa@scg.com|xxx@xy", "anuponwa", None] * 5
+CITIZENIDS = ["1234567890121", "1234567890122", "1-2345-67890-12-1"] * 5
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_clean_many_phone(workers):
+    expected = [clean_phone(p) for p in PHONES]
+    assert list(clean_many(PHONES, kind="phone", workers=workers, chunksize=4)) == expected
+
+
+def test_clean_many_kwargs():
+    exclude = PhoneExclusionIndex(prefixes=["090"])
+    expected = [clean_phone(p, exclude_numbers=exclude) for p in PHONES]
+    result = clean_many(
+        iter(PHONES), kind="phone", workers=2, chunksize=3, exclude_numbers=exclude
+    )
+    assert list(result) == expected
+
+
+def test_clean_many_email_and_citizenid():
+    assert list(
+        clean_many(EMAILS, kind="email", workers=2, chunksize=2, delimiter="|")
+    ) == [clean_email(e, delimiter="|") for e in EMAILS]
+    assert list(clean_many(CITIZENIDS, kind="citizenid", workers=2, chunksize=5)) == [
+        clean_citizenid(i) for i in CITIZENIDS
+    ]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"kind": "address"}, {"workers": 0}, {"chunksize": 0}]
+)
+def test_clean_many_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        _ = clean_many(PHONES, **kwargs)
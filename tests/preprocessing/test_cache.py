@@ -0,0 +1,27 @@
+import pytest
+from do_data_utils.preprocessing import cached_cleaner, clean_email, clean_phone
+
+
+def test_cached_cleaner_counts_hits_and_misses():
+    clean = cached_cleaner("phone", maxsize=10, exclude_numbers=[])
+    phones = ["0812345678", "+66 81 234 5678", "0812345678", "abc", "0812345678"]
+    assert [clean(p) for p in phones] == [clean_phone(p, exclude_numbers=[]) for p in phones]
+
+    info = clean.cache_info()
+    assert info.hits == 2
+    assert info.misses == 3
+    assert info.currsize == 3
+
+
+def test_cached_cleaner_is_bounded():
+    clean = cached_cleaner("email", maxsize=2, delimiter="|")
+    for email in ["a@b.co", "c@d.co", "e@f.co", "a@b.co"]:
+        assert clean(email) == clean_email(email, delimiter="|")
+    assert clean.cache_info().currsize == 2
+    assert clean.cache_info().hits == 0
+
+
+@pytest.mark.parametrize("kind, maxsize", [("fax", 10), ("phone", 0)])
+def test_cached_cleaner_invalid_args(kind, maxsize):
+    with pytest.raises(ValueError):
+        _ = cached_cleaner(kind, maxsize=maxsize)
@@ -1,5 +1,11 @@
 import random
-from do_data_utils.preprocessing import clean_citizenid
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+from do_data_utils.preprocessing import clean_citizenid, validate_citizen_ids
+from do_data_utils.preprocessing.citizenid import get_checksum
 
 
 # ----------------
@@ -42,3 +48,22 @@ def test_valid_citizen_id_format():
     for r in rand_position:
         valid_id = valid_id[:r] + "-" + valid_id[r:]
     assert clean_citizenid(valid_id) is not None
+
+
+def test_get_checksum():
+    # 1*13 + 2*12 + 3*11 + 4*10 + 5*9 + 6*8 + 7*7 + 8*6 + 9*5 + 0*4 + 1*3 + 2*2 = 352
+    # 352 % 11 = 0, so the checksum is 1 - 0 = 1
+    assert get_checksum("1234567890121") == 1
+
+
+@pytest.mark.parametrize("container", [list, np.array, pd.Series, pl.Series])
+def test_validate_citizen_ids(container):
+    valid_id = generate_valid_citizen_id()
+    invalid_id = generate_invalid_citizen_id()
+    ids = [valid_id, invalid_id, valid_id[:6] + " - " + valid_id[6:], "123"]
+
+    mask, cleaned = validate_citizen_ids(container(ids))
+
+    assert mask.tolist() == [True, False, True, False]
+    assert list(cleaned) == [valid_id, None, valid_id, None]
+    assert mask.tolist() == [clean_citizenid(i) is not None for i in ids]
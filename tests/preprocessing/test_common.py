@@ -0,0 +1,15 @@
+import re
+
+from do_data_utils.preprocessing.common import compile_regexp, search_regexp
+
+
+def test_compile_regexp_reuses_pattern():
+    pattern = compile_regexp(r"\d{3}")
+    assert isinstance(pattern, re.Pattern)
+    assert compile_regexp(r"\d{3}") is pattern
+
+
+def test_search_regexp_with_string_and_compiled_pattern():
+    assert search_regexp(r"\d{3}", "ab1234") == "123"
+    assert search_regexp(compile_regexp(r"(\d)(\d)"), "ab1234", group=2) == "2"
+    assert search_regexp(r"\d{3}", "ab12") is None
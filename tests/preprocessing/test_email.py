@@ -26,3 +26,20 @@ def test_empty_email():
 )
 def test_multiple_emails(input, expected):
     assert clean_email(input, delimiter="|") == expected
+
+
+@pytest.mark.parametrize(
+    "input, delimiter, expected",
+    [
+        ("anuponwa@scg.com", None, ["anuponwa@scg.com"]),
+        ("anuponwa", None, None),
+        (
+            "anuponwa@scg.com|xxx@xy|someone@domain.com",
+            "|",
+            ["anuponwa@scg.com", "someone@domain.com"],
+        ),
+        ("xxx@xy|", "|", None),
+    ],
+)
+def test_emails_as_list(input, delimiter, expected):
+    assert clean_email(input, delimiter=delimiter, as_list=True) == expected
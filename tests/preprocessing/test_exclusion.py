@@ -0,0 +1,64 @@
+import polars as pl
+import pytest
+from do_data_utils.preprocessing import (
+    PhoneExclusionIndex,
+    clean_phone,
+    clean_phone_series,
+    exclude_phone_number_list,
+    exclude_phone_number_set,
+)
+
+
+PHONES = "0812345678|0899999999|0200123456|0891234567"
+
+
+def test_default_exclusion_set():
+    assert exclude_phone_number_set == frozenset(exclude_phone_number_list)
+    assert clean_phone("0899999999") is None
+
+
+def test_exclusion_index_lookup():
+    index = PhoneExclusionIndex(numbers=["0812345678"], prefixes=["0200", "08912"])
+    assert "0812345678" in index
+    assert "0200123456" in index
+    assert "0891234567" in index
+    assert "0891111111" not in index
+    assert len(index) == 3
+
+
+@pytest.mark.parametrize(
+    "exclude_numbers, expected",
+    [
+        ({"0812345678"}, "0899999999|0200123456|0891234567"),
+        (frozenset(), PHONES),
+        (
+            PhoneExclusionIndex(numbers=["0812345678"], prefixes=["0200"]),
+            "0899999999|0891234567",
+        ),
+    ],
+)
+def test_clean_phone_with_exclusions(exclude_numbers, expected):
+    assert clean_phone(PHONES, exclude_numbers=exclude_numbers) == expected
+    result = clean_phone_series(pl.Series([PHONES]), exclude_numbers=exclude_numbers)
+    assert result.to_list() == [expected]
+
+
+def test_exclusion_index_from_file(tmp_path):
+    file_path = tmp_path / "blacklist.txt"
+    file_path.write_text("# blacklist\n0812345678\n\n0200*\n")
+
+    index = PhoneExclusionIndex.from_file(str(file_path), prefixes=["089"])
+
+    assert index.numbers == frozenset({"0812345678"})
+    assert index.prefixes == frozenset({"0200", "089"})
+    assert clean_phone(PHONES, exclude_numbers=index) is None
+
+
+def test_exclusion_index_from_parquet(tmp_path):
+    file_path = tmp_path / "blacklist.parquet"
+    pl.DataFrame({"phone": ["0812345678", None, "0899999999"]}).write_parquet(file_path)
+
+    index = PhoneExclusionIndex.from_parquet(str(file_path), column="phone")
+
+    assert index.numbers == frozenset({"0812345678", "0899999999"})
+    assert clean_phone(PHONES, exclude_numbers=index) == "0200123456|0891234567"
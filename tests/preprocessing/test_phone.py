@@ -1,5 +1,9 @@
 import pytest
-from do_data_utils.preprocessing import clean_phone
+from do_data_utils.preprocessing import (
+    clean_phone,
+    get_phone_range_failures,
+    reset_phone_range_failures,
+)
 
 
 def test_valid_phone():
@@ -32,3 +36,45 @@ def test_none_phones(input, expected):
 def test_invalid_exclude_phones():
     with pytest.raises(ValueError):
         _ = clean_phone("0123141", exclude_numbers="0123141")
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        ("+66 81 234 5678", "0812345678"),
+        ("(02) 123 4567|+6621234567", "021234567|021234567"),
+        ("0812345678, 0898765432", "0812345678"),
+    ],
+)
+def test_phone_prefix_and_strip(input, expected):
+    assert clean_phone(input, exclude_numbers=[]) == expected
+
+
+@pytest.mark.parametrize(
+    "input, n_expected, reason",
+    [
+        ("0812345678-9", 2, None),
+        ("08123456-00-99", 100, None),
+        ("0812345678-1-", 1, "invalid"),
+        ("08123456-9-99", 1, "invalid"),
+        ("0901234567-5", 1, "reversed"),
+        ("08123456-50-10", 1, "reversed"),
+    ],
+)
+def test_phone_range_failures(input, n_expected, reason):
+    reset_phone_range_failures()
+    result = clean_phone(input, exclude_numbers=[])
+    assert len(result.split("|")) == n_expected
+    assert get_phone_range_failures() == ({reason: 1} if reason else {})
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        ("090-123-4567|0912345678", ["0901234567", "0912345678"]),
+        ("0901234567-8", ["0901234567", "0901234568"]),
+        ("abc|000", None),
+    ],
+)
+def test_phones_as_list(input, expected):
+    assert clean_phone(input, exclude_numbers=[], as_list=True) == expected
@@ -0,0 +1,114 @@
+import polars as pl
+import pytest
+from do_data_utils.preprocessing import (
+    clean_citizenid,
+    clean_email,
+    clean_file,
+    clean_phone,
+)
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def make_df(n=25):
+    return pl.DataFrame(
+        {
+            "customer": list(range(n)),
+            "phone": ["090-123-4567|0812345678", "+66 81 234 5678", "abc", None, "0901234505-09"] * (n // 5),
+            "email": ["Anuponwa@SCG.com", "not an email", None, "a@b.co", " x@y.com "] * (n // 5),
+            "id_card": ["1-2345-67890-12-1", "1234567890121", "123", None, "0000000000000"] * (n // 5),
+        }
+    )
+
+
+# ----------------
+# Test functions
+# ----------------
+
+
+@pytest.mark.parametrize("src_ext", ["csv", "parquet"])
+@pytest.mark.parametrize("dest_ext", ["csv", "parquet"])
+def test_clean_file(tmp_path, src_ext, dest_ext):
+    df = make_df()
+    src = str(tmp_path / f"src.{src_ext}")
+    dest = str(tmp_path / f"dest.{dest_ext}")
+    if src_ext == "csv":
+        df.write_csv(src)
+    else:
+        df.write_parquet(src)
+
+    clean_file(
+        src,
+        dest,
+        columns={"phone": "phone", "email": "email", "id_card": "citizenid"},
+        batch_size=7,
+    )
+
+    if dest_ext == "csv":
+        result = pl.read_csv(dest, schema_overrides={c: pl.String for c in ["phone", "email", "id_card"]})
+    else:
+        result = pl.read_parquet(dest)
+
+    assert result["customer"].to_list() == df["customer"].to_list()
+    assert result["phone"].to_list() == [clean_phone(p) if p is not None else None for p in df["phone"]]
+    assert result["email"].to_list() == [clean_email(e) if e is not None else None for e in df["email"]]
+    assert result["id_card"].to_list() == [clean_citizenid(i) if i is not None else None for i in df["id_card"]]
+
+
+def test_clean_file_cleaner_kwargs(tmp_path):
+    src = str(tmp_path / "src.parquet")
+    dest = str(tmp_path / "dest.parquet")
+    pl.DataFrame({"phone": ["0812345678,0898765432"]}).write_parquet(src)
+
+    clean_file(
+        src,
+        dest,
+        columns={"phone": "phone"},
+        cleaner_kwargs={"phone": {"exclude_numbers": [], "delimiter": ","}},
+    )
+    assert pl.read_parquet(dest)["phone"].to_list() == ["0812345678,0898765432"]
+
+
+@pytest.mark.parametrize("src_ext", ["csv", "parquet"])
+@pytest.mark.parametrize("dest_ext", ["csv", "parquet"])
+def test_clean_file_empty(tmp_path, src_ext, dest_ext):
+    df = make_df(0)
+    src = str(tmp_path / f"src.{src_ext}")
+    dest = str(tmp_path / f"dest.{dest_ext}")
+    if src_ext == "csv":
+        df.write_csv(src)
+    else:
+        df.write_parquet(src)
+
+    clean_file(src, dest, columns={"phone": "phone", "email": "email", "id_card": "citizenid"})
+
+    result = pl.read_csv(dest) if dest_ext == "csv" else pl.read_parquet(dest)
+    assert result.height == 0
+    assert result.columns == df.columns
+
+
+@pytest.mark.parametrize(
+    "columns, dest, batch_size",
+    [
+        ({"phone": "fax"}, "dest.parquet", 10),
+        ({"phone": "phone"}, "dest.xlsx", 10),
+        ({"phone": "phone"}, "dest.parquet", 0),
+    ],
+)
+def test_clean_file_invalid_args(tmp_path, columns, dest, batch_size):
+    src = str(tmp_path / "src.parquet")
+    pl.DataFrame({"phone": ["0812345678"]}).write_parquet(src)
+    with pytest.raises(ValueError):
+        clean_file(src, str(tmp_path / dest), columns=columns, batch_size=batch_size)
+
+
+def test_clean_file_as_list(tmp_path):
+    src = str(tmp_path / "src.parquet")
+    pl.DataFrame({"phone": ["0812345678"]}).write_parquet(src)
+    with pytest.raises(ValueError, match="as_list"):
+        clean_file(
+            src, str(tmp_path / "dest.csv"), columns={"phone": "phone"}, cleaner_kwargs={"phone": {"as_list": True}}
+        )
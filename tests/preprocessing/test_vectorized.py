@@ -0,0 +1,161 @@
+import random
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+from do_data_utils.preprocessing import (
+    clean_citizenid,
+    clean_citizenid_series,
+    clean_email,
+    clean_email_series,
+    clean_phone,
+    clean_phone_series,
+)
+
+
+# ----------------
+# Helper functions
+# ----------------
+
+
+def generate_dirty_strings(alphabet, n, max_len, seed=0):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len)))
+        for _ in range(n)
+    ]
+
+
+PHONES = [
+    "090-123-4567|0912345678|0901234567-9",
+    "090-123-4567|0912345678|0901234567-71",
+    "+66 81 234 5678",
+    "(02) 123 4567|0812345678",
+    "0901234505-09",
+    "0000000000|0812345678",
+    "abc",
+    "",
+    None,
+]
+
+
+# ----------------
+# Test functions
+# ----------------
+
+
+def test_phone_series_polars():
+    expected = [clean_phone(p) if p is not None else None for p in PHONES]
+    result = clean_phone_series(pl.Series("phone", PHONES))
+    assert result.name == "phone"
+    assert result.to_list() == expected
+
+
+def test_phone_series_pandas():
+    phones = pd.Series(PHONES, index=range(10, 10 + len(PHONES)), name="phone")
+    expected = phones.apply(lambda p: clean_phone(p) if p is not None else None)
+    result = clean_phone_series(phones)
+    assert result.name == "phone"
+    assert list(result.index) == list(phones.index)
+    assert result.tolist() == expected.tolist()
+
+
+def test_phone_series_expr():
+    df = pl.DataFrame({"phone": PHONES})
+    result = df.select(clean_phone_series(pl.col("phone"), exclude_numbers=[]))
+    expected = [
+        clean_phone(p, exclude_numbers=[]) if p is not None else None for p in PHONES
+    ]
+    assert result["phone"].to_list() == expected
+
+
+def test_phone_series_matches_scalar_on_dirty_input():
+    alphabet = list("0123456789") * 4 + list("-- ()+|,a6") + ["66", "000"]
+    phones = generate_dirty_strings(alphabet, n=5000, max_len=30)
+    expected = [clean_phone(p) for p in phones]
+    assert clean_phone_series(pl.Series(phones)).to_list() == expected
+
+
+def test_phone_series_invalid_exclude_phones():
+    with pytest.raises(ValueError):
+        _ = clean_phone_series(pl.Series(["0123141"]), exclude_numbers="0123141")
+
+
+@pytest.mark.parametrize("delimiter", [None, "|"])
+def test_email_series_matches_scalar(delimiter):
+    alphabet = list("abc.@-_|") + ["@x.com", ".co", "@", "AB"]
+    emails = generate_dirty_strings(alphabet, n=2000, max_len=12)
+    expected = [clean_email(e, delimiter=delimiter) for e in emails]
+    result = clean_email_series(pd.Series(emails), delimiter=delimiter)
+    assert result.tolist() == expected
+
+
+def test_citizenid_series_matches_scalar():
+    alphabet = list("0123456789" * 5) + [" ", "-", "x"]
+    ids = generate_dirty_strings(alphabet, n=5000, max_len=16)
+    expected = [clean_citizenid(i) for i in ids]
+    assert clean_citizenid_series(pl.Series(ids)).to_list() == expected
+
+
+def test_series_invalid_type():
+    with pytest.raises(TypeError):
+        _ = clean_email_series(["anuponwa@scg.com"])
+
+
+@pytest.mark.parametrize(
+    "cleaner, scalar_cleaner",
+    [
+        (clean_phone_series, clean_phone),
+        (clean_email_series, clean_email),
+        (clean_citizenid_series, clean_citizenid),
+    ],
+)
+def test_series_unique(cleaner, scalar_cleaner):
+    values = (PHONES + ["a@b.co", "1-2345-67890-12-1"]) * 3
+    expected = [scalar_cleaner(v) if v is not None else None for v in values]
+
+    assert cleaner(pl.Series(values), unique=True).to_list() == expected
+    assert cleaner(pl.Series(values, dtype=pl.Categorical)).to_list() == expected
+    assert cleaner(pd.Series(values, dtype="category")).tolist() == expected
+
+    result = pl.DataFrame({"v": values}).select(cleaner(pl.col("v"), unique=True))
+    assert result["v"].to_list() == expected
+
+
+def test_phone_series_dictionary_array():
+    values = pa.array(PHONES * 2).dictionary_encode()
+    result = clean_phone_series(values)
+    assert isinstance(result, pa.DictionaryArray)
+    assert result.indices == values.indices
+    assert len(result.dictionary) == len(values.dictionary)
+    assert result.to_pylist() == [clean_phone(p) if p is not None else None for p in PHONES * 2]
+
+    chunked = clean_phone_series(pa.chunked_array([values, values]))
+    assert chunked.to_pylist() == result.to_pylist() * 2
+
+
+@pytest.mark.parametrize(
+    "cleaner, scalar_cleaner, values, kwargs",
+    [
+        (clean_phone_series, clean_phone, PHONES, {}),
+        (clean_email_series, clean_email, ["a@b.co|x|c@d.co", "x|", None, "e@f.co"], {"delimiter": "|"}),
+        (clean_email_series, clean_email, ["a@b.co", "x", None], {}),
+    ],
+)
+def test_series_as_list(cleaner, scalar_cleaner, values, kwargs):
+    expected = [
+        scalar_cleaner(v, as_list=True, **kwargs) if v is not None else None
+        for v in values
+    ]
+
+    result = cleaner(pl.Series(values), as_list=True, **kwargs)
+    assert result.dtype == pl.List(pl.String)
+    assert result.to_list() == expected
+
+    assert cleaner(pl.Series(values), as_list=True, unique=True, **kwargs).to_list() == expected
+    assert cleaner(pd.Series(values), as_list=True, **kwargs).tolist() == expected
+    assert cleaner(pa.array(values).dictionary_encode(), as_list=True, **kwargs).to_pylist() == expected
+
+    df = pl.DataFrame({"v": values}, schema={"v": pl.String})
+    assert df.select(cleaner(pl.col("v"), as_list=True, **kwargs))["v"].to_list() == expected